@@ -0,0 +1,105 @@
+"""Per-user iCalendar feed: signed URLs, a cheap version stamp and rendering."""
+import hashlib
+import time
+from datetime import timedelta, timezone as dt_timezone
+from django.core import signing
+from django.core.cache import cache
+from django.utils import timezone
+
+VERSION_KEY = 'agenda:feed:version'
+SIGNING_SALT = 'agenda.feed'
+
+# Window published to calendar apps, relative to today
+FEED_PAST_DAYS = 30
+FEED_FUTURE_DAYS = 180
+
+PRODID = '-//Potencialize//Agenda//PT-BR'
+
+
+def feed_token(user_id):
+    return signing.Signer(salt=SIGNING_SALT).sign(str(user_id))
+
+
+def user_for_token(token):
+    """User id encoded in ``token``, or None if the signature does not match."""
+    try:
+        return int(signing.Signer(salt=SIGNING_SALT).unsign(token))
+    except (signing.BadSignature, ValueError):
+        return None
+
+
+def feed_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, time.time_ns(), None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def bump_feed_version(**kwargs):
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, time.time_ns(), None)
+
+
+def feed_window():
+    today = timezone.localdate()
+    return today - timedelta(days=FEED_PAST_DAYS), today + timedelta(days=FEED_FUTURE_DAYS)
+
+
+def feed_etag(user_id):
+    """Changes when any agenda source changes or the window moves to a new day."""
+    start, _ = feed_window()
+    raw = f'{user_id}|{feed_version()}|{start.isoformat()}'
+    return '"%s"' % hashlib.md5(raw.encode()).hexdigest()
+
+
+def _escape(text):
+    return (
+        text.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+        .replace('\r\n', '\\n').replace('\n', '\\n')
+    )
+
+
+def _fold(line):
+    """Split content lines longer than 75 octets (RFC 5545, 3.1)."""
+    data = line.encode()
+    if len(data) <= 75:
+        return line
+    parts, current = [], b''
+    for char in line:
+        encoded = char.encode()
+        if len(current) + len(encoded) > (75 if not parts else 74):
+            parts.append(current.decode())
+            current = b''
+        current += encoded
+    parts.append(current.decode())
+    return '\r\n '.join(parts)
+
+
+def _utc(value):
+    return value.astimezone(dt_timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+
+def render_calendar(events, name='Agenda Potencialize'):
+    stamp = _utc(timezone.now())
+    lines = [
+        'BEGIN:VCALENDAR', 'VERSION:2.0', f'PRODID:{PRODID}', 'CALSCALE:GREGORIAN',
+        f'X-WR-CALNAME:{_escape(name)}',
+    ]
+    for event in events:
+        lines += ['BEGIN:VEVENT', f'UID:{event["id"]}@potencialize', f'DTSTAMP:{stamp}']
+        if event['all_day']:
+            day = timezone.localtime(event['start']).date()
+            lines += [
+                f'DTSTART;VALUE=DATE:{day:%Y%m%d}',
+                f'DTEND;VALUE=DATE:{day + timedelta(days=1):%Y%m%d}',
+            ]
+        else:
+            lines.append(f'DTSTART:{_utc(event["start"])}')
+            if event['end']:
+                lines.append(f'DTEND:{_utc(event["end"])}')
+        lines += [f'SUMMARY:{_escape(event["title"])}', f'CATEGORIES:{event["source"].upper()}', 'END:VEVENT']
+    lines.append('END:VCALENDAR')
+    return '\r\n'.join(_fold(line) for line in lines) + '\r\n'
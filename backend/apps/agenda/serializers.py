@@ -0,0 +1,30 @@
+from datetime import timedelta
+from rest_framework import serializers
+
+MAX_RANGE_DAYS = 366
+
+
+class AgendaQuerySerializer(serializers.Serializer):
+    start = serializers.DateField()
+    end = serializers.DateField()
+    user = serializers.IntegerField(required=False)
+
+    def validate(self, attrs):
+        if attrs['end'] < attrs['start']:
+            raise serializers.ValidationError({'end': 'A data final deve ser posterior à inicial.'})
+        if attrs['end'] - attrs['start'] > timedelta(days=MAX_RANGE_DAYS):
+            raise serializers.ValidationError({'end': f'Intervalo máximo de {MAX_RANGE_DAYS} dias.'})
+        return attrs
+
+
+class AgendaEventSerializer(serializers.Serializer):
+    id = serializers.CharField()
+    source = serializers.CharField()
+    object_id = serializers.IntegerField()
+    title = serializers.CharField()
+    start = serializers.DateTimeField()
+    end = serializers.DateTimeField(allow_null=True)
+    all_day = serializers.BooleanField()
+    status = serializers.CharField()
+    user = serializers.IntegerField(allow_null=True)
+    project = serializers.IntegerField(allow_null=True)
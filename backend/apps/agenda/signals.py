@@ -0,0 +1,12 @@
+from django.db.models.signals import post_save, post_delete
+from apps.core.bulk import post_bulk_save
+from apps.crm.models import Activity
+from apps.onboarding.models import OnboardingTask
+from apps.projects.models import Project, ProjectMeeting
+from apps.tasks.models import Task
+from .feed import bump_feed_version
+
+# Project is here because meeting ownership comes from its manager/specialist
+for model in (Activity, ProjectMeeting, Task, OnboardingTask, Project):
+    for signal in (post_save, post_delete, post_bulk_save):
+        signal.connect(bump_feed_version, sender=model, dispatch_uid=f'agenda-feed-{model._meta.label}')
@@ -0,0 +1,93 @@
+"""
+Date-range readers for everything that shows up on the agenda.
+
+Each source runs one query over its date column (indexed) and yields events
+already sorted by start, so ``agenda_events`` can merge them without sorting
+the whole range again.
+"""
+import heapq
+from datetime import datetime, time, timedelta
+from django.db.models import Q
+from django.utils import timezone
+from apps.crm.models import Activity
+from apps.onboarding.models import OnboardingTask
+from apps.projects.models import ProjectMeeting
+from apps.tasks.models import Task
+
+
+def day_start(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def _event(source, pk, title, start, end=None, all_day=False, status='', user=None, project=None):
+    return {
+        'id': f'{source}-{pk}',
+        'source': source,
+        'object_id': pk,
+        'title': title,
+        'start': start,
+        'end': end,
+        'all_day': all_day,
+        'status': status,
+        'user': user,
+        'project': project,
+    }
+
+
+def activities(start, end, user=None):
+    rows = Activity.objects.filter(date__gte=day_start(start), date__lt=day_start(end + timedelta(days=1)))
+    if user:
+        rows = rows.filter(user_id=user)
+    for row in rows.order_by('date', 'id').values('id', 'title', 'date', 'duration_minutes', 'status', 'user_id'):
+        yield _event(
+            'activity', row['id'], row['title'], row['date'],
+            end=row['date'] + timedelta(minutes=row['duration_minutes']),
+            status=row['status'], user=row['user_id'],
+        )
+
+
+def meetings(start, end, user=None):
+    rows = ProjectMeeting.objects.filter(date__gte=day_start(start), date__lt=day_start(end + timedelta(days=1)))
+    if user:
+        rows = rows.filter(Q(project__manager_id=user) | Q(project__specialist_id=user))
+    for row in rows.order_by('date', 'id').values('id', 'title', 'date', 'duration_minutes', 'project_id'):
+        yield _event(
+            'meeting', row['id'], row['title'], row['date'],
+            end=row['date'] + timedelta(minutes=row['duration_minutes']),
+            project=row['project_id'],
+        )
+
+
+def tasks(start, end, user=None):
+    rows = Task.objects.filter(due_date__gte=start, due_date__lte=end)
+    if user:
+        rows = rows.filter(assigned_to_id=user)
+    fields = ('id', 'title', 'due_date', 'status', 'assigned_to_id', 'project_id')
+    for row in rows.order_by('due_date', 'id').values(*fields):
+        yield _event(
+            'task', row['id'], row['title'], day_start(row['due_date']), all_day=True,
+            status=row['status'], user=row['assigned_to_id'], project=row['project_id'],
+        )
+
+
+def onboarding_tasks(start, end, user=None):
+    rows = OnboardingTask.objects.filter(due_date__gte=start, due_date__lte=end)
+    if user:
+        rows = rows.filter(assigned_to_id=user)
+    fields = ('id', 'title', 'due_date', 'completed', 'assigned_to_id')
+    for row in rows.order_by('due_date', 'id').values(*fields):
+        yield _event(
+            'onboarding_task', row['id'], row['title'], day_start(row['due_date']), all_day=True,
+            status='completed' if row['completed'] else 'pending', user=row['assigned_to_id'],
+        )
+
+
+SOURCES = (activities, meetings, tasks, onboarding_tasks)
+
+
+def agenda_events(start, end, user=None):
+    """Every event between ``start`` and ``end`` (dates, inclusive), by start time."""
+    return heapq.merge(
+        *(source(start, end, user) for source in SOURCES),
+        key=lambda event: (event['start'], event['source'], event['object_id']),
+    )
@@ -0,0 +1,41 @@
+from datetime import datetime, timezone
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from apps.core.models import Role, SystemPermission
+from apps.core.testing import TEST_CACHES, make_user
+from apps.crm.models import Activity
+
+URL = '/api/agenda/?start=2025-01-01&end=2025-12-31'
+
+
+@override_settings(CACHES=TEST_CACHES)
+class AgendaAccessTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user, self.other = make_user(), make_user()
+        for owner in (self.user, self.other):
+            Activity.objects.create(
+                activity_type='Ligação', title='Retorno', date=datetime(2025, 3, 1, 10, tzinfo=timezone.utc), user=owner,
+            )
+
+    def owners(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return sorted(event['user'] for event in response.data)
+
+    def test_own_agenda_by_default(self):
+        self.client.force_authenticate(self.user)
+        self.assertEqual(self.owners(URL), [self.user.pk])
+        self.assertEqual(self.owners(f'{URL}&user={self.user.pk}'), [self.user.pk])
+
+    def test_other_users_agenda_is_forbidden(self):
+        self.client.force_authenticate(self.user)
+        self.assertEqual(self.client.get(f'{URL}&user={self.other.pk}').status_code, 403)
+
+    def test_manager_sees_team_and_any_user(self):
+        role = Role.objects.create(id='manager', name='Gestor')
+        role.permissions.add(SystemPermission.objects.create(key='manage_users', label='Gerenciar', module='Admin'))
+        self.client.force_authenticate(make_user(role=role))
+        self.assertEqual(self.owners(URL), sorted([self.user.pk, self.other.pk]))
+        self.assertEqual(self.owners(f'{URL}&user={self.other.pk}'), [self.other.pk])
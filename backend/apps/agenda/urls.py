@@ -0,0 +1,8 @@
+from django.urls import path
+from .views import AgendaView, AgendaFeedUrlView, agenda_feed
+
+urlpatterns = [
+    path('', AgendaView.as_view(), name='agenda'),
+    path('feed-url/', AgendaFeedUrlView.as_view(), name='agenda-feed-url'),
+    path('feed/<str:token>.ics', agenda_feed, name='agenda-feed'),
+]
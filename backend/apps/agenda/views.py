@@ -0,0 +1,66 @@
+from django.http import HttpResponse, Http404
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from rest_framework import permissions
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from apps.core.permissions_cache import user_has_permission
+from .feed import feed_token, user_for_token, feed_etag, feed_window, render_calendar
+from .serializers import AgendaQuerySerializer, AgendaEventSerializer
+from .sources import agenda_events
+
+
+# Permission that lets a role see other people's agendas
+MANAGE_PERMISSION = 'manage_users'
+
+
+class AgendaView(APIView):
+    """
+    Activities, meetings and due dates between ``start`` and ``end``.
+
+    Everyone sees their own agenda; managers see the whole team's, or one
+    person's with ``user``.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        query = AgendaQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        user = query.validated_data.get('user')
+        if not user_has_permission(request.user, MANAGE_PERMISSION):
+            if user not in (None, request.user.pk):
+                raise PermissionDenied('Sem permissão para ver a agenda de outro usuário.')
+            user = request.user.pk
+        events = agenda_events(query.validated_data['start'], query.validated_data['end'], user)
+        return Response(AgendaEventSerializer(events, many=True).data)
+
+
+class AgendaFeedUrlView(APIView):
+    """Private .ics address for the current user, to paste into a calendar app."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        path = reverse('agenda-feed', kwargs={'token': feed_token(request.user.pk)})
+        return Response({'url': request.build_absolute_uri(path)})
+
+
+def agenda_feed(request, token):
+    """iCalendar feed authenticated by the signed token in the URL.
+
+    The ETag only depends on a shared version stamp, so an unchanged
+    calendar is answered with 304 without touching the agenda tables.
+    """
+    user_id = user_for_token(token)
+    if user_id is None:
+        raise Http404
+    etag = feed_etag(user_id)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        start, end = feed_window()
+        response = HttpResponse(
+            render_calendar(agenda_events(start, end, user_id)), content_type='text/calendar; charset=utf-8'
+        )
+    response['ETag'] = etag
+    response['Cache-Control'] = 'private, no-cache'
+    return response
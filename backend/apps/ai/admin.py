@@ -0,0 +1,9 @@
+from django.contrib import admin
+from .models import CompanyResearch
+
+class CompanyResearchAdmin(admin.ModelAdmin):
+    list_display = ('company_name', 'prompt_version', 'hits', 'last_used_at', 'expires_at')
+    search_fields = ('company_name', 'normalized_name')
+    readonly_fields = ('normalized_name', 'prompt_version', 'created_at', 'last_used_at', 'hits')
+
+admin.site.register(CompanyResearch, CompanyResearchAdmin)
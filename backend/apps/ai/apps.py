@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class AiConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.ai'
+    verbose_name = 'AI gateway'
@@ -0,0 +1,124 @@
+"""
+Streaming Gemini client on asyncio streams (stdlib only).
+
+Calls ``models/<model>:streamGenerateContent?alt=sse`` and yields each
+server-sent event as a dict, so tokens reach the browser as the model
+produces them without holding a thread per request. The base URL comes from
+settings so it can point at the fake server in ``fake_server.py``.
+"""
+import asyncio
+import codecs
+import json
+import ssl
+from urllib.parse import quote, urlsplit
+from django.conf import settings
+
+REQUEST_TIMEOUT = 120
+READ_SIZE = 64 * 1024
+
+
+class AIError(Exception):
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+def configured():
+    return bool(settings.GEMINI_API_KEY)
+
+
+async def _open(url, body, headers, timeout):
+    """Send a POST and return (status, headers, reader, writer) once the head arrives."""
+    parts = urlsplit(url)
+    secure = parts.scheme == 'https'
+    connect = asyncio.open_connection(
+        parts.hostname, parts.port or (443 if secure else 80), ssl=ssl.create_default_context() if secure else None,
+    )
+    try:
+        reader, writer = await asyncio.wait_for(connect, timeout)
+    except (OSError, asyncio.TimeoutError) as error:
+        raise AIError(f'Falha de rede: {error or "timeout"}') from error
+    target = parts.path + (f'?{parts.query}' if parts.query else '')
+    head = [f'POST {target} HTTP/1.1', f'Host: {parts.netloc}', 'Connection: close', f'Content-Length: {len(body)}']
+    head += [f'{name}: {value}' for name, value in headers.items()]
+    writer.write(('\r\n'.join(head) + '\r\n\r\n').encode() + body)
+    try:
+        await writer.drain()
+        status_line = await asyncio.wait_for(reader.readline(), timeout)
+        response_headers = {}
+        while True:
+            line = await asyncio.wait_for(reader.readline(), timeout)
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            response_headers[name.strip().lower()] = value.strip()
+        status = int(status_line.split()[1])
+    except (OSError, asyncio.TimeoutError, IndexError, ValueError) as error:
+        writer.close()
+        raise AIError(f'Falha de rede: {error or "timeout"}') from error
+    return status, response_headers, reader, writer
+
+
+async def _body(reader, headers, timeout):
+    """Yield the raw body in pieces, handling chunked transfer encoding."""
+    read = lambda coro: asyncio.wait_for(coro, timeout)  # noqa: E731
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        while True:
+            size = int((await read(reader.readline())).split(b';')[0].strip() or b'0', 16)
+            if size == 0:
+                return
+            yield await read(reader.readexactly(size))
+            await read(reader.readline())
+    elif 'content-length' in headers:
+        yield await read(reader.readexactly(int(headers['content-length'])))
+    else:
+        while chunk := await read(reader.read(READ_SIZE)):
+            yield chunk
+
+
+async def _events(chunks):
+    """Parse server-sent events (``data:`` lines) into JSON objects."""
+    # Transport chunks can split a multi-byte character; the decoder keeps the partial bytes
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        buffer = buffer.replace('\r\n', '\n')
+        while '\n\n' in buffer:
+            event, buffer = buffer.split('\n\n', 1)
+            data = '\n'.join(line[5:].lstrip() for line in event.split('\n') if line.startswith('data:'))
+            if data:
+                yield json.loads(data)
+
+
+async def stream_generate(model, payload, timeout=None):
+    """Yield Gemini's GenerateContentResponse chunks for ``payload``."""
+    timeout = timeout or getattr(settings, 'AI_REQUEST_TIMEOUT', REQUEST_TIMEOUT)
+    url = f'{settings.GEMINI_API_BASE_URL.rstrip("/")}/v1beta/models/{quote(model)}:streamGenerateContent?alt=sse'
+    headers = {'Content-Type': 'application/json', 'x-goog-api-key': settings.GEMINI_API_KEY}
+    status, response_headers, reader, writer = await _open(url, json.dumps(payload).encode(), headers, timeout)
+    try:
+        if status >= 400:
+            body = b''.join([chunk async for chunk in _body(reader, response_headers, timeout)])
+            try:
+                message = json.loads(body)['error']['message']
+            except (ValueError, KeyError, TypeError):
+                message = body[:200].decode(errors='replace')
+            raise AIError(f'HTTP {status}: {message}', status=status)
+        async for event in _events(_body(reader, response_headers, timeout)):
+            yield event
+    except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError) as error:
+        raise AIError(f'Falha de rede: {error or "timeout"}') from error
+    finally:
+        writer.close()
+
+
+def chunk_text(chunk):
+    candidates = chunk.get('candidates') or [{}]
+    parts = (candidates[0].get('content') or {}).get('parts') or []
+    return ''.join(part.get('text', '') for part in parts)
+
+
+def chunk_sources(chunk):
+    candidates = chunk.get('candidates') or [{}]
+    return (candidates[0].get('groundingMetadata') or {}).get('groundingChunks') or []
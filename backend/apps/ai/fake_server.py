@@ -0,0 +1,117 @@
+"""
+Local stand-in for Gemini's ``streamGenerateContent`` endpoint.
+
+Point ``GEMINI_API_BASE_URL`` at it (see ``manage.py run_fake_ai``) to run
+the gateway without a key or network:
+
+    fake = FakeGemini().start()
+    settings.GEMINI_API_BASE_URL = fake.base_url
+    fake.delay = 0.05              # seconds between streamed chunks
+    fake.fail_next(503)            # next request fails
+    len(fake.requests)             # upstream calls made so far
+
+Answers are built from the prompt, streamed a few words per SSE event with
+chunked transfer encoding like the real API; requests using the
+``googleSearch`` tool get a grounding source in the last event.
+"""
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+WORDS_PER_CHUNK = 3
+
+
+class FakeGemini:
+    def __init__(self, host='127.0.0.1', port=0):
+        self.lock = threading.Lock()
+        self.failures = []    # statuses to return for the next requests
+        self.requests = []    # (model, request body) log
+        self.delay = 0        # pause before each streamed chunk, in seconds
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def fail_next(self, status, times=1):
+        with self.lock:
+            self.failures.extend([status] * times)
+
+    def answer(self, model, body):
+        prompt = ' '.join(
+            part.get('text', '') for content in body.get('contents', []) for part in content.get('parts', [])
+        )
+        return f'Resposta simulada ({model}) para: {" ".join(prompt.split()[:40])}'
+
+    def chunks(self, model, body):
+        words = self.answer(model, body).split(' ')
+        pieces = [' '.join(words[i:i + WORDS_PER_CHUNK]) + ' ' for i in range(0, len(words), WORDS_PER_CHUNK)]
+        for index, text in enumerate(pieces):
+            candidate = {'content': {'role': 'model', 'parts': [{'text': text}]}}
+            if index == len(pieces) - 1:
+                candidate['finishReason'] = 'STOP'
+                if any('googleSearch' in tool for tool in body.get('tools', [])):
+                    candidate['groundingMetadata'] = {
+                        'groundingChunks': [{'web': {'uri': 'https://example.com/noticia', 'title': 'example.com'}}],
+                    }
+            yield {'candidates': [candidate], 'modelVersion': model}
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, data):
+                body = json.dumps(data).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('Connection', 'close')
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _write_chunk(self, data):
+                self.wfile.write(f'{len(data):x}\r\n'.encode() + data + b'\r\n')
+                self.wfile.flush()
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get('Content-Length') or 0)) or b'{}')
+                match = re.fullmatch(r'/v1beta/models/([^/:]+):streamGenerateContent', unquote(urlsplit(self.path).path))
+                if not match:
+                    return self._reply(404, {'error': {'code': 404, 'message': 'not found'}})
+                if not self.headers.get('x-goog-api-key'):
+                    return self._reply(403, {'error': {'code': 403, 'message': 'missing API key'}})
+                model = match.group(1)
+                with fake.lock:
+                    fake.requests.append((model, body))
+                    failure = fake.failures.pop(0) if fake.failures else None
+                if failure:
+                    return self._reply(failure, {'error': {'code': failure, 'message': 'fake failure'}})
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.send_header('Connection', 'close')
+                self.end_headers()
+                for chunk in fake.chunks(model, body):
+                    if fake.delay:
+                        time.sleep(fake.delay)
+                    self._write_chunk(f'data: {json.dumps(chunk, ensure_ascii=False)}\r\n\r\n'.encode())
+                self._write_chunk(b'')
+
+        return Handler
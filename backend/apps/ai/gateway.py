@@ -0,0 +1,219 @@
+"""
+Answer cache and request coalescing in front of the model.
+
+``stream(prompt, inputs)`` yields ``('chunk', {'text': ...})`` events and
+ends with one ``('done', {...})`` or ``('error', {...})``. Requests with the
+same prompt, version and subject (for research, the normalized company name)
+share one upstream call: the first starts a ``Flight`` task on the event
+loop and every request, the first included, follows its output, so a client
+that disconnects does not cancel the answer the others are waiting on.
+
+Research answers are stored in ``CompanyResearch`` for
+``AI_RESEARCH_CACHE_TTL_HOURS``; past ``AI_RESEARCH_CACHE_MAX_ENTRIES`` rows
+the least recently used are evicted by the ``ai.evict_research`` job, queued
+at most once an hour from ``store_research``. A lock in the shared cache extends
+coalescing across worker processes: a worker that finds the lock taken waits
+for the row the leader stores instead of calling the model again.
+"""
+import asyncio
+import hashlib
+import logging
+from datetime import timedelta
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from django.utils import timezone
+from apps.jobs.queue import enqueue
+from . import client
+from .models import CompanyResearch
+
+logger = logging.getLogger(__name__)
+
+POLL_SECONDS = 0.25
+# In-flight upstream calls of this process, by request key
+_flights = {}
+
+
+def research_ttl():
+    return timedelta(hours=getattr(settings, 'AI_RESEARCH_CACHE_TTL_HOURS', 24 * 7))
+
+
+def lock_timeout():
+    return getattr(settings, 'AI_REQUEST_TIMEOUT', client.REQUEST_TIMEOUT) + 10
+
+
+def request_key(prompt, subject):
+    digest = hashlib.sha1(subject.encode()).hexdigest()
+    return f'ai:{prompt.name}:v{prompt.version}:{digest}'
+
+
+class Flight:
+    """One upstream call whose output any number of requests can follow."""
+
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.chunks = []
+        self.sources = []
+        self.error = None
+        self.done = False
+        self.task = None
+        self._changed = asyncio.Event()
+
+    def _notify(self):
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def publish(self, text):
+        self.chunks.append(text)
+        self._notify()
+
+    def finish(self, error=None):
+        self.error, self.done = error, True
+        self._notify()
+
+    async def follow(self):
+        index = 0
+        while True:
+            while index < len(self.chunks):
+                yield 'chunk', {'text': self.chunks[index]}
+                index += 1
+            if self.done:
+                break
+            await self._changed.wait()
+        if self.error:
+            yield 'error', {'detail': self.error}
+        else:
+            yield 'done', {'cached': False, 'sources': self.sources}
+
+
+# Research cache
+
+async def cached_research(prompt, subject, since=None):
+    """The live row for ``subject`` (stored after ``since``, if given), counting the hit."""
+    now = timezone.now()
+    rows = CompanyResearch.objects.filter(normalized_name=subject, prompt_version=prompt.version, expires_at__gt=now)
+    if since:
+        rows = rows.filter(updated_at__gte=since)
+    row = await rows.afirst()
+    if row is not None:
+        await CompanyResearch.objects.filter(pk=row.pk).aupdate(hits=F('hits') + 1, last_used_at=now)
+    return row
+
+
+def evict(max_entries=None):
+    """Delete expired rows, then the least recently used ones beyond ``max_entries``."""
+    max_entries = max_entries or getattr(settings, 'AI_RESEARCH_CACHE_MAX_ENTRIES', 5000)
+    deleted, _ = CompanyResearch.objects.filter(expires_at__lte=timezone.now()).delete()
+    if CompanyResearch.objects.count() > max_entries:
+        stale = list(CompanyResearch.objects.order_by('-last_used_at').values_list('pk', flat=True)[max_entries:])
+        deleted += CompanyResearch.objects.filter(pk__in=stale).delete()[0]
+    return deleted
+
+
+def store_research(prompt, subject, company, text, sources):
+    now = timezone.now()
+    CompanyResearch.objects.update_or_create(
+        normalized_name=subject, prompt_version=prompt.version,
+        defaults={
+            'company_name': company[:255], 'text': text, 'sources': sources,
+            'expires_at': now + research_ttl(), 'last_used_at': now,
+        },
+    )
+    # One eviction pass per hour, whichever worker stores first
+    enqueue('ai.evict_research', idempotency_key=f'ai.evict_research:{now:%Y%m%d%H}')
+
+
+def _from_row(row):
+    return [('chunk', {'text': row.text}), ('done', {'cached': True, 'sources': row.sources})]
+
+
+# Upstream calls
+
+async def _run(flight, key, prompt, inputs, subject, lock_key):
+    error = 'Erro inesperado ao consultar a IA.'
+    try:
+        async for chunk in client.stream_generate(prompt.model, prompt.payload(inputs)):
+            text = client.chunk_text(chunk)
+            if text:
+                flight.publish(text)
+            flight.sources.extend(client.chunk_sources(chunk))
+        if prompt.cached and flight.chunks:
+            await sync_to_async(store_research)(prompt, subject, inputs['company'], ''.join(flight.chunks), flight.sources)
+        error = None
+    except client.AIError as exc:
+        logger.warning('AI %s failed: %s', prompt.name, exc)
+        error = 'Não foi possível obter a resposta da IA. Tente novamente.'
+    except Exception:
+        logger.exception('AI %s failed', prompt.name)
+    finally:
+        _flights.pop(key, None)
+        # Release the lock before the followers finish: under WSGI the event
+        # loop closes with the response and would cancel a later release
+        try:
+            if lock_key:
+                await cache.adelete(lock_key)
+        finally:
+            flight.finish(error)
+
+
+def _join(key):
+    flight = _flights.get(key)
+    # Under WSGI each request runs on its own event loop; a flight from another one can't be awaited
+    if flight is not None and flight.loop is asyncio.get_running_loop():
+        return flight
+    return None
+
+
+def _take_off(key, prompt, inputs, subject, lock_key=None):
+    flight = _flights[key] = Flight()
+    flight.task = asyncio.create_task(_run(flight, key, prompt, inputs, subject, lock_key))
+    return flight
+
+
+async def _lead_or_wait(key, prompt, inputs, subject, since):
+    """The flight to follow, or the row another process stored while we waited for its lock."""
+    lock_key = f'{key}:lock'
+    deadline = asyncio.get_running_loop().time() + lock_timeout()
+    while not await cache.aadd(lock_key, 1, lock_timeout()):
+        flight = _join(key)
+        if flight is not None:
+            return flight
+        if asyncio.get_running_loop().time() > deadline:
+            lock_key = None  # the holder looks stuck: call the model without the lock
+            break
+        await asyncio.sleep(POLL_SECONDS)
+        row = await cached_research(prompt, subject, since)
+        if row is not None:
+            return row
+    # Another request of this process may have taken off while we polled
+    flight = _join(key)
+    if flight is not None:
+        if lock_key:
+            await cache.adelete(lock_key)
+        return flight
+    return _take_off(key, prompt, inputs, subject, lock_key)
+
+
+async def stream(prompt, inputs, refresh=False):
+    subject = prompt.subject_of(inputs)
+    key = request_key(prompt, subject)
+    since = timezone.now() if refresh else None
+    if prompt.cached and not refresh:
+        row = await cached_research(prompt, subject)
+        if row is not None:
+            for event in _from_row(row):
+                yield event
+            return
+    flight = _join(key)
+    if flight is None:
+        if prompt.cached:
+            flight = await _lead_or_wait(key, prompt, inputs, subject, since)
+            if isinstance(flight, CompanyResearch):
+                for event in _from_row(flight):
+                    yield event
+                return
+        else:
+            flight = _take_off(key, prompt, inputs, subject)
+    async for event in flight.follow():
+        yield event
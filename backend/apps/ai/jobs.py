@@ -0,0 +1,7 @@
+from apps.jobs.registry import register
+from .gateway import evict
+
+
+@register('ai.evict_research')
+def evict_research():
+    return evict()
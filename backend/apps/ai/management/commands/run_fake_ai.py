@@ -0,0 +1,26 @@
+import time
+from django.core.management.base import BaseCommand
+from apps.ai.fake_server import FakeGemini
+
+
+class Command(BaseCommand):
+    help = 'Run a local fake Gemini streaming API for testing the AI gateway.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--port', type=int, default=8766)
+        parser.add_argument('--delay', type=float, default=0.05, help='Seconds between streamed chunks.')
+
+    def handle(self, *args, **options):
+        fake = FakeGemini(port=options['port'])
+        fake.delay = options['delay']
+        fake.start()
+        self.stdout.write(
+            f'Fake Gemini em {fake.base_url}\n'
+            f'  GEMINI_API_BASE_URL={fake.base_url}\n'
+            f'  GEMINI_API_KEY=qualquer-valor'
+        )
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            fake.stop()
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CompanyResearch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('normalized_name', models.CharField(max_length=255)),
+                ('prompt_version', models.CharField(max_length=20)),
+                ('company_name', models.CharField(max_length=255)),
+                ('text', models.TextField()),
+                ('sources', models.JSONField(blank=True, default=list)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('expires_at', models.DateTimeField()),
+                ('last_used_at', models.DateTimeField()),
+                ('hits', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['last_used_at'], name='ai_companyr_last_us_14fe8a_idx'), models.Index(fields=['expires_at'], name='ai_companyr_expires_6e14c2_idx')],
+                'constraints': [models.UniqueConstraint(fields=('normalized_name', 'prompt_version'), name='ai_research_unique_key')],
+            },
+        ),
+    ]
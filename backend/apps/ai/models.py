@@ -0,0 +1,28 @@
+from django.db import models
+
+
+class CompanyResearch(models.Model):
+    """Cached answer of the company research prompt, per normalized name and prompt version."""
+    normalized_name = models.CharField(max_length=255)
+    prompt_version = models.CharField(max_length=20)
+    company_name = models.CharField(max_length=255)
+    text = models.TextField()
+    sources = models.JSONField(default=list, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    expires_at = models.DateTimeField()
+    # Drives eviction: the least recently used rows go first when the table is full
+    last_used_at = models.DateTimeField()
+    hits = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['normalized_name', 'prompt_version'], name='ai_research_unique_key'),
+        ]
+        indexes = [
+            models.Index(fields=['last_used_at']),
+            models.Index(fields=['expires_at']),
+        ]
+
+    def __str__(self):
+        return f'{self.company_name} (v{self.prompt_version})'
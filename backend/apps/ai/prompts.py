@@ -0,0 +1,101 @@
+"""
+Prompts the gateway serves, kept on the server next to their versions.
+
+Bump a prompt's ``version`` whenever its text or model changes: cached
+company research is keyed by the version, so old answers stop being served
+without having to clear anything.
+"""
+import json
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Callable
+
+# Legal-form suffixes dropped when comparing company names
+COMPANY_SUFFIXES = {'ltda', 'me', 'epp', 'eireli', 'sa', 'mei', 'slu', 'cia', 'inc', 'llc'}
+
+
+def normalize_text(value):
+    """Lowercase, accents and punctuation removed, whitespace collapsed."""
+    value = unicodedata.normalize('NFKD', value)
+    value = ''.join(char for char in value if not unicodedata.combining(char)).lower()
+    return ' '.join(re.sub(r'[^\w\s]', ' ', value).split())
+
+
+def normalize_company(name):
+    """'Padaria São João Ltda.' and 'padaria sao joao' map to the same key."""
+    # Join dotted/slashed abbreviations first so 'S.A.' and 'S/A' become 'sa'
+    words = normalize_text(re.sub(r'(?<=\w)[./](?=\w)', '', name)).split()
+    while len(words) > 1 and words[-1] in COMPANY_SUFFIXES:
+        words.pop()
+    return ' '.join(words)
+
+
+@dataclass(frozen=True)
+class Prompt:
+    name: str
+    version: str
+    model: str
+    build: Callable[[dict], str]
+    tools: list = field(default_factory=list)
+    # Cached answers live in CompanyResearch; others are only coalesced in flight
+    cached: bool = False
+    # Inputs -> the string identical requests share; defaults to the inputs as JSON
+    subject: Callable[[dict], str] = None
+
+    def subject_of(self, inputs):
+        if self.subject:
+            return self.subject(inputs)
+        return json.dumps(inputs, sort_keys=True, default=str)
+
+    def payload(self, inputs):
+        payload = {'contents': [{'role': 'user', 'parts': [{'text': self.build(inputs)}]}]}
+        if self.tools:
+            payload['tools'] = self.tools
+        return payload
+
+
+def _research(inputs):
+    return (
+        f'Pesquise notícias recentes e informações de negócios sobre a empresa "{inputs["company"]}".\n'
+        'Resuma:\n'
+        '1. Atuação principal\n'
+        '2. Notícias recentes (últimos 6 meses)\n'
+        '3. Possíveis dores ou oportunidades de negócio para uma consultoria de processos e software.'
+    )
+
+
+def _proposal(inputs):
+    return (
+        'Você é um consultor comercial sênior da Potencialize Resultados.\n'
+        f'Escreva uma proposta comercial persuasiva e profissional para o cliente "{inputs["client"]}".\n\n'
+        f'Produtos Ofertados: {", ".join(inputs["products"])}\n'
+        f'Valor Total: R$ {inputs["value"]}\n\n'
+        f'Detalhes do Escopo Principal:\n"{inputs["scope"]}"\n\n'
+        'Estrutura da proposta:\n'
+        '1. Introdução (focada em dor e solução)\n'
+        '2. O que será entregue (detalhes técnicos mas acessíveis)\n'
+        '3. Metodologia de Trabalho (Onboarding e Acompanhamento)\n'
+        '4. Investimento\n'
+        '5. Fechamento (Chamada para ação)\n\n'
+        'Tom de voz: Profissional, parceiro, focado em resultados e eficiência.'
+    )
+
+
+def _action_plan(inputs):
+    return (
+        'Crie um Plano de Ação Executivo (To-Do List estratégica) para um projeto de consultoria '
+        f'com o seguinte contexto: "{inputs["context"]}".\n'
+        'Formato: Lista de 5 a 7 itens principais, com "Ação", "Por que fazer" e "Resultado Esperado".'
+    )
+
+
+PROMPTS = {
+    prompt.name: prompt for prompt in (
+        Prompt('assistant', '1', 'gemini-2.5-flash-lite', lambda inputs: inputs['message']),
+        Prompt('research', '1', 'gemini-2.5-flash', _research, tools=[{'googleSearch': {}}], cached=True,
+               subject=lambda inputs: normalize_company(inputs['company'])),
+        Prompt('proposal', '1', 'gemini-3-pro-preview', _proposal),
+        Prompt('action_plan', '1', 'gemini-3-pro-preview', _action_plan),
+    )
+}
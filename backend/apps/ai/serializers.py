@@ -0,0 +1,28 @@
+from rest_framework import serializers
+from .prompts import normalize_company
+
+
+class ResearchSerializer(serializers.Serializer):
+    company = serializers.CharField(max_length=255)
+    # Skip the cached answer and ask the model again
+    refresh = serializers.BooleanField(default=False)
+
+    def validate_company(self, value):
+        if not normalize_company(value):
+            raise serializers.ValidationError('Informe o nome da empresa.')
+        return value
+
+
+class AssistantSerializer(serializers.Serializer):
+    message = serializers.CharField(max_length=4000)
+
+
+class ProposalSerializer(serializers.Serializer):
+    client = serializers.CharField(max_length=255)
+    products = serializers.ListField(child=serializers.CharField(max_length=255), max_length=50, allow_empty=True)
+    value = serializers.DecimalField(max_digits=14, decimal_places=2)
+    scope = serializers.CharField(max_length=4000, allow_blank=True)
+
+
+class ActionPlanSerializer(serializers.Serializer):
+    context = serializers.CharField(max_length=4000)
@@ -0,0 +1,188 @@
+import asyncio
+import json
+from datetime import timedelta
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from apps.jobs.models import Job
+from apps.jobs.queue import run_next
+from apps.core.testing import TEST_CACHES, make_user
+from . import client, gateway
+from .fake_server import FakeGemini
+from .models import CompanyResearch
+from .prompts import PROMPTS
+
+RESEARCH = PROMPTS['research']
+
+
+async def _collect(events):
+    return [event async for event in events]
+
+
+def collect(prompt, inputs, refresh=False):
+    return async_to_sync(_collect)(gateway.stream(prompt, inputs, refresh=refresh))
+
+
+class FakeGeminiTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.fake = FakeGemini().start()
+        cls.enterClassContext(override_settings(
+            CACHES=TEST_CACHES, GEMINI_API_KEY='test-key', GEMINI_API_BASE_URL=cls.fake.base_url,
+        ))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.fake.stop()
+        super().tearDownClass()
+
+    def setUp(self):
+        cache.clear()
+        self.fake.requests.clear()
+        self.fake.failures.clear()
+        self.fake.delay = 0
+
+
+class ResearchCacheTests(FakeGeminiTestCase):
+    def test_cache_hit_makes_no_upstream_call(self):
+        first = collect(RESEARCH, {'company': 'Padaria São João Ltda.'})
+        self.assertEqual(len(self.fake.requests), 1)
+        self.assertEqual(first[-1][0], 'done')
+        self.assertFalse(first[-1][1]['cached'])
+
+        second = collect(RESEARCH, {'company': 'padaria sao joao'})
+        self.assertEqual(len(self.fake.requests), 1)
+        self.assertTrue(second[-1][1]['cached'])
+        text = ''.join(data['text'] for event, data in first if event == 'chunk')
+        self.assertEqual(second[0], ('chunk', {'text': text}))
+        self.assertEqual(CompanyResearch.objects.get().hits, 1)
+
+    def test_refresh_calls_the_model_again(self):
+        collect(RESEARCH, {'company': 'Padaria Estrela'})
+        collect(RESEARCH, {'company': 'Padaria Estrela'}, refresh=True)
+        self.assertEqual(len(self.fake.requests), 2)
+
+    def test_identical_concurrent_requests_share_one_call(self):
+        self.fake.delay = 0.02
+
+        async def both():
+            return await asyncio.gather(
+                _collect(gateway.stream(RESEARCH, {'company': 'Padaria Estrela'})),
+                _collect(gateway.stream(RESEARCH, {'company': 'Padaria Estrela Ltda'})),
+            )
+
+        first, second = async_to_sync(both)()
+        self.assertEqual(len(self.fake.requests), 1)
+        self.assertEqual(first, second)
+        self.assertEqual(first[-1][0], 'done')
+
+    def test_expired_answer_is_fetched_again(self):
+        collect(RESEARCH, {'company': 'Padaria Estrela'})
+        CompanyResearch.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        events = collect(RESEARCH, {'company': 'Padaria Estrela'})
+        self.assertEqual(len(self.fake.requests), 2)
+        self.assertFalse(events[-1][1]['cached'])
+        self.assertGreater(CompanyResearch.objects.get().expires_at, timezone.now())
+
+    @override_settings(AI_RESEARCH_CACHE_TTL_HOURS=0)
+    def test_ttl_setting_applies_to_stored_answers(self):
+        collect(RESEARCH, {'company': 'Padaria Estrela'})
+        collect(RESEARCH, {'company': 'Padaria Estrela'})
+        self.assertEqual(len(self.fake.requests), 2)
+
+    def test_eviction_drops_least_recently_used(self):
+        now = timezone.now()
+        for index, name in enumerate(['antiga', 'media', 'recente']):
+            CompanyResearch.objects.create(
+                normalized_name=name, prompt_version=RESEARCH.version, company_name=name, text=name,
+                expires_at=now + timedelta(days=1), last_used_at=now - timedelta(hours=3 - index),
+            )
+        CompanyResearch.objects.create(
+            normalized_name='vencida', prompt_version=RESEARCH.version, company_name='vencida', text='vencida',
+            expires_at=now - timedelta(seconds=1), last_used_at=now,
+        )
+
+        self.assertEqual(gateway.evict(max_entries=2), 2)
+        self.assertEqual(
+            sorted(CompanyResearch.objects.values_list('normalized_name', flat=True)), ['media', 'recente'],
+        )
+
+    @override_settings(AI_RESEARCH_CACHE_MAX_ENTRIES=1)
+    def test_stores_queue_one_eviction_job_per_hour(self):
+        collect(RESEARCH, {'company': 'Padaria Estrela'})
+        collect(RESEARCH, {'company': 'Padaria Lua'})
+        # Storing does not evict by itself
+        self.assertEqual(CompanyResearch.objects.count(), 2)
+        job = Job.objects.get()
+        self.assertEqual(job.name, 'ai.evict_research')
+
+        self.assertEqual(run_next('test').result, 1)
+        self.assertEqual(CompanyResearch.objects.get().normalized_name, 'padaria lua')
+
+    def test_upstream_failure_is_not_cached(self):
+        self.fake.fail_next(503)
+        events = collect(RESEARCH, {'company': 'Padaria Estrela'})
+        self.assertEqual(events[-1][0], 'error')
+        self.assertFalse(CompanyResearch.objects.exists())
+
+
+class SSEResponseTests(FakeGeminiTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.client.force_authenticate(make_user())
+
+    def read_events(self, response):
+        body = b''.join(async_to_sync(_collect)(response.streaming_content)).decode()
+        self.assertTrue(body.endswith('\n\n'))
+        events = []
+        for block in body[:-2].split('\n\n'):
+            event, data = block.split('\n')
+            self.assertTrue(event.startswith('event: ') and data.startswith('data: '))
+            events.append((event[7:], json.loads(data[6:])))
+        return events
+
+    def post(self, name, data):
+        response = self.client.post(reverse(name), data, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream; charset=utf-8')
+        return self.read_events(response)
+
+    def test_chunks_then_done(self):
+        events = self.post('ai-assistant', {'message': 'Como está o funil?'})
+        names = [event for event, _ in events]
+        self.assertGreater(names.count('chunk'), 1)
+        self.assertEqual(names[-1], 'done')
+        self.assertEqual(set(names[:-1]), {'chunk'})
+        self.assertIn('Como está o funil?', ''.join(data['text'] for event, data in events[:-1]))
+        self.assertEqual(events[-1][1], {'cached': False, 'sources': []})
+
+    def test_research_done_carries_sources(self):
+        events = self.post('ai-research', {'company': 'Padaria Estrela'})
+        self.assertEqual(events[-1][1]['sources'][0]['web']['uri'], 'https://example.com/noticia')
+
+    def test_upstream_failure_ends_with_error(self):
+        self.fake.fail_next(503)
+        events = self.post('ai-assistant', {'message': 'Olá'})
+        self.assertEqual(events, [('error', {'detail': 'Não foi possível obter a resposta da IA. Tente novamente.'})])
+
+    @override_settings(GEMINI_API_KEY='')
+    def test_missing_key_is_503(self):
+        response = self.client.post(reverse('ai-assistant'), {'message': 'Olá'}, format='json')
+        self.assertEqual(response.status_code, 503)
+
+
+class SSEParserTests(TestCase):
+    def test_multibyte_character_split_across_chunks(self):
+        data = 'data: {"text": "São João"}\r\n\r\n'.encode()
+
+        async def byte_by_byte():
+            for byte in data:
+                yield bytes([byte])
+
+        self.assertEqual(async_to_sync(_collect)(client._events(byte_by_byte())), [{'text': 'São João'}])
@@ -0,0 +1,9 @@
+from django.urls import path
+from .views import ActionPlanView, AssistantView, ProposalView, ResearchView
+
+urlpatterns = [
+    path('research/', ResearchView.as_view(), name='ai-research'),
+    path('assistant/', AssistantView.as_view(), name='ai-assistant'),
+    path('proposal/', ProposalView.as_view(), name='ai-proposal'),
+    path('action-plan/', ActionPlanView.as_view(), name='ai-action-plan'),
+]
@@ -0,0 +1,66 @@
+import json
+from django.http import StreamingHttpResponse
+from rest_framework import permissions, status
+from apps.core.async_views import AsyncAPIView, json_response
+from . import client, gateway
+from .prompts import PROMPTS
+from .serializers import ActionPlanSerializer, AssistantSerializer, ProposalSerializer, ResearchSerializer
+
+
+def sse(event, data):
+    return f'event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n'
+
+
+async def _event_stream(events):
+    async for event, data in events:
+        yield sse(event, data)
+
+
+class AIStreamView(AsyncAPIView):
+    """
+    POST the prompt's inputs; the answer comes back as server-sent events:
+    ``chunk`` ({"text"}) as the model writes, then ``done`` ({"cached",
+    "sources"}) or ``error`` ({"detail"}). The Gemini key never leaves the
+    server.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    prompt = None
+    serializer_class = None
+
+    async def post(self, request):
+        if not client.configured():
+            return json_response(
+                {'detail': 'IA não configurada no servidor (GEMINI_API_KEY).'}, status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+        serializer = self.serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        inputs = dict(serializer.validated_data)
+        refresh = inputs.pop('refresh', False)
+        response = StreamingHttpResponse(
+            _event_stream(gateway.stream(PROMPTS[self.prompt], inputs, refresh=refresh)),
+            content_type='text/event-stream; charset=utf-8',
+        )
+        response['Cache-Control'] = 'no-cache'
+        # Keep nginx-style proxies from buffering the stream
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+
+class ResearchView(AIStreamView):
+    prompt = 'research'
+    serializer_class = ResearchSerializer
+
+
+class AssistantView(AIStreamView):
+    prompt = 'assistant'
+    serializer_class = AssistantSerializer
+
+
+class ProposalView(AIStreamView):
+    prompt = 'proposal'
+    serializer_class = ProposalSerializer
+
+
+class ActionPlanView(AIStreamView):
+    prompt = 'action_plan'
+    serializer_class = ActionPlanSerializer
@@ -1,10 +1,26 @@
 from rest_framework import viewsets, permissions
+from apps.core.mixins import CachedResponseMixin, ExportMixin
 from .models import ClientProfile
 from .serializers import ClientProfileSerializer
+from apps.metrics.mixins import SerializerTimingMixin
 
-class ClientProfileViewSet(viewsets.ModelViewSet):
+class ClientProfileViewSet(SerializerTimingMixin, CachedResponseMixin, ExportMixin, viewsets.ModelViewSet):
     queryset = ClientProfile.objects.all()
     serializer_class = ClientProfileSerializer
     permission_classes = [permissions.IsAuthenticated]
+    cache_models = (ClientProfile,)
     filterset_fields = ['status', 'state', 'has_mapped_processes']
     search_fields = ['company_name', 'cnpj', 'responsible_name']
+    export_filename = 'clientes'
+    export_fields = (
+        ('Empresa', 'company_name'),
+        ('CNPJ', 'cnpj'),
+        ('Responsável', 'responsible_name'),
+        ('Telefone', 'responsible_phone'),
+        ('Cidade', 'city'),
+        ('UF', 'state'),
+        ('Funcionários', 'employee_count'),
+        ('Clientes', 'client_count'),
+        ('Status', 'status'),
+        ('Cliente desde', 'joined_at'),
+    )
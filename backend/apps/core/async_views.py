@@ -0,0 +1,77 @@
+"""
+Async endpoints for requests that mostly wait on the network.
+
+DRF views are sync: under ASGI each one occupies a thread for its whole
+duration. ``AsyncAPIView`` keeps DRF's authentication, permission classes
+and request parsing but lets ``async def`` handlers await external calls
+on the event loop, so one worker serves many such requests at once. ORM
+access inside handlers must use the async ORM (``afirst``, ``aupdate``...)
+or ``sync_to_async``. Under WSGI the handlers still work, run by Django
+through ``async_to_sync``.
+"""
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse
+from django.utils.decorators import classonlymethod
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+
+def json_response(data, status=200, **kwargs):
+    return JsonResponse(
+        data, status=status, encoder=DjangoJSONEncoder, safe=False, json_dumps_params={'ensure_ascii': False}, **kwargs,
+    )
+
+
+class AsyncAPIView(View):
+    authentication_classes = api_settings.DEFAULT_AUTHENTICATION_CLASSES
+    permission_classes = api_settings.DEFAULT_PERMISSION_CLASSES
+    parser_classes = api_settings.DEFAULT_PARSER_CLASSES
+
+    @classonlymethod
+    def as_view(cls, **initkwargs):
+        # Token auth only, like DRF's APIView
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    def initialize_request(self, request):
+        return Request(
+            request,
+            parsers=[parser() for parser in self.parser_classes],
+            authenticators=[authenticator() for authenticator in self.authentication_classes],
+        )
+
+    def check_access(self, request):
+        """Authenticate and run the permission classes (may query the database)."""
+        request.user  # noqa: B018 - triggers authentication
+        for permission in (permission() for permission in self.permission_classes):
+            if not permission.has_permission(request, self):
+                if request.authenticators and not request.successful_authenticator:
+                    raise exceptions.NotAuthenticated()
+                raise exceptions.PermissionDenied(getattr(permission, 'message', None))
+
+    def handle_exception(self, request, exc):
+        headers = {}
+        if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+            authenticators = request.authenticators
+            header = authenticators[0].authenticate_header(request) if authenticators else None
+            if header:
+                headers['WWW-Authenticate'] = header
+            else:
+                exc.status_code = 403
+        detail = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+        return json_response(detail, status=exc.status_code, headers=headers)
+
+    async def dispatch(self, request, *args, **kwargs):
+        handler = getattr(self, request.method.lower(), None)
+        if request.method.lower() not in self.http_method_names or handler is None:
+            return await self.http_method_not_allowed(request, *args, **kwargs)
+        request = self.initialize_request(request)
+        self.request = request
+        try:
+            await sync_to_async(self.check_access)(request)
+            return await handler(request, *args, **kwargs)
+        except exceptions.APIException as exc:
+            return self.handle_exception(request, exc)
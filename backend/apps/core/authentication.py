@@ -0,0 +1,97 @@
+"""
+Stateless JWT authentication.
+
+Access tokens carry the user's role, active flag and the versions of their
+role and of the user row they were issued under (``role`` / ``is_active`` /
+``rv`` / ``uv`` claims). ``StatelessJWTAuthentication`` builds the user from
+those claims instead of loading it, so authenticating a request costs no
+query; fields not in the token are loaded lazily if a view reads them. A
+token whose ``rv`` or ``uv`` no longer matches (the role's permissions, or
+the user's role, status or flags changed) is rejected with 401 and the
+client refreshes it, which re-reads the user and refuses deactivated ones.
+"""
+import time
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+from rest_framework_simplejwt import serializers as jwt_serializers
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from .models import User
+from .permissions_cache import token_versions
+
+ROLE_CLAIM = 'role'
+ROLE_VERSION_CLAIM = 'rv'
+USER_VERSION_CLAIM = 'uv'
+# Copied onto the token and onto the user built from it
+USER_CLAIMS = ('username', 'is_active', 'is_staff', 'is_superuser')
+# Versions remembered per process; cleared when it grows past this many users
+MAX_REMEMBERED_VERSIONS = 10000
+
+_versions = {}
+
+
+def current_token_versions(role_id, user_id):
+    """``token_versions()``, re-read at most every ``STATELESS_JWT_VERSION_TTL`` seconds per user."""
+    ttl = getattr(settings, 'STATELESS_JWT_VERSION_TTL', 2)
+    now = time.monotonic()
+    key = (role_id, user_id)
+    remembered = _versions.get(key)
+    if remembered is None or now - remembered[1] >= ttl:
+        if len(_versions) >= MAX_REMEMBERED_VERSIONS:
+            _versions.clear()
+        remembered = _versions[key] = (token_versions(role_id, user_id), now)
+    return remembered[0]
+
+
+def stamp_claims(token, user):
+    token[ROLE_CLAIM] = user.role_id
+    token[ROLE_VERSION_CLAIM], token[USER_VERSION_CLAIM] = token_versions(user.role_id, user.pk)
+    for name in USER_CLAIMS:
+        token[name] = getattr(user, name)
+    return token
+
+
+def token_user(token):
+    """A ``User`` instance from the claims; other fields are deferred."""
+    user_id = User._meta.get_field(api_settings.USER_ID_FIELD).to_python(token[api_settings.USER_ID_CLAIM])
+    values = {
+        api_settings.USER_ID_FIELD: user_id,
+        'role_id': token.get(ROLE_CLAIM),
+        **{name: token.get(name) for name in USER_CLAIMS},
+    }
+    # from_db pairs a partial row with the model's concrete fields in declaration order
+    names = [field.attname for field in User._meta.concrete_fields if field.attname in values]
+    return User.from_db(DEFAULT_DB_ALIAS, names, [values[name] for name in names])
+
+
+class TokenObtainPairSerializer(jwt_serializers.TokenObtainPairSerializer):
+    @classmethod
+    def get_token(cls, user):
+        return stamp_claims(super().get_token(user), user)
+
+
+class TokenRefreshSerializer(jwt_serializers.TokenRefreshSerializer):
+    """Re-stamps the new access token from the current user row, not the refresh token's copy."""
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        refresh = RefreshToken(attrs['refresh'], verify=False)
+        user = User.objects.get(**{api_settings.USER_ID_FIELD: refresh[api_settings.USER_ID_CLAIM]})
+        access = refresh.access_token
+        data['access'] = str(stamp_claims(access, user))
+        return data
+
+
+class StatelessJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken('Token sem identificação de usuário.')
+        if not validated_token.get('is_active'):
+            raise AuthenticationFailed('Usuário inativo.', code='user_inactive')
+        issued = (validated_token.get(ROLE_VERSION_CLAIM), validated_token.get(USER_VERSION_CLAIM))
+        current = current_token_versions(validated_token.get(ROLE_CLAIM), validated_token[api_settings.USER_ID_CLAIM])
+        if issued != current:
+            raise AuthenticationFailed('Permissões alteradas; renove o token.', code='permissions_changed')
+        return token_user(validated_token)
@@ -0,0 +1,50 @@
+from django.db import connections, router
+from django.dispatch import Signal
+
+# bulk_create/bulk_update skip post_save, so BulkModelMixin sends this instead.
+# Receivers get sender (model class), instances, created (bool),
+# update_fields (None on create) and previous ({pk: {attname: old value}} on
+# update, limited to update_fields).
+post_bulk_save = Signal()
+
+
+def _bulk_create_mysql(model, instances, connection):
+    """
+    One multi-row INSERT, then the ids read back with one query.
+
+    A single ``INSERT ... VALUES`` is a "simple insert" to InnoDB: it
+    reserves all its auto-increment values at once, in every
+    ``innodb_autoinc_lock_mode``, so they run from ``LAST_INSERT_ID()`` in
+    steps of ``auto_increment_increment``. Rows that already carry a pk are
+    inserted on their own.
+    """
+    pending = [instance for instance in instances if instance.pk is None]
+    if len(pending) < len(instances):
+        model.objects.bulk_create([instance for instance in instances if instance.pk is not None])
+    if not pending:
+        return
+    # batch_size=len keeps Django from splitting the rows over several INSERTs
+    model.objects.bulk_create(pending, batch_size=len(pending))
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT LAST_INSERT_ID(), @@SESSION.auto_increment_increment')
+        first, step = cursor.fetchone()
+    for offset, instance in enumerate(pending):
+        instance.pk = first + offset * step
+
+
+def bulk_create_with_signal(model, instances):
+    """``bulk_create`` followed by ``post_bulk_save``; call inside a transaction."""
+    if not instances:
+        return instances
+    connection = connections[router.db_for_write(model)]
+    if connection.features.can_return_rows_from_bulk_insert:
+        model.objects.bulk_create(instances)
+    elif connection.vendor == 'mysql':
+        _bulk_create_mysql(model, instances, connection)
+    else:
+        # Unknown backend without RETURNING: keep the ids by saving one by one
+        for instance in instances:
+            instance.save()
+        return instances
+    post_bulk_save.send(sender=model, instances=instances, created=True, update_fields=None, previous={})
+    return instances
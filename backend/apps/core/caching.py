@@ -0,0 +1,78 @@
+"""
+Model-versioned response cache.
+
+Every watched model has a version stamp in the shared cache, bumped by its
+post_save/post_delete/post_bulk_save (and m2m_changed) signals. Cached
+responses embed the versions of the models they were built from, so a write
+makes them unreachable without having to find and delete keys.
+
+The stamp is bumped when the signal fires and again when the transaction
+commits: a response rebuilt from the old rows in between is stored under
+the first bump and dropped by the second.
+"""
+import hashlib
+import time
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from .bulk import post_bulk_save
+
+_watched = set()
+
+
+def _version_key(model):
+    return f'core:cache:model:{model._meta.label_lower}'
+
+
+def model_versions(models):
+    keys = [_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # Seed from the clock so an evicted key never reuses an old stamp
+            cache.add(key, time.time_ns(), None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def bump_model_version(model):
+    key = _version_key(model)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def bump_model_version_on_commit(model):
+    bump_model_version(model)
+    transaction.on_commit(lambda: bump_model_version(model))
+
+
+def _invalidate(sender, **kwargs):
+    bump_model_version_on_commit(sender)
+
+
+def _invalidate_m2m(sender, instance, action, model, reverse=False, **kwargs):
+    if action.startswith('post_'):
+        # Both ends of the relation render the link
+        bump_model_version_on_commit(type(instance))
+        bump_model_version_on_commit(model)
+
+
+def watch(*models):
+    """Invalidate cached responses built from ``models`` whenever they change."""
+    for model in models:
+        if model in _watched:
+            continue
+        _watched.add(model)
+        uid = f'core-cache-{model._meta.label_lower}'
+        post_save.connect(_invalidate, sender=model, dispatch_uid=uid)
+        post_delete.connect(_invalidate, sender=model, dispatch_uid=uid)
+        post_bulk_save.connect(_invalidate, sender=model, dispatch_uid=uid)
+        for field in model._meta.local_many_to_many:
+            m2m_changed.connect(_invalidate_m2m, sender=field.remote_field.through, dispatch_uid=uid)
+
+
+def response_key(prefix, versions, parts):
+    digest = hashlib.md5('|'.join(str(part) for part in parts).encode()).hexdigest()
+    return f'core:cache:response:{prefix}:{"-".join(str(v) for v in versions)}:{digest}'
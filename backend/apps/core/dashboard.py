@@ -0,0 +1,70 @@
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+from apps.clients.models import ClientProfile
+from apps.crm.models import Activity, Deal
+from apps.onboarding.models import OnboardingItem
+from apps.projects.models import Project, ProjectMeeting
+from apps.tasks.models import Task
+from .caching import model_versions
+
+CACHE_TIMEOUT = 60 * 15
+
+# Models whose writes change at least one company KPI
+SOURCE_MODELS = (Deal, Activity, OnboardingItem, ClientProfile, Task, Project, ProjectMeeting)
+
+MEETING_ACTIVITY_TYPES = ('Reunião externa', 'Visita')
+
+
+def compute_company_kpis():
+    """Company-wide dashboard numbers, one aggregate query per source table."""
+    sales = Deal.objects.aggregate(
+        won_value=Sum('value', filter=Q(stage='Ganho'), default=0),
+        won_count=Count('id', filter=Q(stage='Ganho')),
+    )
+    activities = Activity.objects.aggregate(
+        total=Count('id'),
+        meetings=Count('id', filter=Q(activity_type__in=MEETING_ACTIVITY_TYPES)),
+    )
+    onboarding = OnboardingItem.objects.aggregate(
+        completed=Count('id', filter=Q(stage='Concluído')),
+        pending=Count('id', filter=~Q(stage='Concluído')),
+    )
+    clients = ClientProfile.objects.aggregate(active=Count('id', filter=Q(status='Ativo')))
+    tasks = Task.objects.aggregate(completed=Count('id', filter=Q(status='completed')))
+    per_consultant = (
+        Project.objects.values('specialist', 'specialist__first_name', 'specialist__username')
+        .annotate(value=Count('id'))
+        .order_by('-value')
+    )
+
+    return {
+        'sales': sales,
+        'activities': activities,
+        'onboarding': onboarding,
+        'clients': clients,
+        'projects': {
+            'total': sum(row['value'] for row in per_consultant),
+            'meetings': ProjectMeeting.objects.count(),
+            'tasks_completed': tasks['completed'],
+            'per_consultant': [
+                {
+                    'consultant': row['specialist'],
+                    'name': row['specialist__first_name'] or row['specialist__username'] or 'Não atribuído',
+                    'value': row['value'],
+                }
+                for row in per_consultant
+            ],
+        },
+    }
+
+
+def get_company_kpis():
+    # Keyed by the source models' version stamps (bumped again on commit), so
+    # numbers computed from rows a transaction is still changing never outlive it
+    versions = model_versions(SOURCE_MODELS)
+    key = f'core:dashboard:company:{"-".join(str(v) for v in versions)}'
+    kpis = cache.get(key)
+    if kpis is None:
+        kpis = compute_company_kpis()
+        cache.set(key, kpis, CACHE_TIMEOUT)
+    return kpis
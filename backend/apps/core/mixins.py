@@ -0,0 +1,335 @@
+import hashlib
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.db.models import Count, Max
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from .bulk import post_bulk_save, bulk_create_with_signal
+from .caching import model_versions, response_key, watch
+from .export import EXPORT_CHUNK_SIZE, XLSX_CONTENT_TYPE, aiterate, stream_csv, stream_xlsx
+
+
+class SparseFieldsetMixin:
+    """
+    Viewset counterpart of ``DynamicFieldsModelSerializer``.
+
+    ``select_related_fields`` and ``prefetch_related_fields`` map a serializer
+    output field to the lookups it needs, and ``annotated_fields`` to a callable
+    returning the ``annotate()`` kwargs that compute it; only those of fields
+    that will actually be rendered are applied, and ``?fields=`` also narrows
+    the SELECT with ``only()``. ``list_serializer_class`` is used for the list
+    action.
+    """
+    list_serializer_class = None
+    select_related_fields = {}
+    prefetch_related_fields = {}
+    annotated_fields = {}
+
+    def get_serializer_class(self):
+        if self.action == 'list' and self.list_serializer_class is not None:
+            return self.list_serializer_class
+        return super().get_serializer_class()
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        rendered = self.get_serializer().fields
+
+        select, prefetch, annotations = [], [], {}
+        for name in rendered:
+            select.extend(self.select_related_fields.get(name, ()))
+            prefetch.extend(self.prefetch_related_fields.get(name, ()))
+            if name in self.annotated_fields:
+                annotations.update(self.annotated_fields[name]())
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        if annotations:
+            queryset = queryset.annotate(**annotations)
+
+        if self.request.method == 'GET' and self.request.query_params.get('fields'):
+            sources = {field.source.split('.')[0] for field in rendered.values()}
+            sources.update(path.split('__')[0] for path in select)
+            # Cursor pagination reads its ordering columns off every row
+            ordering = getattr(self.paginator, 'ordering', None) or ()
+            if isinstance(ordering, str):
+                ordering = (ordering,)
+            sources.update(column.lstrip('-') for column in ordering)
+            model = queryset.model
+            columns = [
+                f.name for f in model._meta.concrete_fields
+                if f.name in sources or f.attname in sources
+            ]
+            queryset = queryset.only(model._meta.pk.name, *columns)
+        return queryset
+
+
+class BulkModelMixin:
+    """
+    ``/bulk/`` on a ModelViewSet: POST a list to create, PATCH a list of
+    objects with ``id`` (each id at most once) to update, DELETE
+    ``{"ids": [...]}`` to remove.
+
+    Each call runs in one transaction with ``bulk_create``/``bulk_update``.
+    Validation errors come back as a list aligned with the payload (``{}`` for
+    valid items) and nothing is written.
+    """
+    bulk_max_items = 500
+
+    @action(detail=False, methods=['post', 'patch', 'delete'], url_path='bulk')
+    def bulk(self, request):
+        if request.method == 'DELETE':
+            return self.bulk_destroy(request)
+        items = request.data
+        if not isinstance(items, list) or not items:
+            return Response({'detail': 'Envie uma lista de itens.'}, status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > self.bulk_max_items:
+            return Response(
+                {'detail': f'Máximo de {self.bulk_max_items} itens por requisição.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if request.method == 'POST':
+            return self.bulk_create(items)
+        return self.bulk_update(items)
+
+    def bulk_create(self, items):
+        serializer = self.get_serializer(data=items, many=True)
+        if not serializer.is_valid():
+            errors = serializer.errors
+            if isinstance(errors, dict):  # {index: errors}; align with the bulk_update shape
+                errors = [errors.get(index, {}) for index in range(len(items))]
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+        model = self.get_queryset().model
+        instances = [model(**attrs) for attrs in serializer.validated_data]
+        with transaction.atomic():
+            bulk_create_with_signal(model, instances)
+        return Response(self._bulk_response(instances), status=status.HTTP_201_CREATED)
+
+    def _parse_pk(self, value):
+        """``value`` as a primary key of the viewset's model, or None when it isn't one."""
+        if value is None or isinstance(value, (bool, list, dict)):
+            return None
+        try:
+            return self.get_queryset().model._meta.pk.to_python(value)
+        except DjangoValidationError:
+            return None
+
+    def bulk_update(self, items):
+        ids = [self._parse_pk(item.get('id')) if isinstance(item, dict) else None for item in items]
+        existing = self.get_queryset().in_bulk([pk for pk in ids if pk is not None])
+
+        errors, changes, seen = [], [], set()
+        for pk, item in zip(ids, items):
+            if pk is None:
+                errors.append({'id': ['Informe um id válido.']})
+                continue
+            if pk in seen:
+                # Each item is applied on top of the same loaded row, so a
+                # repeated id would lose one update and skew signal handlers
+                errors.append({'id': ['Id repetido na requisição.']})
+                continue
+            seen.add(pk)
+            instance = existing.get(pk)
+            if instance is None:
+                errors.append({'id': ['Objeto não encontrado.']})
+                continue
+            serializer = self.get_serializer(instance, data=item, partial=True)
+            if serializer.is_valid():
+                errors.append({})
+                changes.append((instance, serializer.validated_data))
+            else:
+                errors.append(serializer.errors)
+        if any(errors):
+            return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+        fields, previous = set(), {}
+        for instance, attrs in changes:
+            # attnames (consultant_id, not consultant) so no related row is loaded
+            attnames = [instance._meta.get_field(name).attname for name in attrs]
+            previous[instance.pk] = {attname: getattr(instance, attname) for attname in attnames}
+            for name, value in attrs.items():
+                setattr(instance, name, value)
+            fields.update(attrs)
+        instances = [instance for instance, _ in changes]
+        if fields:
+            model = self.get_queryset().model
+            with transaction.atomic():
+                model.objects.bulk_update(instances, sorted(fields))
+                post_bulk_save.send(
+                    sender=model, instances=instances, created=False,
+                    update_fields=sorted(fields), previous=previous,
+                )
+        return Response(self._bulk_response(instances))
+
+    def bulk_destroy(self, request):
+        ids = request.data.get('ids') if isinstance(request.data, dict) else None
+        if not isinstance(ids, list) or not ids:
+            return Response({'ids': ['Envie uma lista de ids.']}, status=status.HTTP_400_BAD_REQUEST)
+        if len(ids) > self.bulk_max_items:
+            return Response(
+                {'detail': f'Máximo de {self.bulk_max_items} itens por requisição.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        pks = [self._parse_pk(pk) for pk in ids]
+        if None in pks:
+            errors = [[] if pk is not None else ['Informe um id válido.'] for pk in pks]
+            return Response({'ids': errors}, status=status.HTTP_400_BAD_REQUEST)
+        with transaction.atomic():
+            deleted, _ = self.get_queryset().filter(pk__in=pks).delete()
+        return Response({'deleted': deleted})
+
+    def _bulk_response(self, instances):
+        # Re-read through get_queryset so the viewset's joins/prefetches apply
+        fresh = self.get_queryset().in_bulk([instance.pk for instance in instances])
+        ordered = [fresh[instance.pk] for instance in instances if instance.pk in fresh]
+        return self.get_serializer(ordered, many=True).data
+
+
+class ConditionalGetMixin:
+    """
+    ETag/Last-Modified for list and retrieve, derived from
+    ``last_modified_field`` (max over the filtered queryset plus its row count
+    for lists). A matching ``If-None-Match``/``If-Modified-Since`` gets a 304
+    before anything is serialized.
+
+    List responses only honour ``If-None-Match``: a delete lowers the count
+    but not the max timestamp, so Last-Modified alone cannot detect it.
+
+    ``etag_models`` lists the other models whose rows are embedded in the
+    payload without touching ``last_modified_field`` (e.g. the related user
+    behind ``*_details``); their version stamps are part of the ETag.
+    """
+    last_modified_field = None
+    etag_models = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        watch(*cls.etag_models)
+
+    def _validators(self, queryset):
+        stamp = queryset.order_by().aggregate(last=Max(self.last_modified_field), count=Count('pk'))
+        if stamp['last'] is None:
+            return None, None
+        versions = '-'.join(str(version) for version in model_versions(self.etag_models))
+        raw = f"{self.request.get_full_path()}|{stamp['last'].isoformat()}|{stamp['count']}|{versions}"
+        return quote_etag(hashlib.md5(raw.encode()).hexdigest()), int(stamp['last'].timestamp())
+
+    def _conditional(self, etag, last_modified, serve, use_last_modified=True):
+        if etag is None:
+            return serve()
+        not_modified = get_conditional_response(
+            self.request, etag=etag, last_modified=last_modified if use_last_modified else None
+        )
+        response = not_modified or serve()
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        response['Cache-Control'] = 'private, no-cache'
+        return response
+
+    def list(self, request, *args, **kwargs):
+        etag, last_modified = self._validators(self.filter_queryset(self.get_queryset()))
+        return self._conditional(
+            etag, last_modified, lambda: super(ConditionalGetMixin, self).list(request, *args, **kwargs),
+            use_last_modified=False,
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset()).filter(
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        )
+        etag, last_modified = self._validators(queryset)
+        return self._conditional(
+            etag, last_modified, lambda: super(ConditionalGetMixin, self).retrieve(request, *args, **kwargs)
+        )
+
+
+class ExportMixin:
+    """
+    ``/export/csv/`` and ``/export/xlsx/`` on a viewset, honouring the same
+    filters and search as the list.
+
+    ``export_fields`` is a sequence of ``(header, lookup)``; rows are read
+    with ``values_list(...).iterator()`` and streamed, so no model instances
+    are built and memory does not grow with the row count. Under ASGI the
+    stream is wrapped in ``aiterate`` so it is sent as it is written.
+    """
+    export_fields = ()
+    export_filename = None
+
+    @action(detail=False, methods=['get'], url_path=r'export/(?P<file_format>csv|xlsx)')
+    def export(self, request, file_format):
+        queryset = self.filter_queryset(self.get_queryset()).prefetch_related(None).order_by('pk')
+        headers = [header for header, _ in self.export_fields]
+        rows = queryset.values_list(*[lookup for _, lookup in self.export_fields]).iterator(
+            chunk_size=EXPORT_CHUNK_SIZE
+        )
+        if file_format == 'csv':
+            content, content_type = stream_csv(headers, rows), 'text/csv; charset=utf-8'
+        else:
+            content, content_type = stream_xlsx(headers, rows), XLSX_CONTENT_TYPE
+        if isinstance(request._request, ASGIRequest):
+            content = aiterate(content)
+        response = StreamingHttpResponse(content, content_type=content_type)
+        name = self.export_filename or self.get_queryset().model._meta.model_name
+        response['Content-Disposition'] = (
+            f'attachment; filename="{name}-{timezone.localdate():%Y%m%d}.{file_format}"'
+        )
+        return response
+
+
+class CachedResponseMixin:
+    """
+    Cache the data of successful ``list``/``retrieve`` responses in the
+    shared cache, keyed by user (or only role, with ``cache_scope = 'role'``)
+    and the full URL.
+
+    ``cache_models`` lists every model the response is built from; a write
+    to any of them invalidates the cached responses through the signals
+    registered by ``caching.watch``.
+    """
+    cache_models = ()
+    cache_actions = ('list', 'retrieve')
+    cache_scope = 'user'
+    cache_timeout = 60 * 5
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        watch(*cls.cache_models)
+
+    def get_cache_key(self, request):
+        user = request.user
+        owner = getattr(user, 'role_id', None) if self.cache_scope == 'role' else user.pk
+        prefix = f'{type(self).__module__}.{type(self).__name__}.{self.action}'
+        return response_key(
+            prefix, model_versions(self.cache_models),
+            [self.cache_scope, owner, getattr(user, 'role_id', None), request.build_absolute_uri()],
+        )
+
+    def _cached(self, request, handler, *args, **kwargs):
+        if request.method != 'GET' or self.action not in self.cache_actions or not self.cache_models:
+            return handler(request, *args, **kwargs)
+        key = self.get_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            response = Response(data)
+            response['X-Cache'] = 'HIT'
+            return response
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, self.cache_timeout)
+            response['X-Cache'] = 'MISS'
+        return response
+
+    def list(self, request, *args, **kwargs):
+        return self._cached(request, super().list, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached(request, super().retrieve, *args, **kwargs)
@@ -0,0 +1,87 @@
+import time
+from django.core.cache import cache
+from .models import Role
+
+VERSION_KEY = 'core:permissions:version'
+ROLE_VERSION_KEY = 'core:permissions:role:{}'
+USER_VERSION_KEY = 'core:permissions:user:{}'
+TABLE_TIMEOUT = 60 * 60 * 24
+
+# Per-process copy of the role table, reused until the shared version moves
+_local = {'version': None, 'table': {}}
+
+
+def _read_stamps(keys):
+    stamps = cache.get_many(keys)
+    for key in keys:
+        if key not in stamps:
+            # Seed from the clock so an evicted key never reuses an old stamp
+            cache.add(key, time.time_ns(), None)
+            stamps[key] = cache.get(key)
+    return [stamps[key] for key in keys]
+
+
+def _bump(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def permissions_version():
+    """Shared stamp that changes whenever any role's permission set changes."""
+    return _read_stamps([VERSION_KEY])[0]
+
+
+def bump_permissions_version(action=None, **kwargs):
+    if action and action.startswith('pre_'):
+        return  # m2m_changed fires pre_* and post_*; one bump per change
+    _bump(VERSION_KEY)
+
+
+def token_versions(role_id, user_id):
+    """
+    ``(role stamp, user stamp)`` that stateless tokens are issued under: a
+    change to one role or one user only invalidates the tokens it affects.
+    """
+    return tuple(_read_stamps([ROLE_VERSION_KEY.format(role_id), USER_VERSION_KEY.format(user_id)]))
+
+
+def bump_role_version(role_id):
+    _bump(ROLE_VERSION_KEY.format(role_id))
+
+
+def bump_user_version(user_id):
+    _bump(USER_VERSION_KEY.format(user_id))
+
+
+def build_role_table():
+    table = {role_id: set() for role_id in Role.objects.values_list('id', flat=True)}
+    links = Role.permissions.through.objects.values_list('role_id', 'systempermission__key')
+    for role_id, key in links:
+        table[role_id].add(key)
+    return {role_id: frozenset(keys) for role_id, keys in table.items()}
+
+
+def role_table():
+    """``{role_id: frozenset(permission keys)}`` for the current version."""
+    version = permissions_version()
+    if _local['version'] != version:
+        shared_key = f'core:permissions:roles:{version}'
+        table = cache.get(shared_key)
+        if table is None:
+            table = build_role_table()
+            cache.set(shared_key, table, TABLE_TIMEOUT)
+        _local.update(version=version, table=table)
+    return _local['table']
+
+
+def role_permissions(role_id):
+    if role_id is None:
+        return frozenset()
+    return role_table().get(role_id, frozenset())
+
+
+def user_has_permission(user, key):
+    """Whether ``user``'s role grants ``key`` (superusers hold every permission)."""
+    return user.is_superuser or key in role_permissions(user.role_id)
@@ -1,5 +1,34 @@
 from rest_framework import serializers
 from .models import User, Role, SystemPermission
+from .permissions_cache import role_permissions
+
+
+def parse_field_list(value):
+    return {name.strip() for name in (value or '').split(',') if name.strip()}
+
+
+class DynamicFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    Honours ``?fields=`` and ``?expand=`` on GET requests.
+
+    Fields listed in ``Meta.expandable`` are only rendered when named in
+    ``?expand=``; ``?fields=`` keeps just the named columns (plus any expanded
+    relations).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        if request is None or request.method != 'GET':
+            return
+        fields = parse_field_list(request.query_params.get('fields'))
+        expand = parse_field_list(request.query_params.get('expand'))
+        for name in getattr(self.Meta, 'expandable', ()):
+            if name not in expand:
+                self.fields.pop(name, None)
+        if fields:
+            for name in set(self.fields) - fields - expand:
+                self.fields.pop(name)
 
 class SystemPermissionSerializer(serializers.ModelSerializer):
     class Meta:
@@ -14,11 +43,11 @@ class RoleSerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description', 'permissions', 'permissions_details', 'is_system']
 
 class UserSerializer(serializers.ModelSerializer):
-    role_details = RoleSerializer(source='role', read_only=True)
-    
+    # Nested users only carry the role id; clients resolve it against the
+    # /core/roles/ snapshot instead of receiving the permission list every time
     class Meta:
         model = User
-        fields = ['id', 'username', 'email', 'first_name', 'last_name', 'role', 'role_details', 'avatar', 'company_name']
+        fields = ['id', 'username', 'email', 'first_name', 'last_name', 'role', 'avatar', 'company_name']
         extra_kwargs = {'password': {'write_only': True}}
 
     def create(self, validated_data):
@@ -28,3 +57,12 @@ class UserSerializer(serializers.ModelSerializer):
             user.set_password(password)
             user.save()
         return user
+
+class CurrentUserSerializer(UserSerializer):
+    permissions = serializers.SerializerMethodField()
+
+    class Meta(UserSerializer.Meta):
+        fields = UserSerializer.Meta.fields + ['permissions']
+
+    def get_permissions(self, obj):
+        return sorted(role_permissions(obj.role_id))
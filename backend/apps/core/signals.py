@@ -0,0 +1,70 @@
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete, m2m_changed
+from .caching import watch
+from .dashboard import SOURCE_MODELS
+from .models import Role, SystemPermission, User
+from .permissions_cache import bump_permissions_version, bump_role_version, bump_user_version
+
+watch(*SOURCE_MODELS)
+
+m2m_changed.connect(bump_permissions_version, sender=Role.permissions.through, dispatch_uid='permissions-role-m2m')
+for model in (Role, SystemPermission):
+    post_save.connect(bump_permissions_version, sender=model, dispatch_uid=f'permissions-save-{model._meta.label}')
+    post_delete.connect(bump_permissions_version, sender=model, dispatch_uid=f'permissions-delete-{model._meta.label}')
+
+
+# Stateless tokens are stamped with their role's version and their user's
+# version; each change invalidates only the tokens it affects
+
+def bump_role_on_change(sender, instance, **kwargs):
+    bump_role_version(instance.pk)
+
+
+def bump_roles_on_permission_change(sender, instance, created=False, **kwargs):
+    if created:
+        return  # no role has it yet
+    # Permissions are few and rarely edited: refresh every role's tokens
+    for role_id in Role.objects.values_list('pk', flat=True):
+        bump_role_version(role_id)
+
+
+def bump_roles_on_m2m(sender, instance, action, reverse, pk_set=None, **kwargs):
+    if not action.startswith('post_'):
+        return
+    if not reverse:
+        bump_role_version(instance.pk)
+    elif pk_set is not None:
+        for role_id in pk_set:
+            bump_role_version(role_id)
+    else:  # permission.role_set.clear(): the roles are gone from the table already
+        bump_roles_on_permission_change(sender, instance)
+
+
+post_save.connect(bump_role_on_change, sender=Role, dispatch_uid='token-role-save')
+post_delete.connect(bump_role_on_change, sender=Role, dispatch_uid='token-role-delete')
+post_save.connect(bump_roles_on_permission_change, sender=SystemPermission, dispatch_uid='token-permission-save')
+post_delete.connect(bump_roles_on_permission_change, sender=SystemPermission, dispatch_uid='token-permission-delete')
+m2m_changed.connect(bump_roles_on_m2m, sender=Role.permissions.through, dispatch_uid='token-role-m2m')
+
+
+# Stateless tokens embed these; a change must invalidate the user's tokens already issued
+TOKEN_CLAIM_FIELDS = ('role_id', 'is_active', 'is_staff', 'is_superuser', 'username')
+
+
+def bump_on_claims_change(sender, instance, update_fields=None, **kwargs):
+    if instance.pk is None:
+        return
+    if update_fields is not None and not {'role', 'role_id', *TOKEN_CLAIM_FIELDS} & set(update_fields):
+        return
+    previous = sender.objects.filter(pk=instance.pk).values(*TOKEN_CLAIM_FIELDS).first()
+    if previous and any(previous[name] != getattr(instance, name) for name in TOKEN_CLAIM_FIELDS):
+        user_id = instance.pk
+        transaction.on_commit(lambda: bump_user_version(user_id))
+
+
+def bump_on_user_delete(sender, instance, **kwargs):
+    bump_user_version(instance.pk)
+
+
+pre_save.connect(bump_on_claims_change, sender=User, dispatch_uid='permissions-user-claims')
+post_delete.connect(bump_on_user_delete, sender=User, dispatch_uid='permissions-delete-user')
@@ -0,0 +1,148 @@
+import itertools
+from datetime import date
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from apps.clients.models import ClientProfile
+from apps.crm.models import Activity, Deal
+from apps.financial.models import LedgerEntry
+from apps.onboarding.models import OnboardingItem, OnboardingNote, OnboardingTask
+from apps.products.models import Product, WorkflowStep
+from apps.projects.models import Project, ProjectDocument, ProjectMeeting, ProjectNote
+from apps.support.models import Ticket, TicketInteraction
+from apps.tasks.models import SubTask, Task
+from .models import Role, SystemPermission
+
+# Tests run against a private in-memory cache so response caches and version
+# stamps left in the shared file cache by a dev server can't leak in
+TEST_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'tests'}}
+
+_sequence = itertools.count(1)
+
+
+def make_user(**extra):
+    """A user with a unique username, for tests that just need someone to point at."""
+    number = next(_sequence)
+    return get_user_model().objects.create_user(username=f'user{number}', **extra)
+
+
+def make_client():
+    number = next(_sequence)
+    return ClientProfile.objects.create(
+        company_name=f'Cliente {number}', cnpj=f'{number:014d}', responsible_name='Responsável',
+        responsible_phone='11999999999',
+    )
+
+
+def make_role():
+    """A role with one permission, held by one user."""
+    number = next(_sequence)
+    role = Role.objects.create(id=f'role{number}', name=f'Papel {number}')
+    role.permissions.add(SystemPermission.objects.create(key=f'perm{number}', label='Permissão', module='core'))
+    make_user(role=role)
+    return role
+
+
+def make_deal():
+    owner = make_user()
+    deal = Deal.objects.create(
+        title='Diagnóstico', value=1000, stage='Proposta', product_interest='Diagnóstico', company='Empresa',
+        owner=owner,
+    )
+    Activity.objects.create(activity_type='Ligação', title='Retorno', date=timezone.now(), deal=deal, user=owner)
+    return deal
+
+
+def make_ledger_entry():
+    return LedgerEntry.objects.create(
+        ledger_type='credit', amount=100, description='Mensalidade', date=date(2025, 1, 1), consultant=make_user(),
+    )
+
+
+def make_product():
+    product = Product.objects.create(
+        title='Diagnóstico', price=1000, price_model='fixed', description='Diagnóstico de processos',
+        category='Curso', payment_methods='pix',
+    )
+    WorkflowStep.objects.create(product=product, title='Kickoff', step_type='task', relative_days=2)
+    return product
+
+
+def make_project():
+    number = next(_sequence)
+    manager = make_user()
+    project = Project.objects.create(
+        code=f'P{number}', title=f'Projeto {number}', project_type='Diagnóstico', client=make_client(),
+        manager=manager, specialist=make_user(), start_date=date(2025, 1, 1),
+    )
+    ProjectMeeting.objects.create(project=project, title='Kickoff', date=timezone.now(), duration_minutes=30, attendees='Ana')
+    ProjectDocument.objects.create(project=project, title='POP', doc_type='POP', url='https://example.com/pop', uploaded_by=manager)
+    ProjectNote.objects.create(project=project, text='Anotação', note_type='internal', author=manager)
+    return project
+
+
+def make_ticket():
+    opened_by = make_user()
+    ticket = Ticket.objects.create(
+        project=make_project(), title='Erro na importação', description='Notas não importam', ticket_type='Erro',
+        area='TI', priority='Alta', opened_by=opened_by, assigned_to=make_user(),
+    )
+    TicketInteraction.objects.create(ticket=ticket, text='Verificando', sender=opened_by, role='support')
+    return ticket
+
+
+def make_task():
+    task = Task.objects.create(
+        title='Mapear rotina fiscal', project=make_project(), assigned_to=make_user(), due_date=date(2025, 1, 10),
+    )
+    SubTask.objects.create(task=task, title='Levantar obrigações')
+    return task
+
+
+def make_onboarding():
+    consultant = make_user()
+    onboarding = OnboardingItem.objects.create(client=make_client(), start_date=date(2025, 1, 1), consultant=consultant)
+    OnboardingTask.objects.create(onboarding=onboarding, title='Enviar contrato', assigned_to=consultant)
+    OnboardingNote.objects.create(onboarding=onboarding, text='Cliente pediu reunião', user=consultant)
+    return onboarding
+
+
+class QueryBudgetMixin:
+    """
+    Assertions for ``APITestCase`` subclasses that pin how many SQL queries an
+    endpoint issues, so a missing ``select_related``/``prefetch_related``
+    fails the build instead of slowing production down.
+    """
+
+    def setUp(self):
+        super().setUp()
+        # The search backend probes the schema once per process; keep that out of the counts
+        from apps.search.backends import get_backend
+        get_backend()
+
+    def _count_queries(self, url, **extra):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, **extra)
+        self.assertEqual(response.status_code, 200, getattr(response, 'data', response))
+        return ctx
+
+    def assertQueryBudget(self, url, budget, **extra):
+        ctx = self._count_queries(url, **extra)
+        if len(ctx) > budget:
+            queries = '\n'.join(q['sql'] for q in ctx.captured_queries)
+            self.fail(f"GET {url} ran {len(ctx)} queries (budget {budget}):\n{queries}")
+
+    def assertConstantQueries(self, url, grow, budget=None, **extra):
+        """
+        Fetch ``url``, call ``grow()`` to add more rows, fetch again and
+        require the same query count both times (and at most ``budget``).
+        """
+        before = len(self._count_queries(url, **extra))
+        grow()
+        ctx = self._count_queries(url, **extra)
+        queries = '\n'.join(q['sql'] for q in ctx.captured_queries)
+        if len(ctx) != before:
+            self.fail(f"GET {url} went from {before} to {len(ctx)} queries as rows grew:\n{queries}")
+        if budget is not None and len(ctx) > budget:
+            self.fail(f"GET {url} ran {len(ctx)} queries (budget {budget}):\n{queries}")
@@ -0,0 +1,201 @@
+import asyncio
+from datetime import date
+from unittest import mock
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIHandler
+from django.core.signals import request_finished
+from django.db import close_old_connections, transaction
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+from apps.crm.models import Deal
+from apps.financial.models import LedgerEntry
+from .authentication import StatelessJWTAuthentication, stamp_claims
+from .caching import model_versions
+from .dashboard import SOURCE_MODELS, get_company_kpis
+from .export import stream_csv
+from .models import Role, SystemPermission
+from .testing import (
+    TEST_CACHES, QueryBudgetMixin, make_deal, make_ledger_entry, make_onboarding, make_product, make_project, make_role,
+    make_task, make_ticket, make_user,
+)
+
+N = 5
+EXPAND_PROJECT = 'client_details,manager_details,specialist_details,meetings,documents,notes'
+
+# (list URL, factory adding one row, list budget, detail budget). The detail URL
+# is the list path plus the pk of the object the factory returns.
+QUERY_BUDGETS = [
+    ('/api/core/users/', lambda: make_user(role=make_role()), 1, 1),
+    ('/api/core/roles/', make_role, 2, 2),
+    ('/api/crm/deals/?expand=owner_details', make_deal, 1, 1),
+    ('/api/crm/activities/', lambda: make_deal().activities.get(), 1, 1),
+    ('/api/financial/ledger/', make_ledger_entry, 1, 1),
+    ('/api/onboarding/items/?expand=tasks,notes,client_details,consultant_details', make_onboarding, 3, 3),
+    ('/api/onboarding/notes/', lambda: make_onboarding().notes.get(), 1, 1),
+    ('/api/products/products/', make_product, 2, 2),
+    ('/api/projects/projects/', make_project, 2, 5),
+    (f'/api/projects/projects/?expand={EXPAND_PROJECT}', make_project, 5, 5),
+    ('/api/projects/documents/', lambda: make_project().documents.get(), 1, 1),
+    ('/api/projects/notes/', lambda: make_project().notes.get(), 1, 1),
+    ('/api/support/tickets/?expand=interactions,opened_by_details,assigned_to_details', make_ticket, 3, 3),
+    ('/api/support/interactions/', lambda: make_ticket().interactions.get(), 1, 1),
+    ('/api/tasks/all/?expand=subtasks,assigned_to_details', make_task, 2, 2),
+]
+
+
+@override_settings(CACHES=TEST_CACHES)
+class QueryBudgetTests(QueryBudgetMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(make_user())
+
+    def test_list_and_detail_budgets(self):
+        for list_url, factory, list_budget, detail_budget in QUERY_BUDGETS:
+            path, _, query = list_url.partition('?')
+            with self.subTest(list_url), transaction.atomic():
+                cache.clear()
+                def add_rows():
+                    for _ in range(N):
+                        factory()
+                add_rows()
+                self.assertConstantQueries(list_url, add_rows, budget=list_budget)
+                detail_url = f'{path}{factory().pk}/' + (f'?{query}' if query else '')
+                self.assertQueryBudget(detail_url, detail_budget)
+                transaction.set_rollback(True)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class CompanyKPITests(APITestCase):
+    def setUp(self):
+        cache.clear()
+
+    def add_won_deal(self):
+        Deal.objects.create(
+            title='Assessoria', value=500, stage='Ganho', product_interest='Assessoria', company='Empresa',
+            owner=make_user(),
+        )
+
+    def test_write_invalidates_cached_kpis(self):
+        self.assertEqual(get_company_kpis()['sales']['won_count'], 0)
+        self.add_won_deal()
+        self.assertEqual(get_company_kpis()['sales']['won_count'], 1)
+
+    def test_versions_bumped_again_on_commit(self):
+        before = model_versions(SOURCE_MODELS)
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.add_won_deal()
+        during = model_versions(SOURCE_MODELS)
+        self.assertNotEqual(before, during)
+        for callback in callbacks:
+            callback()
+        self.assertNotEqual(during, model_versions(SOURCE_MODELS))
+
+
+@override_settings(CACHES=TEST_CACHES, STATELESS_JWT_VERSION_TTL=0)
+class StatelessJWTTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.consultant = Role.objects.create(id='consultant', name='Consultor')
+        self.support = Role.objects.create(id='support', name='Suporte')
+
+    def token_for(self, user):
+        return AccessToken(str(stamp_claims(AccessToken.for_user(user), user)))
+
+    def authenticates(self, token):
+        try:
+            StatelessJWTAuthentication().get_user(token)
+        except AuthenticationFailed:
+            return False
+        return True
+
+    def test_user_built_from_claims(self):
+        user = make_user(role=self.consultant)
+        with self.assertNumQueries(0):
+            built = StatelessJWTAuthentication().get_user(self.token_for(user))
+        self.assertEqual((built.pk, built.role_id, built.is_active), (user.pk, 'consultant', True))
+
+    def test_deactivated_user_is_refused(self):
+        user = make_user(role=self.consultant)
+        token = self.token_for(user)
+        with self.captureOnCommitCallbacks(execute=True):
+            user.is_active = False
+            user.save()
+        self.assertFalse(self.authenticates(token))
+        self.assertFalse(self.authenticates(self.token_for(user)))
+
+    def test_user_change_only_invalidates_that_user(self):
+        changed, other = make_user(role=self.consultant), make_user(role=self.consultant)
+        changed_token, other_token = self.token_for(changed), self.token_for(other)
+        with self.captureOnCommitCallbacks(execute=True):
+            changed.role = self.support
+            changed.save()
+        self.assertFalse(self.authenticates(changed_token))
+        self.assertTrue(self.authenticates(other_token))
+
+    def test_role_change_only_invalidates_that_role(self):
+        consultant, support = make_user(role=self.consultant), make_user(role=self.support)
+        consultant_token, support_token = self.token_for(consultant), self.token_for(support)
+        self.consultant.permissions.add(SystemPermission.objects.create(key='crm.view', label='Ver CRM', module='crm'))
+        self.assertFalse(self.authenticates(consultant_token))
+        self.assertTrue(self.authenticates(support_token))
+
+
+class ExportStreamingTests(APITestCase):
+    def setUp(self):
+        self.token = str(AccessToken.for_user(make_user()))
+        LedgerEntry.objects.bulk_create(
+            LedgerEntry(ledger_type='credit', amount=day, description='Mensalidade', date=date(2025, 1, day))
+            for day in range(1, 11)
+        )
+        # The ASGI handler would close the test transaction's connection
+        request_finished.disconnect(close_old_connections)
+        self.addCleanup(request_finished.connect, close_old_connections)
+
+    async def asgi_get(self, path, on_body):
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+            'scheme': 'http', 'path': path, 'raw_path': path.encode(), 'query_string': b'', 'root_path': '',
+            'headers': [(b'host', b'testserver'), (b'authorization', f'Bearer {self.token}'.encode())],
+            'client': ('127.0.0.1', 1234), 'server': ('testserver', 80),
+        }
+        requested = False
+
+        async def receive():
+            nonlocal requested
+            if not requested:
+                requested = True
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+            await asyncio.Future()  # the client never disconnects
+
+        messages = []
+
+        async def send(message):
+            if message['type'] == 'http.response.body':
+                on_body()
+            messages.append(message)
+
+        await ASGIHandler()(scope, receive, send)
+        return messages
+
+    def test_csv_export_streams_under_asgi(self):
+        written, written_before_first_send = [], []
+
+        def small_chunks(headers, rows):
+            for chunk in stream_csv(headers, rows, chunk_size=3):
+                written.append(chunk)
+                yield chunk
+
+        with mock.patch('apps.core.mixins.stream_csv', small_chunks):
+            messages = async_to_sync(self.asgi_get)(
+                '/api/financial/ledger/export/csv/', lambda: written_before_first_send.append(len(written)),
+            )
+
+        self.assertEqual(messages[0]['status'], 200)
+        self.assertGreater(len(written), 2)
+        # The first piece left before the rest of the file was written
+        self.assertEqual(written_before_first_send[0], 1)
+        body = b''.join(message.get('body', b'') for message in messages[1:]).decode()
+        self.assertEqual(body.count('\r\n'), 11)
@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import UserViewSet, RoleViewSet, SystemPermissionViewSet
+from .views import UserViewSet, RoleViewSet, SystemPermissionViewSet, DashboardView
 
 router = DefaultRouter()
 router.register(r'users', UserViewSet)
@@ -8,5 +8,6 @@ router.register(r'roles', RoleViewSet)
 router.register(r'permissions', SystemPermissionViewSet)
 
 urlpatterns = [
+    path('dashboard/', DashboardView.as_view(), name='dashboard'),
     path('', include(router.urls)),
 ]
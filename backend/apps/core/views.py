@@ -1,25 +1,50 @@
 from rest_framework import viewsets, permissions
+from rest_framework.views import APIView
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from .models import User, Role, SystemPermission
-from .serializers import UserSerializer, RoleSerializer, SystemPermissionSerializer
+from .serializers import UserSerializer, CurrentUserSerializer, RoleSerializer, SystemPermissionSerializer
+from .dashboard import get_company_kpis
+from .permissions_cache import permissions_version
+from .mixins import CachedResponseMixin
+from apps.metrics.mixins import SerializerTimingMixin
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(SerializerTimingMixin, viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     @action(detail=False, methods=['get'])
     def me(self, request):
-        serializer = self.get_serializer(request.user)
+        user = request.user
+        if user.get_deferred_fields():
+            # Built from token claims (stateless JWT): load the profile in one query
+            user = User.objects.get(pk=user.pk)
+        serializer = CurrentUserSerializer(user, context=self.get_serializer_context())
         return Response(serializer.data)
 
-class RoleViewSet(viewsets.ModelViewSet):
-    queryset = Role.objects.all()
+class RoleViewSet(SerializerTimingMixin, CachedResponseMixin, viewsets.ModelViewSet):
+    queryset = Role.objects.prefetch_related('permissions')
     serializer_class = RoleSerializer
     permission_classes = [permissions.IsAuthenticated]
+    # A handful of rows, fetched once per session as a single snapshot
+    pagination_class = None
+    cache_models = (Role, SystemPermission)
+    cache_scope = 'role'
+    cache_timeout = 60 * 60 * 24
 
-class SystemPermissionViewSet(viewsets.ReadOnlyModelViewSet):
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        response['X-Permissions-Version'] = str(permissions_version())
+        return response
+
+class SystemPermissionViewSet(SerializerTimingMixin, viewsets.ReadOnlyModelViewSet):
     queryset = SystemPermission.objects.all()
     serializer_class = SystemPermissionSerializer
     permission_classes = [permissions.IsAuthenticated]
+
+class DashboardView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        return Response(get_company_kpis())
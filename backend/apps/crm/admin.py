@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Lead, Deal, Activity
+from .models import Lead, Deal, DealStageTransition, Activity
 
 class ActivityInline(admin.TabularInline):
     model = Activity
@@ -10,6 +10,18 @@ class DealAdmin(admin.ModelAdmin):
     list_filter = ('stage', 'owner')
     inlines = [ActivityInline]
 
+class DealStageTransitionAdmin(admin.ModelAdmin):
+    list_display = ('deal', 'from_stage', 'to_stage', 'changed_at')
+    list_filter = ('to_stage',)
+
+    # Append-only: rows are written by the Deal signals
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
 admin.site.register(Lead)
 admin.site.register(Deal, DealAdmin)
+admin.site.register(DealStageTransition, DealStageTransitionAdmin)
 admin.site.register(Activity)
@@ -0,0 +1,223 @@
+"""
+Pipeline analytics from the stage transition log (``/api/crm/pipeline/analytics/``).
+
+For a calendar period (``2026``, ``2026-Q3`` or ``2026-07``):
+
+- funnel: of the deals that entered the pipeline in the period, how many
+  reached each stage (skipped stages count as reached) and the conversion to
+  the next one;
+- stages: days spent in each stage, for stage exits within the period. The
+  exit time is the next transition of the same deal, found with a ``LEAD``
+  window over the log;
+- velocity: win rate, average won value and sales cycle of deals closed in
+  the period, combined into expected won value per day;
+- owners: open pipeline per owner, weighted by stage probability and ranked
+  with a ``RANK`` window. This part is a snapshot of the current board.
+
+Results are cached per period against the Deal and DealStageTransition
+version stamps, so any deal write invalidates them.
+"""
+import re
+import statistics
+from collections import Counter
+from datetime import date, datetime, time
+from decimal import Decimal
+from django.core.cache import cache
+from django.db.models import Case, Count, DecimalField, F, IntegerField, Max, Min, Q, Sum, Value, When, Window
+from django.db.models.functions import Lead, Rank
+from django.utils import timezone
+from apps.core.caching import model_versions
+from .models import Deal, DealStageTransition
+
+# Stages in pipeline order; 'Perdido' can follow any of them
+PIPELINE = ('Lead', 'Contato', 'Proposta', 'Negociação', 'Ganho')
+OPEN_STAGES = PIPELINE[:-1]
+CLOSED_STAGES = ('Ganho', 'Perdido')
+# Chance of closing, used to weight the open pipeline
+STAGE_PROBABILITY = {
+    'Lead': Decimal('0.10'),
+    'Contato': Decimal('0.20'),
+    'Proposta': Decimal('0.40'),
+    'Negociação': Decimal('0.70'),
+}
+CACHE_TIMEOUT = 60 * 15
+# Past periods only change when old deals are edited or deleted
+CLOSED_PERIOD_CACHE_TIMEOUT = 60 * 60 * 24
+SECONDS_PER_DAY = 86400
+
+
+class Period:
+    def __init__(self, key, first_day, next_first_day):
+        self.key = key
+        self.start = timezone.make_aware(datetime.combine(first_day, time.min))
+        self.end = timezone.make_aware(datetime.combine(next_first_day, time.min))
+
+    @property
+    def closed(self):
+        return self.end <= timezone.now()
+
+
+def _month_after(year, month):
+    return date(year + month // 12, month % 12 + 1, 1)
+
+
+def parse_period(value=None):
+    """``YYYY``, ``YYYY-Qn`` or ``YYYY-MM``; defaults to the current quarter. Raises ValueError."""
+    if not value:
+        today = timezone.localdate()
+        value = f'{today.year}-Q{(today.month - 1) // 3 + 1}'
+    if match := re.fullmatch(r'(\d{4})', value):
+        year = int(match.group(1))
+        return Period(value, date(year, 1, 1), date(year + 1, 1, 1))
+    if match := re.fullmatch(r'(\d{4})-Q([1-4])', value, re.IGNORECASE):
+        year, quarter = int(match.group(1)), int(match.group(2))
+        return Period(value.upper(), date(year, quarter * 3 - 2, 1), _month_after(year, quarter * 3))
+    if match := re.fullmatch(r'(\d{4})-(\d{2})', value):
+        year, month = int(match.group(1)), int(match.group(2))
+        if 1 <= month <= 12:
+            return Period(value, date(year, month, 1), _month_after(year, month))
+    raise ValueError(value)
+
+
+def _in(period, field='changed_at'):
+    return Q(**{f'{field}__gte': period.start, f'{field}__lt': period.end})
+
+
+def _ratio(part, whole):
+    return round(part / whole, 4) if whole else None
+
+
+def funnel(period):
+    cohort = DealStageTransition.objects.filter(_in(period), from_stage='').values('deal_id')
+    rank = Case(*[When(to_stage=stage, then=Value(index)) for index, stage in enumerate(PIPELINE)],
+                output_field=IntegerField())
+    deepest = Counter()
+    lost = 0
+    rows = (
+        DealStageTransition.objects.filter(deal_id__in=cohort).values('deal_id')
+        .annotate(top=Max(rank), lost=Count('id', filter=Q(to_stage='Perdido')))
+    )
+    for row in rows:
+        # A deal created straight into 'Perdido' still entered at the first stage
+        deepest[row['top'] or 0] += 1
+        lost += bool(row['lost'])
+    stages = []
+    reached = sum(deepest.values())
+    for index, stage in enumerate(PIPELINE):
+        stages.append({'stage': stage, 'reached': reached})
+        reached -= deepest[index]
+    for current, following in zip(stages, stages[1:]):
+        current['conversion'] = _ratio(following['reached'], current['reached'])
+    stages[-1]['conversion'] = None
+    return {'entered': stages[0]['reached'], 'lost': lost, 'stages': stages}
+
+
+def stage_durations(period):
+    touched = DealStageTransition.objects.filter(_in(period)).values('deal_id')
+    # The window must see each deal's whole history, so it runs before the
+    # period filter (on the window column, applied to the windowed rows)
+    exits = (
+        DealStageTransition.objects.filter(deal_id__in=touched)
+        .annotate(left_at=Window(Lead('changed_at'), partition_by=[F('deal_id')], order_by=[F('changed_at'), F('id')]))
+        .filter(left_at__gte=period.start, left_at__lt=period.end)
+        .values_list('to_stage', 'changed_at', 'left_at')
+    )
+    durations = {}
+    for stage, entered_at, left_at in exits:
+        durations.setdefault(stage, []).append((left_at - entered_at).total_seconds() / SECONDS_PER_DAY)
+    return [
+        {
+            'stage': stage,
+            'exits': len(durations.get(stage, [])),
+            'median_days': round(statistics.median(durations[stage]), 1) if stage in durations else None,
+            'avg_days': round(statistics.fmean(durations[stage]), 1) if stage in durations else None,
+        }
+        for stage in OPEN_STAGES
+    ]
+
+
+def velocity(period, entered):
+    # The latest closing transition in the period decides won or lost
+    outcomes = {}
+    closings = (
+        DealStageTransition.objects.filter(_in(period), to_stage__in=CLOSED_STAGES)
+        .order_by('changed_at', 'id').values_list('deal_id', 'to_stage', 'changed_at')
+    )
+    for deal_id, stage, changed_at in closings:
+        outcomes[deal_id] = (stage, changed_at)
+    won = [deal_id for deal_id, (stage, _) in outcomes.items() if stage == 'Ganho']
+    started = dict(
+        DealStageTransition.objects.filter(deal_id__in=won).values('deal_id')
+        .annotate(first=Min('changed_at')).values_list('deal_id', 'first')
+    )
+    cycles = [outcomes[deal_id][1] - started[deal_id] for deal_id in won if deal_id in started]
+    won_value = Deal.objects.filter(pk__in=won).aggregate(total=Sum('value', default=0))['total']
+    win_rate = _ratio(len(won), len(outcomes))
+    average = (won_value / len(won)).quantize(Decimal('0.01')) if won else None
+    cycle_days = round(statistics.median(c.total_seconds() for c in cycles) / SECONDS_PER_DAY, 1) if cycles else None
+    per_day = None
+    if average is not None and cycle_days:
+        per_day = (entered * average * Decimal(str(win_rate)) / Decimal(str(cycle_days))).quantize(Decimal('0.01'))
+    return {
+        'won': len(won),
+        'lost': len(outcomes) - len(won),
+        'win_rate': win_rate,
+        'won_value': won_value,
+        'avg_won_value': average,
+        'cycle_days': cycle_days,
+        'value_per_day': per_day,
+    }
+
+
+def owners():
+    weighted = Sum(
+        Case(
+            *[When(stage=stage, then=F('value') * Value(probability)) for stage, probability in STAGE_PROBABILITY.items()],
+            output_field=DecimalField(max_digits=14, decimal_places=4),
+        )
+    )
+    rows = list(
+        Deal.objects.filter(stage__in=OPEN_STAGES)
+        .values('owner', 'owner__first_name', 'owner__username')
+        .annotate(
+            open_deals=Count('id'),
+            open_value=Sum('value'),
+            weighted_value=weighted,
+            rank=Window(Rank(), order_by=weighted.desc()),
+        )
+        .order_by('rank', 'owner')
+    )
+    total = sum(row['weighted_value'] for row in rows)
+    return [
+        {
+            'owner': row['owner'],
+            'name': row['owner__first_name'] or row['owner__username'] or 'Não atribuído',
+            'open_deals': row['open_deals'],
+            'open_value': row['open_value'],
+            'weighted_value': row['weighted_value'].quantize(Decimal('0.01')),
+            'share': _ratio(row['weighted_value'], total),
+            'rank': row['rank'],
+        }
+        for row in rows
+    ]
+
+
+def compute_pipeline_analytics(period):
+    entered = funnel(period)
+    return {
+        'period': {'key': period.key, 'start': period.start, 'end': period.end},
+        'funnel': entered,
+        'stages': stage_durations(period),
+        'velocity': velocity(period, entered['entered']),
+        'owners': owners(),
+    }
+
+
+def get_pipeline_analytics(period):
+    versions = model_versions([Deal, DealStageTransition])
+    key = f'crm:pipeline:{period.key}:{"-".join(str(v) for v in versions)}'
+    data = cache.get(key)
+    if data is None:
+        data = compute_pipeline_analytics(period)
+        cache.set(key, data, CLOSED_PERIOD_CACHE_TIMEOUT if period.closed else CACHE_TIMEOUT)
+    return data
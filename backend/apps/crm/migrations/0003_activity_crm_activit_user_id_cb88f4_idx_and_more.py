@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0002_alter_activity_date_alter_deal_created_at_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activity',
+            index=models.Index(fields=['user', 'date'], name='crm_activit_user_id_cb88f4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='deal',
+            index=models.Index(fields=['owner', 'stage'], name='crm_deal_owner_i_4deb1d_idx'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:29
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def backfill_entries(apps, schema_editor):
+    # Earlier stage changes were overwritten; each deal starts with its current stage
+    Deal = apps.get_model('crm', 'Deal')
+    DealStageTransition = apps.get_model('crm', 'DealStageTransition')
+    rows = (
+        DealStageTransition(deal_id=pk, to_stage=stage, changed_at=created_at)
+        for pk, stage, created_at in Deal.objects.values_list('pk', 'stage', 'created_at').iterator()
+    )
+    DealStageTransition.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0004_activity_google_event_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DealStageTransition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_stage', models.CharField(blank=True, choices=[('Lead', 'Lead'), ('Contato', 'Contato'), ('Proposta', 'Proposta'), ('Negociação', 'Negociação'), ('Ganho', 'Ganho'), ('Perdido', 'Perdido')], max_length=20)),
+                ('to_stage', models.CharField(choices=[('Lead', 'Lead'), ('Contato', 'Contato'), ('Proposta', 'Proposta'), ('Negociação', 'Negociação'), ('Ganho', 'Ganho'), ('Perdido', 'Perdido')], max_length=20)),
+                ('changed_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('deal', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stage_transitions', to='crm.deal')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['deal', 'changed_at'], name='crm_dealsta_deal_id_3994fc_idx'), models.Index(fields=['to_stage', 'changed_at'], name='crm_dealsta_to_stag_5e646e_idx')],
+            },
+        ),
+        migrations.RunPython(backfill_entries, migrations.RunPython.noop),
+    ]
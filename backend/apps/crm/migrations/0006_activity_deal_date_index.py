@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('crm', '0005_dealstagetransition'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='activity',
+            index=models.Index(fields=['deal', 'date'], name='crm_activit_deal_id_b2f615_idx'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 
 class Lead(models.Model):
     STATUS_CHOICES = [
@@ -13,7 +14,7 @@ class Lead(models.Model):
     email = models.EmailField()
     phone = models.CharField(max_length=20)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='Novo')
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
     def __str__(self):
         return self.name
@@ -34,11 +35,32 @@ class Deal(models.Model):
     product_interest = models.CharField(max_length=255)
     company = models.CharField(max_length=255) # Or ForeignKey to ClientProfile if converted
     owner = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['owner', 'stage']),
+        ]
 
     def __str__(self):
         return self.title
 
+class DealStageTransition(models.Model):
+    """Append-only log of stage changes; a deal's first row (from_stage '') is its entry into the pipeline."""
+    deal = models.ForeignKey(Deal, on_delete=models.CASCADE, related_name='stage_transitions')
+    from_stage = models.CharField(max_length=20, choices=Deal.STAGE_CHOICES, blank=True)
+    to_stage = models.CharField(max_length=20, choices=Deal.STAGE_CHOICES)
+    changed_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['deal', 'changed_at']),
+            models.Index(fields=['to_stage', 'changed_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.deal_id}: {self.from_stage or '-'} -> {self.to_stage}"
+
 class Activity(models.Model):
     TYPE_CHOICES = [
         ('Prospecção Novo Lead', 'Prospecção Novo Lead'),
@@ -56,7 +78,7 @@ class Activity(models.Model):
     activity_type = models.CharField(max_length=50, choices=TYPE_CHOICES)
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True)
-    date = models.DateTimeField()
+    date = models.DateTimeField(db_index=True)
     duration_minutes = models.IntegerField(default=30)
     
     deal = models.ForeignKey(Deal, on_delete=models.CASCADE, null=True, blank=True, related_name='activities')
@@ -64,6 +86,14 @@ class Activity(models.Model):
     
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     is_google_event = models.BooleanField(default=False)
+    google_event_id = models.CharField(max_length=255, blank=True, null=True, db_index=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'date']),
+            # Deal timeline pages and the next pending activity per deal
+            models.Index(fields=['deal', 'date']),
+        ]
 
     def __str__(self):
         return f"{self.activity_type} - {self.title}"
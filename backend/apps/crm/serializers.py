@@ -1,6 +1,9 @@
+from datetime import timezone as dt_timezone
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from rest_framework import serializers
 from .models import Lead, Deal, Activity
-from apps.core.serializers import UserSerializer
+from apps.core.serializers import UserSerializer, DynamicFieldsModelSerializer
 
 class LeadSerializer(serializers.ModelSerializer):
     class Meta:
@@ -14,10 +17,28 @@ class ActivitySerializer(serializers.ModelSerializer):
         model = Activity
         fields = '__all__'
 
-class DealSerializer(serializers.ModelSerializer):
+class DealSerializer(DynamicFieldsModelSerializer):
     owner_details = UserSerializer(source='owner', read_only=True)
-    activities = ActivitySerializer(many=True, read_only=True)
-    
+    # Annotated by DealViewSet; the activities themselves are paged by /deals/{id}/timeline/
+    activity_count = serializers.IntegerField(read_only=True, default=0)
+    next_activity = serializers.SerializerMethodField()
+
     class Meta:
         model = Deal
         fields = '__all__'
+
+    def get_next_activity(self, deal):
+        data = getattr(deal, 'next_activity_data', None)
+        if not data:
+            return None
+        # Built by JSON_OBJECT in the database, so the date arrives as text
+        date = parse_datetime(data['date'])
+        if timezone.is_naive(date):
+            date = timezone.make_aware(date, dt_timezone.utc)
+        return {**data, 'date': serializers.DateTimeField().to_representation(date)}
+
+class DealListSerializer(DealSerializer):
+    owner_name = serializers.ReadOnlyField(source='owner.username')
+
+    class Meta(DealSerializer.Meta):
+        expandable = ('owner_details',)
@@ -0,0 +1,39 @@
+from django.db.models.signals import pre_save, post_save
+from django.dispatch import receiver
+from apps.core.bulk import post_bulk_save
+from apps.core.caching import watch
+from .models import Deal, DealStageTransition
+
+# Pipeline analytics are cached per period and built from both tables
+watch(Deal, DealStageTransition)
+
+
+@receiver(pre_save, sender=Deal)
+def remember_previous_stage(sender, instance, raw=False, update_fields=None, **kwargs):
+    instance._previous_stage = None
+    if instance.pk and not raw and (update_fields is None or 'stage' in update_fields):
+        instance._previous_stage = Deal.objects.filter(pk=instance.pk).values_list('stage', flat=True).first()
+
+
+@receiver(post_save, sender=Deal)
+def log_stage_change(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, '_previous_stage', None)
+    if created:
+        DealStageTransition.objects.create(deal=instance, to_stage=instance.stage, changed_at=instance.created_at)
+    elif previous is not None and previous != instance.stage:
+        DealStageTransition.objects.create(deal=instance, from_stage=previous, to_stage=instance.stage)
+
+
+@receiver(post_bulk_save, sender=Deal)
+def log_stage_changes_in_bulk(sender, instances, created, previous, **kwargs):
+    if created:
+        rows = [DealStageTransition(deal=deal, to_stage=deal.stage, changed_at=deal.created_at) for deal in instances]
+    else:
+        rows = [
+            DealStageTransition(deal=deal, from_stage=previous[deal.pk]['stage'], to_stage=deal.stage)
+            for deal in instances
+            if 'stage' in previous.get(deal.pk, {}) and previous[deal.pk]['stage'] != deal.stage
+        ]
+    DealStageTransition.objects.bulk_create(rows)
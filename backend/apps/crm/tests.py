@@ -0,0 +1,32 @@
+from datetime import datetime, timedelta, timezone
+from rest_framework.test import APITestCase
+from apps.core.testing import QueryBudgetMixin, make_deal, make_user
+from .models import Activity
+
+
+class TimelineTests(QueryBudgetMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(make_user())
+        self.deal = make_deal()
+        start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for day in range(1, 6):
+            Activity.objects.create(
+                activity_type='Ligação', title=f'Retorno {day}', date=start + timedelta(days=day), deal=self.deal,
+                user=make_user(),
+            )
+        self.url = f'/api/crm/deals/{self.deal.pk}/timeline/'
+
+    def test_newest_first_over_pages(self):
+        titles = []
+        url = f'{self.url}?page_size=4'
+        while url:
+            data = self.client.get(url).data
+            titles += [activity['title'] for activity in data['results']]
+            url = data['next']
+        # make_deal's own activity is dated now
+        self.assertEqual(titles, ['Retorno'] + [f'Retorno {day}' for day in range(5, 0, -1)])
+
+    def test_user_names_in_constant_queries(self):
+        self.assertQueryBudget(self.url, 2)
+        self.assertTrue(all(activity['user_name'] for activity in self.client.get(self.url).data['results']))
@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import LeadViewSet, DealViewSet, ActivityViewSet
+from .views import LeadViewSet, DealViewSet, ActivityViewSet, PipelineAnalyticsView
 
 router = DefaultRouter()
 router.register(r'leads', LeadViewSet)
@@ -8,5 +8,6 @@ router.register(r'deals', DealViewSet)
 router.register(r'activities', ActivityViewSet)
 
 urlpatterns = [
+    path('pipeline/analytics/', PipelineAnalyticsView.as_view(), name='pipeline-analytics'),
     path('', include(router.urls)),
 ]
@@ -1,23 +1,94 @@
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce, JSONObject
+from django.shortcuts import get_object_or_404
 from rest_framework import viewsets, permissions
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from apps.core.pagination import CreatedAtCursorPagination, DateCursorPagination
+from .analytics import get_pipeline_analytics, parse_period
 from .models import Lead, Deal, Activity
-from .serializers import LeadSerializer, DealSerializer, ActivitySerializer
+from apps.core.mixins import SparseFieldsetMixin, ExportMixin
+from .serializers import LeadSerializer, DealSerializer, DealListSerializer, ActivitySerializer
+from apps.metrics.mixins import SerializerTimingMixin
 
-class LeadViewSet(viewsets.ModelViewSet):
+class LeadViewSet(SerializerTimingMixin, viewsets.ModelViewSet):
     queryset = Lead.objects.all()
     serializer_class = LeadSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
     filterset_fields = ['status']
     search_fields = ['name', 'company', 'email']
 
-class DealViewSet(viewsets.ModelViewSet):
+def annotate_activity_count():
+    counts = Activity.objects.filter(deal=OuterRef('pk')).order_by().values('deal').annotate(n=Count('id')).values('n')
+    return {'activity_count': Coalesce(Subquery(counts), 0)}
+
+def annotate_next_activity():
+    # Earliest pending activity, overdue ones included; one index seek on (deal, date) per deal
+    pending = Activity.objects.filter(deal=OuterRef('pk'), status='pending').order_by('date', 'id')
+    summary = JSONObject(id='id', title='title', activity_type='activity_type', date='date')
+    return {'next_activity_data': Subquery(pending.values(data=summary)[:1])}
+
+class TimelinePagination(DateCursorPagination):
+    """Newest first; ``?before=`` is the cursor from the previous page's ``next``."""
+    cursor_query_param = 'before'
+    page_size = 20
+    max_page_size = 100
+
+class DealViewSet(SerializerTimingMixin, SparseFieldsetMixin, ExportMixin, viewsets.ModelViewSet):
     queryset = Deal.objects.all()
     serializer_class = DealSerializer
+    list_serializer_class = DealListSerializer
+    select_related_fields = {
+        'owner_name': ['owner'],
+        'owner_details': ['owner'],
+    }
+    annotated_fields = {
+        'activity_count': annotate_activity_count,
+        'next_activity': annotate_next_activity,
+    }
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
     filterset_fields = ['stage', 'owner']
     search_fields = ['title', 'company']
+    export_filename = 'negocios'
+    export_fields = (
+        ('Título', 'title'),
+        ('Empresa', 'company'),
+        ('Produto de interesse', 'product_interest'),
+        ('Valor', 'value'),
+        ('Etapa', 'stage'),
+        ('Responsável', 'owner__username'),
+        ('Criado em', 'created_at'),
+    )
+
+    @action(detail=True, methods=['get'])
+    def timeline(self, request, pk=None):
+        """The deal's activities, newest first, keyset-paginated by (date, id)."""
+        deal = get_object_or_404(Deal.objects.only('pk'), pk=pk)
+        paginator = TimelinePagination()
+        # ActivitySerializer renders user_name
+        page = paginator.paginate_queryset(
+            Activity.objects.filter(deal=deal).select_related('user'), request, view=self,
+        )
+        return paginator.get_paginated_response(ActivitySerializer(page, many=True).data)
 
-class ActivityViewSet(viewsets.ModelViewSet):
-    queryset = Activity.objects.all()
+class ActivityViewSet(SerializerTimingMixin, viewsets.ModelViewSet):
+    queryset = Activity.objects.select_related('user')
     serializer_class = ActivitySerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = DateCursorPagination
     filterset_fields = ['status', 'user', 'deal']
+
+class PipelineAnalyticsView(APIView):
+    """Funnel, time in stage, velocity and weighted pipeline for ``?period=`` (YYYY, YYYY-Qn or YYYY-MM)."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        try:
+            period = parse_period(request.query_params.get('period'))
+        except ValueError:
+            raise ValidationError({'period': 'Use AAAA, AAAA-Qn ou AAAA-MM.'})
+        return Response(get_pipeline_analytics(period))
@@ -1,8 +1,14 @@
 from django.contrib import admin
-from .models import LedgerEntry
+from .models import LedgerEntry, LedgerMonthlyRollup
 
 class LedgerEntryAdmin(admin.ModelAdmin):
     list_display = ('description', 'ledger_type', 'amount', 'date', 'consultant')
     list_filter = ('ledger_type', 'date')
 
 admin.site.register(LedgerEntry, LedgerEntryAdmin)
+
+class LedgerMonthlyRollupAdmin(admin.ModelAdmin):
+    list_display = ('month', 'consultant', 'ledger_type', 'total', 'entry_count')
+    list_filter = ('ledger_type', 'month')
+
+admin.site.register(LedgerMonthlyRollup, LedgerMonthlyRollupAdmin)
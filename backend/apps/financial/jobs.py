@@ -0,0 +1,7 @@
+from apps.jobs.registry import register
+from .models import LedgerMonthlyRollup
+
+
+@register('financial.rebuild_ledger_rollups')
+def rebuild_ledger_rollups():
+    LedgerMonthlyRollup.rebuild()
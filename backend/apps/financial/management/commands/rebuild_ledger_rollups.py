@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from apps.financial.models import LedgerMonthlyRollup
+
+
+class Command(BaseCommand):
+    help = 'Recompute the monthly ledger rollups from every LedgerEntry.'
+
+    def handle(self, *args, **options):
+        LedgerMonthlyRollup.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f'{LedgerMonthlyRollup.objects.count()} rollup buckets rebuilt.'
+        ))
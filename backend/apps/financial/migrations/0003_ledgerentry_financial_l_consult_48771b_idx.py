@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('financial', '0002_alter_ledgerentry_date'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ledgerentry',
+            index=models.Index(fields=['consultant', 'date'], name='financial_l_consult_48771b_idx'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:43
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth
+
+
+def backfill_rollups(apps, schema_editor):
+    LedgerEntry = apps.get_model('financial', 'LedgerEntry')
+    LedgerMonthlyRollup = apps.get_model('financial', 'LedgerMonthlyRollup')
+    rows = (
+        LedgerEntry.objects
+        .annotate(month=TruncMonth('date'))
+        .values('month', 'consultant_id', 'ledger_type')
+        .annotate(total=Sum('amount'), entry_count=Count('id'))
+        .order_by()
+    )
+    LedgerMonthlyRollup.objects.bulk_create(LedgerMonthlyRollup(**row) for row in rows)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('financial', '0003_ledgerentry_financial_l_consult_48771b_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LedgerMonthlyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('ledger_type', models.CharField(choices=[('credit', 'Crédito'), ('debit', 'Débito')], max_length=10)),
+                ('total', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('entry_count', models.IntegerField(default=0)),
+                ('consultant', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['consultant', 'month'], name='financial_l_consult_7ce4e7_idx')],
+                'constraints': [models.UniqueConstraint(fields=('month', 'consultant', 'ledger_type'), name='unique_ledger_rollup_bucket')],
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
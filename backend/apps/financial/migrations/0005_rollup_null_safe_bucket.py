@@ -0,0 +1,46 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:45
+
+import django.db.models.functions.comparison
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def merge_duplicate_buckets(apps, schema_editor):
+    # The old constraint let entries without a consultant split into several
+    # rows per bucket; fold each group into its first row
+    LedgerMonthlyRollup = apps.get_model('financial', 'LedgerMonthlyRollup')
+    groups = (
+        LedgerMonthlyRollup.objects.filter(consultant__isnull=True)
+        .values('month', 'ledger_type')
+        .annotate(rows=Count('id'), total_sum=Sum('total'), count_sum=Sum('entry_count'))
+        .filter(rows__gt=1)
+        .order_by()
+    )
+    for group in groups:
+        bucket = LedgerMonthlyRollup.objects.filter(
+            consultant__isnull=True, month=group['month'], ledger_type=group['ledger_type'],
+        ).order_by('pk')
+        keep = bucket.first()
+        bucket.exclude(pk=keep.pk).delete()
+        LedgerMonthlyRollup.objects.filter(pk=keep.pk).update(total=group['total_sum'], entry_count=group['count_sum'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('financial', '0004_ledgermonthlyrollup'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='ledgermonthlyrollup',
+            name='unique_ledger_rollup_bucket',
+        ),
+        migrations.RunPython(merge_duplicate_buckets, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='ledgermonthlyrollup',
+            constraint=models.UniqueConstraint(models.F('month'), django.db.models.functions.comparison.Coalesce('consultant', 0), models.F('ledger_type'), name='unique_ledger_rollup_bucket'),
+        ),
+    ]
@@ -1,4 +1,6 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Sum, Count
+from django.db.models.functions import Coalesce, TruncMonth
 from django.conf import settings
 
 class LedgerEntry(models.Model):
@@ -10,8 +12,78 @@ class LedgerEntry(models.Model):
     ledger_type = models.CharField(max_length=10, choices=TYPE_CHOICES)
     amount = models.DecimalField(max_digits=12, decimal_places=2)
     description = models.CharField(max_length=255)
-    date = models.DateField()
+    date = models.DateField(db_index=True)
     consultant = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['consultant', 'date']),
+        ]
+
     def __str__(self):
         return f"{self.ledger_type} - {self.amount}"
+
+
+class LedgerMonthlyRollup(models.Model):
+    """
+    Running totals per (month, consultant, ledger_type), kept in step with
+    LedgerEntry by signals so summaries read one row per bucket instead of
+    every entry.
+    """
+    month = models.DateField()
+    # Deleting a consultant folds their buckets into the NULL one
+    # (signals.merge_rollups_of_deleted_user); SET_NULL would collide with it
+    consultant = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.DO_NOTHING, null=True, related_name='+')
+    ledger_type = models.CharField(max_length=10, choices=LedgerEntry.TYPE_CHOICES)
+    total = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    entry_count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            # On the consultant id with NULL mapped to 0, so the bucket of entries
+            # without a consultant is unique too (NULLs never collide in a plain
+            # unique index)
+            models.UniqueConstraint(
+                'month', Coalesce('consultant', 0), 'ledger_type', name='unique_ledger_rollup_bucket',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['consultant', 'month']),
+        ]
+
+    def __str__(self):
+        return f"{self.month:%Y-%m} {self.ledger_type} - {self.total}"
+
+    @classmethod
+    def apply(cls, month, consultant_id, ledger_type, amount, count):
+        """
+        Add ``amount``/``count`` (negative to subtract) to a single bucket.
+
+        Concurrent first writes to a bucket race on the unique constraint;
+        ``get_or_create`` catches the loser's IntegrityError and reads the
+        winner's row, which the ``F()`` update then adds to in place.
+        """
+        month = month.replace(day=1)
+        with transaction.atomic():
+            bucket, created = cls.objects.get_or_create(
+                month=month, consultant_id=consultant_id, ledger_type=ledger_type,
+                defaults={'total': amount, 'entry_count': count},
+            )
+            if not created:
+                cls.objects.filter(pk=bucket.pk).update(
+                    total=F('total') + amount, entry_count=F('entry_count') + count
+                )
+
+    @classmethod
+    def rebuild(cls):
+        """Recompute every bucket from LedgerEntry in one aggregate query."""
+        rows = (
+            LedgerEntry.objects
+            .annotate(month=TruncMonth('date'))
+            .values('month', 'consultant_id', 'ledger_type')
+            .annotate(total=Sum('amount'), entry_count=Count('id'))
+            .order_by()
+        )
+        with transaction.atomic():
+            cls.objects.all().delete()
+            cls.objects.bulk_create(cls(**row) for row in rows)
@@ -7,3 +7,18 @@ class LedgerEntrySerializer(serializers.ModelSerializer):
     class Meta:
         model = LedgerEntry
         fields = '__all__'
+
+
+class LedgerSummaryQuerySerializer(serializers.Serializer):
+    """``start``/``end`` as YYYY-MM (a full date counts for its month) and an optional ``consultant`` id."""
+    start = serializers.DateField(required=False, input_formats=['%Y-%m', '%Y-%m-%d'])
+    end = serializers.DateField(required=False, input_formats=['%Y-%m', '%Y-%m-%d'])
+    consultant = serializers.IntegerField(required=False, min_value=1)
+
+    def validate(self, attrs):
+        for name in ('start', 'end'):
+            if name in attrs:
+                attrs[name] = attrs[name].replace(day=1)
+        if 'start' in attrs and 'end' in attrs and attrs['end'] < attrs['start']:
+            raise serializers.ValidationError({'end': 'O mês final deve ser igual ou posterior ao inicial.'})
+        return attrs
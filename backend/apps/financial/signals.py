@@ -0,0 +1,72 @@
+from collections import defaultdict
+from django.conf import settings
+from django.db.models.signals import pre_save, post_save, post_delete, pre_delete
+from django.dispatch import receiver
+from apps.core.bulk import post_bulk_save
+from .models import LedgerEntry, LedgerMonthlyRollup
+
+ROLLUP_FIELDS = ('date', 'consultant_id', 'ledger_type', 'amount')
+
+
+@receiver(pre_save, sender=LedgerEntry)
+def remember_previous_bucket(sender, instance, **kwargs):
+    instance._rollup_previous = None
+    if instance.pk:
+        instance._rollup_previous = (
+            LedgerEntry.objects.filter(pk=instance.pk).values(*ROLLUP_FIELDS).first()
+        )
+
+
+@receiver(post_save, sender=LedgerEntry)
+def update_rollup_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, '_rollup_previous', None)
+    current = {field: getattr(instance, field) for field in ROLLUP_FIELDS}
+    if previous == current:
+        return
+    if previous:
+        LedgerMonthlyRollup.apply(
+            previous['date'], previous['consultant_id'], previous['ledger_type'], -previous['amount'], -1
+        )
+    LedgerMonthlyRollup.apply(
+        instance.date, instance.consultant_id, instance.ledger_type, instance.amount, 1
+    )
+
+
+@receiver(post_delete, sender=LedgerEntry)
+def update_rollup_on_delete(sender, instance, **kwargs):
+    LedgerMonthlyRollup.apply(
+        instance.date, instance.consultant_id, instance.ledger_type, -instance.amount, -1
+    )
+
+
+@receiver(post_bulk_save, sender=LedgerEntry)
+def update_rollups_in_bulk(sender, instances, previous, **kwargs):
+    # Net the whole batch per bucket first: one rollup write per touched bucket
+    deltas = defaultdict(lambda: [0, 0])
+    for entry in instances:
+        current = {field: getattr(entry, field) for field in ROLLUP_FIELDS}
+        if entry.pk in previous:
+            before = {field: previous[entry.pk].get(field, current[field]) for field in ROLLUP_FIELDS}
+            if before == current:
+                continue
+            bucket = deltas[(before['date'].replace(day=1), before['consultant_id'], before['ledger_type'])]
+            bucket[0] -= before['amount']
+            bucket[1] -= 1
+        bucket = deltas[(entry.date.replace(day=1), entry.consultant_id, entry.ledger_type)]
+        bucket[0] += entry.amount
+        bucket[1] += 1
+    for (month, consultant_id, ledger_type), (amount, count) in deltas.items():
+        if amount or count:
+            LedgerMonthlyRollup.apply(month, consultant_id, ledger_type, amount, count)
+
+
+@receiver(pre_delete, sender=settings.AUTH_USER_MODEL)
+def merge_rollups_of_deleted_user(sender, instance, **kwargs):
+    # The user's entries become consultant-less through a signal-less UPDATE,
+    # so move their totals into the NULL buckets by hand
+    buckets = LedgerMonthlyRollup.objects.filter(consultant_id=instance.pk)
+    for bucket in buckets:
+        LedgerMonthlyRollup.apply(bucket.month, None, bucket.ledger_type, bucket.total, bucket.entry_count)
+    buckets.delete()
@@ -0,0 +1,79 @@
+from datetime import date
+from rest_framework.test import APITestCase
+from apps.core.testing import make_user
+from .models import LedgerEntry, LedgerMonthlyRollup
+
+
+class LedgerSummaryTests(APITestCase):
+    def setUp(self):
+        self.consultant = make_user()
+        self.client.force_authenticate(self.consultant)
+
+    def add_entry(self, amount, day=1, consultant=None):
+        return LedgerEntry.objects.create(
+            ledger_type='credit', amount=amount, description='Mensalidade', date=date(2025, 1, day),
+            consultant=consultant,
+        )
+
+    def test_entries_without_consultant_share_one_bucket(self):
+        self.add_entry(10)
+        self.add_entry(5, day=20)
+        bucket = LedgerMonthlyRollup.objects.get(consultant=None)
+        self.assertEqual((bucket.total, bucket.entry_count), (15, 2))
+
+    def test_deleting_consultant_merges_into_null_bucket(self):
+        consultant = make_user()
+        self.add_entry(10, consultant=consultant)
+        self.add_entry(5, day=20)
+        consultant.delete()
+
+        bucket = LedgerMonthlyRollup.objects.get()
+        self.assertEqual((bucket.consultant_id, bucket.total, bucket.entry_count), (None, 15, 2))
+        self.assertFalse(LedgerEntry.objects.exclude(consultant=None).exists())
+
+    def test_summary_filters(self):
+        self.add_entry(10, consultant=self.consultant)
+        self.add_entry(7)
+        response = self.client.get(f'/api/financial/ledger/summary/?start=2025-01&end=2025-01-31&consultant={self.consultant.pk}')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['by_month'], [{'month': '2025-01', 'credit': 10, 'debit': 0, 'balance': 10}])
+
+    def test_summary_rejects_bad_params(self):
+        for query in ('start=xx', 'end=2025-13', 'consultant=abc', 'start=2025-03&end=2025-01'):
+            response = self.client.get(f'/api/financial/ledger/summary/?{query}')
+            self.assertEqual(response.status_code, 400, query)
+
+
+class LedgerBulkTests(APITestCase):
+    def setUp(self):
+        self.client.force_authenticate(make_user())
+        self.entry = LedgerEntry.objects.create(
+            ledger_type='credit', amount=10, description='Mensalidade', date=date(2025, 1, 1),
+        )
+
+    def test_bulk_update_keeps_rollup_in_step(self):
+        response = self.client.patch('/api/financial/ledger/bulk/', [{'id': self.entry.pk, 'amount': '7'}], format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(LedgerMonthlyRollup.objects.get().total, 7)
+
+    def test_bulk_update_rejects_bad_and_repeated_ids(self):
+        payload = [
+            {'id': self.entry.pk, 'amount': '5'},
+            {'id': self.entry.pk, 'amount': '7'},
+            {'id': 'abc'},
+            {'id': [1]},
+            {'amount': '1'},
+        ]
+        response = self.client.patch('/api/financial/ledger/bulk/', payload, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data[0], {})
+        self.assertEqual([list(errors) for errors in response.data[1:]], [['id']] * 4)
+        self.assertEqual(LedgerMonthlyRollup.objects.get().total, 10)
+
+    def test_bulk_destroy_rejects_bad_ids(self):
+        response = self.client.delete('/api/financial/ledger/bulk/', {'ids': [self.entry.pk, 'x', [1]]}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['ids'][0], [])
+        self.assertTrue(LedgerEntry.objects.exists())
+        response = self.client.delete('/api/financial/ledger/bulk/', {'ids': [str(self.entry.pk)]}, format='json')
+        self.assertEqual(response.data, {'deleted': 1})
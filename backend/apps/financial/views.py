@@ -1,10 +1,69 @@
+from django.db.models import Sum, Q
 from rest_framework import viewsets, permissions
-from .models import LedgerEntry
-from .serializers import LedgerEntrySerializer
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from apps.core.mixins import BulkModelMixin, ExportMixin
+from apps.core.pagination import DateCursorPagination
+from .models import LedgerEntry, LedgerMonthlyRollup
+from .serializers import LedgerEntrySerializer, LedgerSummaryQuerySerializer
+from apps.metrics.mixins import SerializerTimingMixin
 
-class LedgerEntryViewSet(viewsets.ModelViewSet):
-    queryset = LedgerEntry.objects.all()
+class LedgerEntryViewSet(SerializerTimingMixin, BulkModelMixin, ExportMixin, viewsets.ModelViewSet):
+    queryset = LedgerEntry.objects.select_related('consultant')
     serializer_class = LedgerEntrySerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = DateCursorPagination
     filterset_fields = ['ledger_type', 'date', 'consultant']
     search_fields = ['description']
+    export_filename = 'lancamentos'
+    export_fields = (
+        ('Data', 'date'),
+        ('Tipo', 'ledger_type'),
+        ('Descrição', 'description'),
+        ('Valor', 'amount'),
+        ('Consultor', 'consultant__username'),
+    )
+
+    @action(detail=False, methods=['get'])
+    def summary(self, request):
+        """
+        Totals by month, consultant and ledger_type read from the rollup
+        table. Accepts ``start``/``end`` (YYYY-MM) and ``consultant``.
+        """
+        query = LedgerSummaryQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+        rollups = LedgerMonthlyRollup.objects.filter(entry_count__gt=0)
+        if 'start' in params:
+            rollups = rollups.filter(month__gte=params['start'])
+        if 'end' in params:
+            rollups = rollups.filter(month__lte=params['end'])
+        if 'consultant' in params:
+            rollups = rollups.filter(consultant_id=params['consultant'])
+
+        credit = Sum('total', filter=Q(ledger_type='credit'), default=0)
+        debit = Sum('total', filter=Q(ledger_type='debit'), default=0)
+
+        by_month = rollups.values('month').annotate(credit=credit, debit=debit).order_by('month')
+        by_consultant = (
+            rollups.values('consultant', 'consultant__username')
+            .annotate(credit=credit, debit=debit)
+            .order_by('consultant__username')
+        )
+        by_type = rollups.values('ledger_type').annotate(
+            total=Sum('total'), count=Sum('entry_count')
+        ).order_by('ledger_type')
+
+        return Response({
+            'by_month': [
+                {'month': row['month'].strftime('%Y-%m'), 'credit': row['credit'], 'debit': row['debit'],
+                 'balance': row['credit'] - row['debit']}
+                for row in by_month
+            ],
+            'by_consultant': [
+                {'consultant': row['consultant'], 'consultant_name': row['consultant__username'],
+                 'credit': row['credit'], 'debit': row['debit'], 'balance': row['credit'] - row['debit']}
+                for row in by_consultant
+            ],
+            'by_type': list(by_type),
+        })
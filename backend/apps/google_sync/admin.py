@@ -0,0 +1,10 @@
+from django.contrib import admin
+from .models import GoogleAccount, GoogleTaskTombstone
+
+class GoogleAccountAdmin(admin.ModelAdmin):
+    list_display = ('user', 'enabled', 'next_sync_at', 'last_synced_at', 'failure_count')
+    list_filter = ('enabled',)
+    readonly_fields = ('calendar_sync_token', 'last_synced_at', 'failure_count', 'last_error')
+
+admin.site.register(GoogleAccount, GoogleAccountAdmin)
+admin.site.register(GoogleTaskTombstone)
@@ -0,0 +1,150 @@
+"""
+Minimal Google Tasks / Calendar HTTP client (stdlib only).
+
+Base URLs come from settings so the worker can be pointed at the local fake
+server in ``fake_server.py``. Transient failures (429, 5xx, network errors)
+are retried with exponential backoff and jitter; anything still failing is
+raised as ``GoogleApiError`` for the worker to reschedule the account.
+"""
+import json
+import random
+import time
+import uuid
+from datetime import timedelta
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode, quote
+from urllib.request import Request, urlopen
+from django.conf import settings
+from django.utils import timezone
+
+MAX_RETRIES = 3
+RETRY_BASE_SECONDS = 0.5
+REQUEST_TIMEOUT = 30
+
+
+class GoogleApiError(Exception):
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+    @property
+    def retryable(self):
+        return self.status is None or self.status == 429 or self.status >= 500
+
+
+def _retryable(status):
+    return status == 429 or status >= 500
+
+
+class GoogleClient:
+    def __init__(self, account, sleep=time.sleep):
+        self.account = account
+        self.base_url = settings.GOOGLE_API_BASE_URL.rstrip('/')
+        self.sleep = sleep
+
+    # Auth
+
+    def access_token(self):
+        account = self.account
+        if account.access_token and account.token_expiry and account.token_expiry > timezone.now() + timedelta(seconds=60):
+            return account.access_token
+        if not account.refresh_token:
+            if account.access_token:
+                return account.access_token
+            raise GoogleApiError('Conta Google sem credenciais.', status=401)
+        data = self._send(Request(
+            settings.GOOGLE_OAUTH_TOKEN_URL,
+            data=urlencode({
+                'grant_type': 'refresh_token',
+                'refresh_token': account.refresh_token,
+                'client_id': settings.GOOGLE_CLIENT_ID,
+                'client_secret': settings.GOOGLE_CLIENT_SECRET,
+            }).encode(),
+            method='POST',
+        ))
+        account.access_token = data['access_token']
+        account.token_expiry = timezone.now() + timedelta(seconds=int(data.get('expires_in', 3600)))
+        account.save(update_fields=['access_token', 'token_expiry'])
+        return account.access_token
+
+    # Transport
+
+    def _send(self, request):
+        """Send with retries; returns (parsed JSON or raw bytes) of the body."""
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                with urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+                    body = response.read()
+                    if response.headers.get_content_type() == 'application/json':
+                        return json.loads(body or b'{}')
+                    return response.headers, body
+            except HTTPError as error:
+                status, retry_after = error.code, error.headers.get('Retry-After')
+                if not _retryable(status) or attempt == MAX_RETRIES:
+                    raise GoogleApiError(f'{request.get_method()} {request.full_url}: HTTP {status}', status=status)
+            except URLError as error:
+                retry_after = None
+                if attempt == MAX_RETRIES:
+                    raise GoogleApiError(f'{request.get_method()} {request.full_url}: {error.reason}')
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else RETRY_BASE_SECONDS * 2 ** attempt
+            self.sleep(delay + random.uniform(0, delay / 2))
+
+    def request(self, method, path, params=None, body=None):
+        url = self.base_url + path + (f'?{urlencode(params)}' if params else '')
+        headers = {'Authorization': f'Bearer {self.access_token()}'}
+        data = None
+        if body is not None:
+            data = json.dumps(body).encode()
+            headers['Content-Type'] = 'application/json'
+        result = self._send(Request(url, data=data, headers=headers, method=method))
+        return result if isinstance(result, dict) else {}
+
+    def batch(self, api, calls):
+        """
+        Run ``calls`` ([(method, path, body)]) as one multipart batch request
+        against ``/batch/<api>``. Returns ``[(status, body)]`` in call order.
+        """
+        if not calls:
+            return []
+        boundary = f'batch_{uuid.uuid4().hex}'
+        parts = []
+        for index, (method, path, body) in enumerate(calls):
+            part = (
+                f'--{boundary}\r\nContent-Type: application/http\r\nContent-ID: <item{index}>\r\n\r\n'
+                f'{method} {path} HTTP/1.1\r\n'
+            )
+            if body is not None:
+                part += f'Content-Type: application/json\r\n\r\n{json.dumps(body)}\r\n'
+            else:
+                part += '\r\n'
+            parts.append(part)
+        payload = (''.join(parts) + f'--{boundary}--\r\n').encode()
+        headers, raw = self._send(Request(
+            f'{self.base_url}/batch/{api}',
+            data=payload,
+            headers={
+                'Authorization': f'Bearer {self.access_token()}',
+                'Content-Type': f'multipart/mixed; boundary={boundary}',
+            },
+            method='POST',
+        ))
+        return parse_batch_response(headers.get_param('boundary'), raw, len(calls))
+
+
+def parse_batch_response(boundary, raw, expected):
+    results = [(None, {})] * expected
+    for chunk in raw.decode().split(f'--{boundary}'):
+        marker = 'Content-ID: <response-item'
+        if marker not in chunk:
+            continue
+        index = int(chunk.split(marker, 1)[1].split('>', 1)[0])
+        http = chunk.split('\r\n\r\n', 1)[1]
+        status_line, _, rest = http.partition('\r\n')
+        status = int(status_line.split()[1])
+        body = rest.split('\r\n\r\n', 1)[1].strip() if '\r\n\r\n' in rest else ''
+        results[index] = (status, json.loads(body) if body else {})
+    return results
+
+
+def path(template, *args):
+    return template.format(*(quote(str(arg), safe='@') for arg in args))
@@ -0,0 +1,198 @@
+"""
+In-memory stand-in for the Google endpoints the sync worker uses.
+
+Point ``GOOGLE_API_BASE_URL`` and ``GOOGLE_OAUTH_TOKEN_URL`` at it (see
+``manage.py run_fake_google``) to exercise the worker end to end:
+
+    fake = FakeGoogle().start()
+    settings.GOOGLE_API_BASE_URL = fake.base_url
+    fake.add_event('primary', summary='Reunião', start='2026-01-05T10:00:00-03:00')
+    fake.fail_next(503, times=2)   # next two requests fail, to test backoff
+    fake.delay = 0.3               # seconds added to every request, to mimic latency
+
+Supports tasks insert/patch/delete, events.list with page and sync tokens
+(410 for unknown tokens), the multipart batch endpoint and token refresh.
+"""
+import itertools
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+PAGE_SIZE = 2
+
+
+class FakeGoogle:
+    def __init__(self, host='127.0.0.1', port=0):
+        self.lock = threading.Lock()
+        self.tasks = {}       # {tasklist: {id: resource}}
+        self.events = {}      # {calendar: {id: resource}}
+        self.sequence = 0     # bumped on every event change; sync tokens point at it
+        self.changes = {}     # {calendar: {id: sequence of last change}}
+        self.failures = []    # statuses to return for the next requests
+        self.requests = []    # (method, path) log
+        self.delay = 0        # latency added to each HTTP request, in seconds
+        self._ids = itertools.count(1)
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def token_url(self):
+        return f'{self.base_url}/token'
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    # Test helpers
+
+    def fail_next(self, status, times=1):
+        with self.lock:
+            self.failures.extend([status] * times)
+
+    def add_event(self, calendar, summary, start, end=None, **extra):
+        with self.lock:
+            event_id = f'evt{next(self._ids)}'
+            key = 'date' if len(start) == 10 else 'dateTime'
+            event = {'id': event_id, 'status': 'confirmed', 'summary': summary, 'start': {key: start}, **extra}
+            if end:
+                event['end'] = {key: end}
+            self._touch(calendar, event)
+            return event_id
+
+    def update_event(self, calendar, event_id, **changes):
+        with self.lock:
+            event = {**self.events[calendar][event_id], **changes}
+            self._touch(calendar, event)
+
+    def cancel_event(self, calendar, event_id):
+        self.update_event(calendar, event_id, status='cancelled')
+
+    def _touch(self, calendar, event):
+        self.sequence += 1
+        self.events.setdefault(calendar, {})[event['id']] = event
+        self.changes.setdefault(calendar, {})[event['id']] = self.sequence
+
+    # Request handling
+
+    def dispatch(self, method, target, body):
+        """(status, dict or None) for one API call."""
+        url = urlsplit(target)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        route = unquote(url.path)
+        with self.lock:
+            self.requests.append((method, route))
+            if self.failures:
+                return self.failures.pop(0), {'error': {'message': 'fake failure'}}
+            if route == '/token':
+                return 200, {'access_token': f'token{next(self._ids)}', 'expires_in': 3600}
+            match = re.fullmatch(r'/tasks/v1/lists/([^/]+)/tasks(?:/([^/]+))?', route)
+            if match:
+                return self._tasks(method, match.group(1), match.group(2), body)
+            match = re.fullmatch(r'/calendar/v3/calendars/([^/]+)/events', route)
+            if match and method == 'GET':
+                return self._events(match.group(1), query)
+        return 404, {'error': {'message': 'not found'}}
+
+    def _tasks(self, method, tasklist, task_id, body):
+        items = self.tasks.setdefault(tasklist, {})
+        if method == 'POST' and task_id is None:
+            task = {**body, 'id': f'task{next(self._ids)}'}
+            items[task['id']] = task
+            return 200, task
+        if task_id not in items:
+            return 404, {'error': {'message': 'task not found'}}
+        if method == 'PATCH':
+            items[task_id].update(body)
+            return 200, items[task_id]
+        if method == 'DELETE':
+            del items[task_id]
+            return 204, None
+        return 405, None
+
+    def _events(self, calendar, query):
+        changes = self.changes.get(calendar, {})
+        if 'syncToken' in query:
+            if not query['syncToken'].startswith('seq:'):
+                return 410, {'error': {'message': 'sync token expired'}}
+            since = int(query['syncToken'][4:])
+            ids = [event_id for event_id, seq in changes.items() if seq > since]
+        else:
+            ids = [
+                event_id for event_id, event in self.events.get(calendar, {}).items()
+                if event['status'] != 'cancelled'
+            ]
+        ids.sort(key=lambda event_id: changes[event_id])
+        offset = int(query.get('pageToken', 0))
+        page = ids[offset:offset + PAGE_SIZE]
+        data = {'items': [self.events[calendar][event_id] for event_id in page]}
+        if offset + PAGE_SIZE < len(ids):
+            data['nextPageToken'] = str(offset + PAGE_SIZE)
+        else:
+            data['nextSyncToken'] = f'seq:{self.sequence}'
+        return 200, data
+
+    def batch(self, content_type, raw):
+        boundary = content_type.split('boundary=', 1)[1]
+        out = []
+        for part in raw.decode().split(f'--{boundary}'):
+            if 'Content-ID: <' not in part:
+                continue
+            content_id = part.split('Content-ID: <', 1)[1].split('>', 1)[0]
+            http = part.split('\r\n\r\n', 1)[1]
+            request_line, _, rest = http.partition('\r\n')
+            method, target, _ = request_line.split(' ', 2)
+            body = rest.split('\r\n\r\n', 1)[1].strip() if '\r\n\r\n' in rest else ''
+            status, data = self.dispatch(method, target, json.loads(body) if body else None)
+            payload = json.dumps(data) if data is not None else ''
+            out.append(
+                f'--{boundary}\r\nContent-Type: application/http\r\nContent-ID: <response-{content_id}>\r\n\r\n'
+                f'HTTP/1.1 {status} X\r\nContent-Type: application/json\r\n\r\n{payload}\r\n'
+            )
+        return (''.join(out) + f'--{boundary}--\r\n').encode(), boundary
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, body=b'', content_type='application/json'):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _handle(self):
+                raw = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+                if fake.delay:
+                    time.sleep(fake.delay)
+                if self.path.startswith('/batch/'):
+                    with fake.lock:
+                        if fake.failures:
+                            status = fake.failures.pop(0)
+                            return self._reply(status, b'{}')
+                    body, boundary = fake.batch(self.headers['Content-Type'], raw)
+                    return self._reply(200, body, f'multipart/mixed; boundary={boundary}')
+                if self.headers.get('Content-Type', '').startswith('application/json'):
+                    data = json.loads(raw or b'{}')
+                else:
+                    data = {key: values[0] for key, values in parse_qs(raw.decode()).items()}
+                status, result = fake.dispatch(self.command, self.path, data)
+                self._reply(status, json.dumps(result).encode() if result is not None else b'')
+
+            do_GET = do_POST = do_PATCH = do_DELETE = _handle
+
+        return Handler
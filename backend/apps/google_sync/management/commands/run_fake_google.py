@@ -0,0 +1,26 @@
+import time
+from django.core.management.base import BaseCommand
+from apps.google_sync.fake_server import FakeGoogle
+
+
+class Command(BaseCommand):
+    help = 'Run the in-memory fake Google Tasks/Calendar API for local sync testing.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--port', type=int, default=8765)
+        parser.add_argument('--delay', type=float, default=0, help='Seconds of latency added to every request.')
+
+    def handle(self, *args, **options):
+        fake = FakeGoogle(port=options['port'])
+        fake.delay = options['delay']
+        fake.start()
+        self.stdout.write(
+            f'Fake Google em {fake.base_url}\n'
+            f'  GOOGLE_API_BASE_URL={fake.base_url}\n'
+            f'  GOOGLE_OAUTH_TOKEN_URL={fake.token_url}'
+        )
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            fake.stop()
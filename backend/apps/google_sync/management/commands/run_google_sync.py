@@ -0,0 +1,22 @@
+import time
+from django.core.management.base import BaseCommand
+from apps.google_sync.sync import run_once
+
+
+class Command(BaseCommand):
+    help = 'Worker: push dirty tasks to Google Tasks and pull Google Calendar changes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Process the due accounts once and exit.')
+        parser.add_argument('--interval', type=float, default=15, help='Seconds between polls when idle.')
+        parser.add_argument('--limit', type=int, default=10, help='Accounts claimed per poll.')
+
+    def handle(self, *args, **options):
+        while True:
+            processed = run_once(options['limit'])
+            if processed:
+                self.stdout.write(f'{processed} contas sincronizadas.')
+            if options['once']:
+                return
+            if processed < options['limit']:
+                time.sleep(options['interval'])
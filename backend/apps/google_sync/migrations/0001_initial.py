@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:03
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GoogleTaskTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('google_task_id', models.CharField(max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='GoogleAccount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('access_token', models.TextField(blank=True)),
+                ('refresh_token', models.TextField(blank=True)),
+                ('token_expiry', models.DateTimeField(blank=True, null=True)),
+                ('tasklist_id', models.CharField(default='@default', max_length=255)),
+                ('calendar_id', models.CharField(default='primary', max_length=255)),
+                ('calendar_sync_token', models.TextField(blank=True)),
+                ('enabled', models.BooleanField(default=True)),
+                ('next_sync_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('last_synced_at', models.DateTimeField(blank=True, null=True)),
+                ('failure_count', models.IntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='google_account', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['enabled', 'next_sync_at'], name='google_sync_enabled_ef1fa9_idx')],
+            },
+        ),
+    ]
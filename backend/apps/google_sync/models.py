@@ -0,0 +1,40 @@
+from django.db import models
+from django.conf import settings
+from django.utils import timezone
+
+
+class GoogleAccount(models.Model):
+    """OAuth credentials plus the per-user sync cursor and schedule."""
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='google_account')
+    access_token = models.TextField(blank=True)
+    refresh_token = models.TextField(blank=True)
+    token_expiry = models.DateTimeField(null=True, blank=True)
+
+    tasklist_id = models.CharField(max_length=255, default='@default')
+    calendar_id = models.CharField(max_length=255, default='primary')
+    # Incremental cursor from events.list; empty means the next pull is a full one
+    calendar_sync_token = models.TextField(blank=True)
+
+    enabled = models.BooleanField(default=True)
+    next_sync_at = models.DateTimeField(default=timezone.now)
+    last_synced_at = models.DateTimeField(null=True, blank=True)
+    failure_count = models.IntegerField(default=0)
+    last_error = models.TextField(blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['enabled', 'next_sync_at']),
+        ]
+
+    def __str__(self):
+        return f"Google - {self.user}"
+
+
+class GoogleTaskTombstone(models.Model):
+    """A pushed task deleted locally; the worker deletes it remotely too."""
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='+')
+    google_task_id = models.CharField(max_length=255)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.google_task_id
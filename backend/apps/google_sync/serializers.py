@@ -0,0 +1,13 @@
+from rest_framework import serializers
+from .models import GoogleAccount
+
+
+class GoogleAccountStatusSerializer(serializers.ModelSerializer):
+    connected = serializers.SerializerMethodField()
+
+    class Meta:
+        model = GoogleAccount
+        fields = ('connected', 'enabled', 'next_sync_at', 'last_synced_at', 'failure_count', 'last_error')
+
+    def get_connected(self, obj):
+        return True
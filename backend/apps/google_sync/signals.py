@@ -0,0 +1,30 @@
+from django.db.models.signals import pre_save, post_delete
+from django.dispatch import receiver
+from apps.core.bulk import post_bulk_save
+from apps.tasks.models import Task
+from .models import GoogleTaskTombstone
+from .sync import SYNCED_TASK_FIELDS
+
+
+@receiver(pre_save, sender=Task)
+def mark_task_dirty(sender, instance, update_fields=None, raw=False, **kwargs):
+    if raw:
+        return
+    if update_fields is None or 'google_synced' in update_fields:
+        instance.google_synced = False
+    elif set(update_fields) & set(SYNCED_TASK_FIELDS):
+        # save(update_fields=...) would not write the flag itself
+        Task.objects.filter(pk=instance.pk).update(google_synced=False)
+
+
+@receiver(post_bulk_save, sender=Task)
+def mark_tasks_dirty_in_bulk(sender, instances, created, update_fields, **kwargs):
+    if created or not set(update_fields or ()) & set(SYNCED_TASK_FIELDS):
+        return
+    Task.objects.filter(pk__in=[task.pk for task in instances]).update(google_synced=False)
+
+
+@receiver(post_delete, sender=Task)
+def remember_remote_task(sender, instance, **kwargs):
+    if instance.google_task_id and instance.assigned_to_id:
+        GoogleTaskTombstone.objects.create(user_id=instance.assigned_to_id, google_task_id=instance.google_task_id)
@@ -0,0 +1,228 @@
+"""
+Google sync engine, run by ``manage.py run_google_sync``.
+
+Per account and per cycle: delete tombstoned tasks, push dirty tasks
+(``google_synced=False``) in batches, then pull calendar changes with the
+stored sync token. Web requests only flip flags and insert tombstones; every
+Google call happens here.
+"""
+import random
+from datetime import datetime, time, timedelta
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from apps.core.bulk import bulk_create_with_signal, post_bulk_save
+from apps.crm.models import Activity
+from apps.tasks.models import Task
+from .client import GoogleApiError, GoogleClient, path
+from .models import GoogleAccount, GoogleTaskTombstone
+
+# Google accepts at most 50 calls per batch for these APIs
+BATCH_SIZE = 50
+# Fields pushed to Google; changing any of them marks the task dirty again
+SYNCED_TASK_FIELDS = ('title', 'description', 'status', 'due_date')
+# Window of the first (full) calendar pull
+CALENDAR_PAST_DAYS = 30
+
+TASKS_PATH = '/tasks/v1/lists/{}/tasks'
+TASK_PATH = '/tasks/v1/lists/{}/tasks/{}'
+EVENTS_PATH = '/calendar/v3/calendars/{}/events'
+
+
+def sync_interval():
+    return timedelta(seconds=getattr(settings, 'GOOGLE_SYNC_INTERVAL_SECONDS', 120))
+
+
+def backoff_delay(failures):
+    """Exponential backoff with jitter, capped at six hours."""
+    seconds = min(60 * 2 ** (failures - 1), 6 * 60 * 60)
+    return timedelta(seconds=seconds + random.uniform(0, seconds / 4))
+
+
+def _chunks(items, size=BATCH_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+# Tasks (push)
+
+def task_resource(task):
+    resource = {
+        'title': task.title,
+        'notes': task.description,
+        'status': 'completed' if task.status == 'completed' else 'needsAction',
+    }
+    if task.due_date:
+        resource['due'] = f'{task.due_date.isoformat()}T00:00:00.000Z'
+    return resource
+
+
+def push_tombstones(client, account):
+    tombstones = list(GoogleTaskTombstone.objects.filter(user_id=account.user_id).order_by('id'))
+    for chunk in _chunks(tombstones):
+        calls = [('DELETE', path(TASK_PATH, account.tasklist_id, t.google_task_id), None) for t in chunk]
+        results = client.batch('tasks/v1', calls)
+        # 404/410: already gone remotely, which is the goal
+        done = [t.pk for t, (status, _) in zip(chunk, results) if status in (200, 204, 404, 410)]
+        GoogleTaskTombstone.objects.filter(pk__in=done).delete()
+
+
+def push_tasks(client, account):
+    dirty = list(
+        Task.objects.filter(assigned_to_id=account.user_id, google_synced=False)
+        .only('id', 'google_task_id', *SYNCED_TASK_FIELDS).order_by('id')
+    )
+    for chunk in _chunks(dirty):
+        calls = []
+        for task in chunk:
+            if task.google_task_id:
+                calls.append(('PATCH', path(TASK_PATH, account.tasklist_id, task.google_task_id), task_resource(task)))
+            else:
+                calls.append(('POST', path(TASKS_PATH, account.tasklist_id), task_resource(task)))
+        for task, (status, body) in zip(chunk, client.batch('tasks/v1', calls)):
+            if status in (200, 201):
+                # Only mark clean if nothing changed while the call was in flight
+                pushed = {field: getattr(task, field) for field in SYNCED_TASK_FIELDS}
+                Task.objects.filter(pk=task.pk).update(google_task_id=body.get('id', task.google_task_id))
+                Task.objects.filter(pk=task.pk, **pushed).update(google_synced=True)
+            elif status == 404 and task.google_task_id:
+                # Deleted on Google's side: recreate on the next cycle
+                Task.objects.filter(pk=task.pk).update(google_task_id=None)
+            elif status is not None and not (status == 429 or status >= 500):
+                raise GoogleApiError(f'Tarefa {task.pk}: HTTP {status}', status=status)
+            # 429/5xx items stay dirty and are retried next cycle
+
+
+# Calendar (pull)
+
+def _event_times(event):
+    start, end = event.get('start', {}), event.get('end', {})
+    if 'dateTime' in start:
+        begins = parse_datetime(start['dateTime'])
+        ends = parse_datetime(end['dateTime']) if 'dateTime' in end else begins + timedelta(minutes=30)
+    else:
+        day = parse_date(start['date'])
+        begins = timezone.make_aware(datetime.combine(day, time.min))
+        ends = timezone.make_aware(datetime.combine(parse_date(end['date']), time.min)) if 'date' in end else begins + timedelta(days=1)
+    return begins, max(int((ends - begins).total_seconds() // 60), 0)
+
+
+def apply_events(user_id, events):
+    """Upsert/delete the page's events as Google-sourced Activity rows."""
+    cancelled = [e['id'] for e in events if e.get('status') == 'cancelled']
+    live = {e['id']: e for e in events if e.get('status') != 'cancelled' and 'start' in e}
+    with transaction.atomic():
+        if cancelled:
+            Activity.objects.filter(user_id=user_id, google_event_id__in=cancelled).delete()
+        existing = {
+            activity.google_event_id: activity
+            for activity in Activity.objects.filter(user_id=user_id, google_event_id__in=list(live))
+        }
+        created, updated, previous = [], [], {}
+        for event_id, event in live.items():
+            begins, minutes = _event_times(event)
+            values = {
+                'title': (event.get('summary') or '(sem título)')[:255],
+                'description': event.get('description', ''),
+                'date': begins,
+                'duration_minutes': minutes,
+            }
+            activity = existing.get(event_id)
+            if activity is None:
+                created.append(Activity(
+                    user_id=user_id, google_event_id=event_id, activity_type='Google Event',
+                    is_google_event=True, **values,
+                ))
+            elif any(getattr(activity, field) != value for field, value in values.items()):
+                previous[activity.pk] = {field: getattr(activity, field) for field in values}
+                for field, value in values.items():
+                    setattr(activity, field, value)
+                updated.append(activity)
+        bulk_create_with_signal(Activity, created)
+        if updated:
+            fields = ['title', 'description', 'date', 'duration_minutes']
+            Activity.objects.bulk_update(updated, fields)
+            post_bulk_save.send(
+                sender=Activity, instances=updated, created=False, update_fields=fields, previous=previous,
+            )
+
+
+def pull_calendar(client, account):
+    events_path = path(EVENTS_PATH, account.calendar_id)
+    token = account.calendar_sync_token
+    page_token = None
+    while True:
+        if token:
+            params = {'syncToken': token}
+        else:
+            since = timezone.now() - timedelta(days=CALENDAR_PAST_DAYS)
+            params = {'timeMin': since.isoformat(), 'singleEvents': 'true'}
+        if page_token:
+            params['pageToken'] = page_token
+        params['maxResults'] = 250
+        try:
+            data = client.request('GET', events_path, params=params)
+        except GoogleApiError as error:
+            if error.status == 410 and token:
+                # Sync token expired: start over with a full pull
+                token, page_token = '', None
+                continue
+            raise
+        apply_events(account.user_id, data.get('items', []))
+        page_token = data.get('nextPageToken')
+        if not page_token:
+            account.calendar_sync_token = data.get('nextSyncToken', '')
+            account.save(update_fields=['calendar_sync_token'])
+            return
+
+
+# Scheduling
+
+def sync_account(account, client=None):
+    client = client or GoogleClient(account)
+    now = timezone.now()
+    try:
+        push_tombstones(client, account)
+        push_tasks(client, account)
+        pull_calendar(client, account)
+    except GoogleApiError as error:
+        account.failure_count += 1
+        account.last_error = str(error)
+        account.next_sync_at = now + backoff_delay(account.failure_count)
+        account.save(update_fields=['failure_count', 'last_error', 'next_sync_at'])
+        return False
+    account.failure_count = 0
+    account.last_error = ''
+    account.last_synced_at = now
+    account.next_sync_at = now + sync_interval()
+    account.save(update_fields=['failure_count', 'last_error', 'last_synced_at', 'next_sync_at'])
+    return True
+
+
+def claim_due_accounts(limit=10, lease=timedelta(minutes=10)):
+    """
+    Reserve up to ``limit`` due accounts by moving their next_sync_at past
+    the lease, so concurrent workers never sync the same account twice.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        due = GoogleAccount.objects.filter(enabled=True, next_sync_at__lte=now).order_by('next_sync_at')
+        if connection.features.has_select_for_update_skip_locked:
+            due = due.select_for_update(skip_locked=True)
+        claimed = []
+        for account in due[:limit]:
+            # Compare-and-set on the value we read: without SKIP LOCKED another
+            # worker may have claimed the same row in the meantime
+            if GoogleAccount.objects.filter(
+                pk=account.pk, next_sync_at=account.next_sync_at
+            ).update(next_sync_at=now + lease):
+                claimed.append(account)
+    return claimed
+
+
+def run_once(limit=10):
+    accounts = claim_due_accounts(limit)
+    for account in accounts:
+        sync_account(account)
+    return len(accounts)
@@ -0,0 +1,162 @@
+from datetime import timedelta
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from apps.core.testing import make_user
+from apps.crm.models import Activity
+from apps.tasks.models import Task
+from .client import GoogleApiError, GoogleClient, parse_batch_response
+from .fake_server import FakeGoogle
+from .models import GoogleAccount
+from .sync import claim_due_accounts, sync_account
+
+
+class FakeGoogleTestCase(TestCase):
+    def setUp(self):
+        self.fake = FakeGoogle().start()
+        self.addCleanup(self.fake.stop)
+        self.enterContext(override_settings(
+            GOOGLE_API_BASE_URL=self.fake.base_url, GOOGLE_OAUTH_TOKEN_URL=self.fake.token_url,
+        ))
+        self.user = make_user()
+        self.account = GoogleAccount.objects.create(
+            user=self.user, access_token='token', token_expiry=timezone.now() + timedelta(hours=1),
+        )
+        self.sleeps = []
+
+    def sync(self):
+        self.account.refresh_from_db()
+        return sync_account(self.account, GoogleClient(self.account, sleep=self.sleeps.append))
+
+
+class TaskPushTests(FakeGoogleTestCase):
+    def test_dirty_task_is_inserted_then_patched(self):
+        task = Task.objects.create(title='Enviar proposta', assigned_to=self.user)
+        self.assertTrue(self.sync())
+
+        task.refresh_from_db()
+        self.assertTrue(task.google_synced)
+        remote = self.fake.tasks['@default'][task.google_task_id]
+        self.assertEqual((remote['title'], remote['status']), ('Enviar proposta', 'needsAction'))
+
+        task.title, task.status = 'Proposta enviada', 'completed'
+        task.save()
+        self.assertTrue(self.sync())
+        task.refresh_from_db()
+        self.assertTrue(task.google_synced)
+        self.assertEqual(len(self.fake.tasks['@default']), 1)
+        self.assertEqual(self.fake.tasks['@default'][task.google_task_id]['status'], 'completed')
+
+    def test_clean_tasks_are_not_sent(self):
+        Task.objects.create(title='Enviar proposta', assigned_to=self.user)
+        self.sync()
+        sent = len(self.fake.requests)
+        self.sync()
+        self.assertFalse([route for _, route in self.fake.requests[sent:] if '/tasks/' in route])
+
+    def test_deleted_task_is_deleted_remotely(self):
+        task = Task.objects.create(title='Enviar proposta', assigned_to=self.user)
+        self.sync()
+        task.refresh_from_db()
+        task.delete()
+        self.assertTrue(self.sync())
+        self.assertEqual(self.fake.tasks['@default'], {})
+
+
+class CalendarPullTests(FakeGoogleTestCase):
+    def events(self):
+        return dict(Activity.objects.filter(user=self.user, is_google_event=True).values_list('google_event_id', 'title'))
+
+    def test_full_pull_then_incremental_with_sync_token(self):
+        first = self.fake.add_event('primary', 'Reunião', '2026-01-05T10:00:00-03:00', '2026-01-05T11:00:00-03:00')
+        second = self.fake.add_event('primary', 'Almoço', '2026-01-06T12:00:00-03:00')
+        third = self.fake.add_event('primary', 'Feriado', '2026-01-07')
+        self.assertTrue(self.sync())
+        # Three events over pages of two
+        self.assertEqual(self.events(), {first: 'Reunião', second: 'Almoço', third: 'Feriado'})
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.calendar_sync_token, f'seq:{self.fake.sequence}')
+        self.assertEqual(Activity.objects.get(google_event_id=first).duration_minutes, 60)
+
+        self.fake.update_event('primary', first, summary='Reunião de kickoff')
+        self.fake.cancel_event('primary', second)
+        self.assertTrue(self.sync())
+        self.assertEqual(self.events(), {first: 'Reunião de kickoff', third: 'Feriado'})
+
+    def test_expired_sync_token_falls_back_to_full_pull(self):
+        event = self.fake.add_event('primary', 'Reunião', '2026-01-05T10:00:00-03:00')
+        self.account.calendar_sync_token = 'expirado'
+        self.account.save()
+
+        self.assertTrue(self.sync())
+        self.assertEqual(self.events(), {event: 'Reunião'})
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.calendar_sync_token, f'seq:{self.fake.sequence}')
+
+
+class RetryTests(FakeGoogleTestCase):
+    def google_client(self):
+        return GoogleClient(self.account, sleep=self.sleeps.append)
+
+    def test_transient_failures_are_retried_with_backoff(self):
+        self.fake.fail_next(429)
+        self.fake.fail_next(503)
+        self.google_client().request('GET', '/calendar/v3/calendars/primary/events')
+        self.assertEqual(len(self.sleeps), 2)
+        # 0.5s then 1s, plus up to 50% jitter
+        self.assertTrue(0.5 <= self.sleeps[0] <= 0.75)
+        self.assertTrue(1 <= self.sleeps[1] <= 1.5)
+
+    def test_client_errors_are_not_retried(self):
+        self.fake.fail_next(400)
+        with self.assertRaises(GoogleApiError) as raised:
+            self.google_client().request('GET', '/calendar/v3/calendars/primary/events')
+        self.assertEqual(raised.exception.status, 400)
+        self.assertEqual(self.sleeps, [])
+
+    def test_exhausted_retries_reschedule_the_account(self):
+        self.fake.fail_next(500, times=4)
+        self.assertFalse(self.sync())
+        self.account.refresh_from_db()
+        self.assertEqual(self.account.failure_count, 1)
+        self.assertIn('HTTP 500', self.account.last_error)
+        self.assertGreater(self.account.next_sync_at, timezone.now() + timedelta(seconds=50))
+        self.assertEqual(len(self.sleeps), 3)
+
+        self.assertTrue(self.sync())
+        self.account.refresh_from_db()
+        self.assertEqual((self.account.failure_count, self.account.last_error), (0, ''))
+
+
+class BatchTests(FakeGoogleTestCase):
+    def test_batch_results_in_call_order(self):
+        results = GoogleClient(self.account).batch('tasks/v1', [
+            ('POST', '/tasks/v1/lists/@default/tasks', {'title': 'Uma'}),
+            ('PATCH', '/tasks/v1/lists/@default/tasks/nao-existe', {'title': 'Outra'}),
+            ('POST', '/tasks/v1/lists/@default/tasks', {'title': 'Duas'}),
+        ])
+        self.assertEqual([status for status, _ in results], [200, 404, 200])
+        self.assertEqual([results[0][1]['title'], results[2][1]['title']], ['Uma', 'Duas'])
+        self.assertEqual(len(self.fake.requests), 3)
+
+    def test_parse_out_of_order_and_missing_parts(self):
+        raw = (
+            '--b\r\nContent-Type: application/http\r\nContent-ID: <response-item1>\r\n\r\n'
+            'HTTP/1.1 204 No Content\r\n\r\n\r\n'
+            '--b\r\nContent-Type: application/http\r\nContent-ID: <response-item0>\r\n\r\n'
+            'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n\r\n{"id": "t1"}\r\n'
+            '--b--\r\n'
+        ).encode()
+        self.assertEqual(parse_batch_response('b', raw, 3), [(200, {'id': 't1'}), (204, {}), (None, {})])
+
+
+class ClaimTests(TestCase):
+    def test_due_accounts_are_leased_once(self):
+        now = timezone.now()
+        due = GoogleAccount.objects.create(user=make_user(), next_sync_at=now - timedelta(minutes=1))
+        GoogleAccount.objects.create(user=make_user(), next_sync_at=now + timedelta(minutes=5))
+        GoogleAccount.objects.create(user=make_user(), next_sync_at=now, enabled=False)
+
+        self.assertEqual([account.pk for account in claim_due_accounts()], [due.pk])
+        due.refresh_from_db()
+        self.assertGreater(due.next_sync_at, now + timedelta(minutes=9))
+        self.assertEqual(claim_due_accounts(), [])
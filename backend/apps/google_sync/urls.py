@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import GoogleSyncView
+
+urlpatterns = [
+    path('sync/', GoogleSyncView.as_view(), name='google-sync'),
+]
@@ -0,0 +1,58 @@
+from concurrent.futures import ThreadPoolExecutor
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+from rest_framework import permissions, status
+from apps.core.async_views import AsyncAPIView, json_response
+from .models import GoogleAccount
+from .serializers import GoogleAccountStatusSerializer
+from .sync import sync_account
+
+
+# Threads that block on Google during ?wait=true syncs. Sized apart from the
+# event loop's default executor (min(32, CPUs + 4)), which would otherwise cap
+# how many syncs one worker can wait on at once.
+_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'GOOGLE_SYNC_REQUEST_THREADS', 64), thread_name_prefix='google-sync',
+)
+
+
+def _sync_in_thread(account):
+    # Runs outside Django's request thread: close the connection it opened
+    try:
+        return sync_account(account)
+    finally:
+        connections.close_all()
+
+
+class GoogleSyncView(AsyncAPIView):
+    """
+    Sync status of the current user's Google account. POST asks the worker to
+    sync now; with ``?wait=true`` the sync runs in the request instead and the
+    response carries its result, so the view is async: waiting on Google does
+    not hold a server worker.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    async def get_account(self, request):
+        return await GoogleAccount.objects.filter(user_id=request.user.pk).afirst()
+
+    async def get(self, request):
+        account = await self.get_account(request)
+        if account is None:
+            return json_response({'connected': False})
+        return json_response(GoogleAccountStatusSerializer(account).data)
+
+    async def post(self, request):
+        account = await self.get_account(request)
+        if account is None:
+            return json_response({'detail': 'Conta Google não conectada.'}, status=status.HTTP_400_BAD_REQUEST)
+        if request.query_params.get('wait') in ('1', 'true'):
+            # Google calls block on urllib: run them on a thread of their own
+            await sync_to_async(_sync_in_thread, thread_sensitive=False, executor=_executor)(account)
+            return json_response(GoogleAccountStatusSerializer(account).data)
+        # Only reschedules; the worker picks it up on its next poll
+        await GoogleAccount.objects.filter(pk=account.pk).aupdate(next_sync_at=timezone.now())
+        await account.arefresh_from_db()
+        return json_response(GoogleAccountStatusSerializer(account).data, status=status.HTTP_202_ACCEPTED)
@@ -0,0 +1,16 @@
+from django.contrib import admin
+from django.utils import timezone
+from .models import Job, JobLock
+
+class JobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'name', 'status', 'priority', 'attempts', 'run_at', 'finished_at')
+    list_filter = ('status', 'name')
+    search_fields = ('name', 'idempotency_key')
+    actions = ['requeue']
+
+    @admin.action(description='Recolocar na fila')
+    def requeue(self, request, queryset):
+        queryset.exclude(status='running').update(status='queued', run_at=timezone.now(), attempts=0, finished_at=None)
+
+admin.site.register(Job, JobAdmin)
+admin.site.register(JobLock)
@@ -0,0 +1,43 @@
+import os
+import signal
+import socket
+import time
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+from apps.jobs.queue import run_next, requeue_stale
+
+# Polls between checks for orphaned jobs
+REAP_EVERY = 20
+
+
+class Command(BaseCommand):
+    help = 'Run background jobs from the database queue until stopped (SIGTERM finishes the current job).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Drain the due jobs and exit.')
+        parser.add_argument('--interval', type=float, default=2, help='Seconds to sleep when the queue is empty.')
+        parser.add_argument('--worker-id', default=f'{socket.gethostname()}:{os.getpid()}')
+
+    def handle(self, *args, **options):
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        worker = options['worker_id']
+        self.stdout.write(f'Worker {worker} iniciado.')
+        polls = 0
+        while not self.stopping:
+            close_old_connections()
+            if polls % REAP_EVERY == 0:
+                requeue_stale()
+            polls += 1
+            job = run_next(worker)
+            if job is not None:
+                self.stdout.write(f'{job} em {job.attempts} tentativa(s).')
+                continue
+            if options['once']:
+                break
+            time.sleep(options['interval'])
+        self.stdout.write(f'Worker {worker} finalizado.')
+
+    def stop(self, signum, frame):
+        self.stopping = True
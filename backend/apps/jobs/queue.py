@@ -0,0 +1,141 @@
+"""
+Enqueue, claim and run jobs stored in the ``Job`` table.
+
+Claiming uses ``SELECT ... FOR UPDATE SKIP LOCKED`` where the database
+supports it (PostgreSQL, MySQL 8); elsewhere a worker claims a job by
+inserting its ``JobLock`` row, whose primary key is the job id, so only one
+insert can win.
+"""
+import json
+import random
+import traceback
+from datetime import timedelta
+from django.db import IntegrityError, connection, transaction
+from django.db.models import F
+from django.utils import timezone
+from .models import Job, JobLock
+from .registry import get_job
+
+# A running job whose lease is older than this is assumed orphaned (worker died)
+LEASE = timedelta(minutes=30)
+RETRY_BASE_SECONDS = 10
+RETRY_MAX_SECONDS = 60 * 60
+
+
+def enqueue(name, payload=None, priority=0, run_at=None, idempotency_key=None, max_attempts=None):
+    """Queue ``name`` with ``payload`` (JSON); returns the Job, or the existing one for the key."""
+    func = get_job(name)
+    fields = {
+        'name': name,
+        'payload': payload or {},
+        'priority': priority,
+        'run_at': run_at or timezone.now(),
+        'max_attempts': max_attempts or func.max_attempts,
+    }
+    if idempotency_key is None:
+        return Job.objects.create(**fields)
+    try:
+        with transaction.atomic():
+            return Job.objects.create(idempotency_key=idempotency_key, **fields)
+    except IntegrityError:
+        return Job.objects.get(idempotency_key=idempotency_key)
+
+
+def retry_delay(attempts):
+    seconds = min(RETRY_BASE_SECONDS * 2 ** (attempts - 1), RETRY_MAX_SECONDS)
+    return timedelta(seconds=seconds + random.uniform(0, seconds / 4))
+
+
+def uses_skip_locked():
+    return connection.features.has_select_for_update_skip_locked
+
+
+def _due():
+    return Job.objects.filter(status='queued', run_at__lte=timezone.now()).order_by('-priority', 'run_at', 'id')
+
+
+def _mark_running(pk, worker):
+    return Job.objects.filter(pk=pk, status='queued').update(
+        status='running', locked_by=worker, locked_at=timezone.now(), attempts=F('attempts') + 1,
+    )
+
+
+def claim(worker):
+    """Take the next due job for ``worker``, or None."""
+    if uses_skip_locked():
+        with transaction.atomic():
+            job = _due().select_for_update(skip_locked=True).first()
+            if job is None:
+                return None
+            _mark_running(job.pk, worker)
+    else:
+        job = None
+        for pk in _due().values_list('pk', flat=True)[:10]:
+            try:
+                with transaction.atomic():
+                    JobLock.objects.create(job_id=pk, worker=worker)
+            except IntegrityError:
+                continue  # another worker got it first
+            if _mark_running(pk, worker):
+                job = Job(pk=pk)
+                break
+            JobLock.objects.filter(job_id=pk, worker=worker).delete()
+        if job is None:
+            return None
+    job.refresh_from_db()
+    return job
+
+
+def _release(job):
+    if not uses_skip_locked():
+        JobLock.objects.filter(job_id=job.pk).delete()
+
+
+def _jsonable(value):
+    try:
+        json.dumps(value)
+        return value
+    except (TypeError, ValueError):
+        return repr(value)
+
+
+def execute(job):
+    """Run a claimed job and record success, a retry or the final failure."""
+    try:
+        result = get_job(job.name)(**job.payload)
+    except Exception:
+        job.last_error = traceback.format_exc()
+        if job.attempts >= job.max_attempts:
+            job.status, job.finished_at = 'failed', timezone.now()
+        else:
+            job.status, job.run_at = 'queued', timezone.now() + retry_delay(job.attempts)
+        job.save(update_fields=['status', 'run_at', 'finished_at', 'last_error'])
+    else:
+        job.status, job.finished_at, job.result = 'done', timezone.now(), _jsonable(result)
+        job.save(update_fields=['status', 'finished_at', 'result'])
+    finally:
+        _release(job)
+    return job
+
+
+def requeue_stale(lease=LEASE):
+    """Put jobs whose worker vanished back in the queue (or fail them when out of attempts)."""
+    cutoff = timezone.now() - lease
+    # Locks left by a worker that died between inserting the lock and starting the job
+    JobLock.objects.filter(acquired_at__lt=cutoff, job__status='queued').delete()
+    stale = Job.objects.filter(status='running', locked_at__lt=cutoff)
+    ids = list(stale.values_list('pk', flat=True))
+    if not ids:
+        return 0
+    error = 'Worker sem resposta; lease expirado.'
+    Job.objects.filter(pk__in=ids, attempts__gte=F('max_attempts')).update(
+        status='failed', finished_at=timezone.now(), last_error=error,
+    )
+    Job.objects.filter(pk__in=ids, status='running').update(status='queued', run_at=timezone.now(), last_error=error)
+    JobLock.objects.filter(job_id__in=ids).delete()
+    return len(ids)
+
+
+def run_next(worker):
+    job = claim(worker)
+    return execute(job) if job else None
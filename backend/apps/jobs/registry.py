@@ -0,0 +1,23 @@
+"""Named background jobs: ``@register('app.job_name')`` in an app's jobs.py."""
+
+JOBS = {}
+
+
+class UnknownJob(LookupError):
+    pass
+
+
+def register(name, max_attempts=5):
+    def decorator(func):
+        func.job_name = name
+        func.max_attempts = max_attempts
+        JOBS[name] = func
+        return func
+    return decorator
+
+
+def get_job(name):
+    try:
+        return JOBS[name]
+    except KeyError:
+        raise UnknownJob(name)
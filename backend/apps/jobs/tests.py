@@ -0,0 +1,111 @@
+from datetime import timedelta
+from django.test import TestCase, skipIfDBFeature, skipUnlessDBFeature
+from django.utils import timezone
+from .models import Job, JobLock
+from .queue import claim, enqueue, execute, requeue_stale, run_next
+from .registry import JOBS, register
+
+def add(a, b):
+    return a + b
+
+
+def explode():
+    raise ValueError('boom')
+
+
+class JobQueueTests(TestCase):
+    def setUp(self):
+        register('tests.add')(add)
+        register('tests.explode', max_attempts=2)(explode)
+        self.addCleanup(JOBS.pop, 'tests.add')
+        self.addCleanup(JOBS.pop, 'tests.explode')
+
+    def test_run_next_records_the_result(self):
+        job = enqueue('tests.add', {'a': 2, 'b': 3})
+        done = run_next('w1')
+        self.assertEqual(done.pk, job.pk)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.result, job.attempts, job.locked_by), ('done', 5, 1, 'w1'))
+        self.assertIsNone(run_next('w1'))
+
+    def test_priority_then_run_at_order(self):
+        now = timezone.now()
+        low = enqueue('tests.add', {'a': 1, 'b': 0}, run_at=now - timedelta(minutes=5))
+        high = enqueue('tests.add', {'a': 2, 'b': 0}, priority=10, run_at=now)
+        older_low = enqueue('tests.add', {'a': 3, 'b': 0}, run_at=now - timedelta(minutes=10))
+        enqueue('tests.add', {'a': 4, 'b': 0}, priority=20, run_at=now + timedelta(hours=1))
+
+        self.assertEqual([run_next('w1').pk for _ in range(3)], [high.pk, older_low.pk, low.pk])
+        # The future job is not due yet
+        self.assertIsNone(run_next('w1'))
+
+    def test_idempotency_key_returns_the_existing_job(self):
+        first = enqueue('tests.add', {'a': 1, 'b': 1}, idempotency_key='soma-1')
+        second = enqueue('tests.add', {'a': 9, 'b': 9}, idempotency_key='soma-1')
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_failure_is_retried_with_backoff_then_failed(self):
+        job = enqueue('tests.explode')
+        before = timezone.now()
+        run_next('w1')
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ('queued', 1))
+        self.assertIn('ValueError: boom', job.last_error)
+        # 10s for the first retry, plus up to 25% jitter
+        self.assertTrue(before + timedelta(seconds=10) <= job.run_at <= timezone.now() + timedelta(seconds=12.5))
+        self.assertIsNone(run_next('w1'))
+
+        Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+        run_next('w1')
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ('failed', 2))
+        self.assertIsNotNone(job.finished_at)
+
+    @skipIfDBFeature('has_select_for_update_skip_locked')
+    def test_lock_row_claims_a_job_once(self):
+        taken = enqueue('tests.add', {'a': 1, 'b': 1})
+        free = enqueue('tests.add', {'a': 2, 'b': 2})
+        # Another worker inserted its lock first
+        JobLock.objects.create(job=taken, worker='w2')
+
+        job = claim('w1')
+        self.assertEqual(job.pk, free.pk)
+        self.assertEqual(JobLock.objects.get(job=free).worker, 'w1')
+        self.assertIsNone(claim('w1'))
+
+        execute(job)
+        self.assertFalse(JobLock.objects.filter(job=free).exists())
+
+    @skipUnlessDBFeature('has_select_for_update_skip_locked')
+    def test_skip_locked_claim_needs_no_lock_row(self):
+        job = enqueue('tests.add', {'a': 1, 'b': 1})
+        self.assertEqual(claim('w1').pk, job.pk)
+        self.assertFalse(JobLock.objects.exists())
+        self.assertIsNone(claim('w2'))
+
+    def test_requeue_stale_running_jobs(self):
+        retry = enqueue('tests.add', {'a': 1, 'b': 1})
+        spent = enqueue('tests.add', {'a': 2, 'b': 2}, max_attempts=1)
+        fresh = enqueue('tests.add', {'a': 3, 'b': 3})
+        for _ in range(3):
+            claim('w1')
+        old = timezone.now() - timedelta(hours=1)
+        Job.objects.filter(pk__in=[retry.pk, spent.pk]).update(locked_at=old)
+
+        self.assertEqual(requeue_stale(), 2)
+        statuses = dict(Job.objects.values_list('pk', 'status'))
+        self.assertEqual(statuses, {retry.pk: 'queued', spent.pk: 'failed', fresh.pk: 'running'})
+        self.assertFalse(JobLock.objects.filter(job__in=[retry, spent]).exists())
+        self.assertEqual(run_next('w2').pk, retry.pk)
+
+    @skipIfDBFeature('has_select_for_update_skip_locked')
+    def test_requeue_stale_drops_orphaned_locks(self):
+        job = enqueue('tests.add', {'a': 1, 'b': 1})
+        # A worker died between inserting its lock and starting the job
+        JobLock.objects.create(job=job, worker='w2')
+        JobLock.objects.filter(job=job).update(acquired_at=timezone.now() - timedelta(hours=1))
+        self.assertIsNone(claim('w1'))
+
+        requeue_stale()
+        self.assertEqual(claim('w1').pk, job.pk)
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class MetricsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.metrics'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+        from .collector import install_query_wrapper
+        connection_created.connect(install_query_wrapper, dispatch_uid='metrics-query-wrapper')
@@ -0,0 +1,277 @@
+"""
+Per-route request metrics, aggregated across gunicorn workers.
+
+Each process keeps its own counters in memory and dumps them every
+``METRICS_FLUSH_SECONDS`` to ``<METRICS_DIR>/<pid>-<start>.json`` (one file
+per process, replaced atomically). ``/metrics`` sums every file, so the
+exposed values are at most one flush interval behind for the other workers.
+Files of dead processes are folded into ``archive.json`` at scrape time:
+their counts still belong in the totals, but the directory stays one file
+per live process.
+"""
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from time import perf_counter
+from django.conf import settings
+
+try:
+    import fcntl
+except ImportError:  # Windows development machines: files are not folded
+    fcntl = None
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# name: (help, buckets); buckets=None is a plain counter
+METRICS = {
+    'http_requests_total': ('Requests by route, method and status.', None),
+    'http_request_duration_seconds': ('Request latency by route.', LATENCY_BUCKETS),
+    'http_request_db_queries': ('Database queries per request.', QUERY_BUCKETS),
+    'http_request_db_duration_seconds': ('Time spent in database queries per request.', LATENCY_BUCKETS),
+    'http_request_serializer_duration_seconds': ('Time spent rendering serializer data per request.', LATENCY_BUCKETS),
+    'http_response_size_bytes': ('Response body size (non-streaming responses).', SIZE_BUCKETS),
+}
+
+ARCHIVE = 'archive.json'
+
+_current = ContextVar('metrics_request', default=None)
+
+
+class RequestStats:
+    """Counters for the request being served (shared with its sync_to_async threads)."""
+    __slots__ = ('queries', 'db_seconds', 'serializer_seconds')
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.serializer_seconds = 0.0
+
+    def activate(self):
+        return _current.set(self)
+
+    @staticmethod
+    def deactivate(token):
+        _current.reset(token)
+
+
+def record_query(execute, sql, params, many, context):
+    stats = _current.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    start = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.queries += 1
+        stats.db_seconds += perf_counter() - start
+
+
+def install_query_wrapper(sender, connection, **kwargs):
+    """
+    ``connection_created`` receiver. A permanent wrapper on every connection
+    also sees the queries run from sync_to_async threads under ASGI, which
+    have their own connections. Inserted first so ``execute_wrapper()``
+    blocks, which pop the last wrapper, never remove it.
+    """
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, record_query)
+
+
+def time_serializer(serializer):
+    """
+    Add the time of ``serializer``'s representation to the current request.
+    Wraps this one instance (the outermost serializer of the response), so
+    nested serializers are not counted twice.
+    """
+    represent = serializer.to_representation
+
+    def to_representation(instance):
+        stats = _current.get()
+        if stats is None:
+            return represent(instance)
+        start = perf_counter()
+        try:
+            return represent(instance)
+        finally:
+            stats.serializer_seconds += perf_counter() - start
+
+    serializer.to_representation = to_representation
+    return serializer
+
+
+def metrics_dir():
+    return Path(getattr(settings, 'METRICS_DIR', None) or Path(tempfile.gettempdir()) / 'potencialize-metrics')
+
+
+class Registry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        # {(name, labels): value} for counters, [bucket counts..., sum, count] for histograms
+        self.samples = {}
+        self.pid = None
+        self.started = None
+        self.last_flush = 0.0
+
+    def _observe(self, name, labels, value):
+        buckets = METRICS[name][1]
+        key = (name, labels)
+        sample = self.samples.get(key)
+        if sample is None:
+            sample = self.samples[key] = [0] * (len(buckets) + 2)
+        for index, bound in enumerate(buckets):
+            if value <= bound:
+                sample[index] += 1
+                break
+        sample[-2] += value
+        sample[-1] += 1
+
+    def record(self, route, method, status, duration, stats, size=None):
+        labels = (('route', route), ('method', method))
+        with self.lock:
+            self._claim()
+            key = ('http_requests_total', labels + (('status', str(status)),))
+            self.samples[key] = self.samples.get(key, 0) + 1
+            self._observe('http_request_duration_seconds', labels, duration)
+            self._observe('http_request_db_queries', labels, stats.queries)
+            self._observe('http_request_db_duration_seconds', labels, stats.db_seconds)
+            self._observe('http_request_serializer_duration_seconds', labels, stats.serializer_seconds)
+            if size is not None:
+                self._observe('http_response_size_bytes', labels, size)
+        if time.monotonic() - self.last_flush >= getattr(settings, 'METRICS_FLUSH_SECONDS', 5):
+            self.flush()
+
+    def _claim(self):
+        if self.pid != os.getpid():
+            if self.pid is not None:
+                # Forked worker: the parent's counts live in the parent's file
+                self.samples = {}
+            self.pid = os.getpid()
+            self.started = time.time_ns()
+
+    def flush(self):
+        with self.lock:
+            self._claim()
+            path = metrics_dir() / f'{self.pid}-{self.started}.json'
+            self.last_flush = time.monotonic()
+            rows = [[name, list(labels), value] for (name, labels), value in self.samples.items()]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_suffix('.tmp')
+        temp.write_text(json.dumps(rows))
+        os.replace(temp, path)
+
+    def collect(self):
+        """Merged samples of every process: {(name, labels): value}."""
+        self.flush()
+        directory = metrics_dir()
+        _fold_dead_processes(directory)
+        merged = {}
+        for path in directory.glob('*.json'):
+            _merge(merged, _read(path))
+        return merged
+
+
+def _read(path):
+    """Sample rows of a process file or of the archive."""
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return []  # being replaced, or unreadable; picked up next scrape
+    return data['rows'] if isinstance(data, dict) else data
+
+
+def _merge(merged, rows):
+    for name, labels, value in rows:
+        if name not in METRICS:
+            continue
+        key = (name, tuple(tuple(pair) for pair in labels))
+        if isinstance(value, list):
+            current = merged.setdefault(key, [0] * len(value))
+            for index, item in enumerate(value):
+                current[index] += item
+        else:
+            merged[key] = merged.get(key, 0) + value
+
+
+def _alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass  # exists, owned by someone else
+    return True
+
+
+def _fold_dead_processes(directory):
+    """Add the files of exited processes to the archive and delete them."""
+    if fcntl is None:
+        return
+    dead = [
+        path for path in directory.glob('*-*.json')
+        if path.name.split('-', 1)[0].isdigit() and not _alive(int(path.name.split('-', 1)[0]))
+    ]
+    if not dead:
+        return
+    with open(directory / 'archive.lock', 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        archive = directory / ARCHIVE
+        try:
+            data = json.loads(archive.read_text())
+        except (OSError, ValueError):
+            data = {'rows': [], 'folded': []}
+        # Files folded last time but not deleted (crash in between) are already counted
+        for name in data['folded']:
+            (directory / name).unlink(missing_ok=True)
+        merged = {}
+        _merge(merged, data['rows'])
+        folded = [path for path in dead if path.exists()]
+        for path in folded:
+            _merge(merged, _read(path))
+        rows = [[name, list(labels), value] for (name, labels), value in merged.items()]
+        temp = archive.with_suffix('.tmp')
+        temp.write_text(json.dumps({'rows': rows, 'folded': [path.name for path in folded]}))
+        os.replace(temp, archive)
+        for path in folded:
+            path.unlink(missing_ok=True)
+
+
+registry = Registry()
+atexit.register(lambda: registry.samples and registry.flush())
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(pairs):
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in pairs) + '}'
+
+
+def render(samples):
+    """Prometheus text exposition format (0.0.4)."""
+    lines = []
+    for name, (help_text, buckets) in METRICS.items():
+        series = sorted((labels, value) for (metric, labels), value in samples.items() if metric == name)
+        if not series:
+            continue
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {"histogram" if buckets else "counter"}')
+        for labels, value in series:
+            if buckets is None:
+                lines.append(f'{name}{_labels(labels)} {value}')
+                continue
+            cumulative = 0
+            for bound, count in zip(buckets, value):
+                cumulative += count
+                lines.append(f'{name}_bucket{_labels(labels + (("le", bound),))} {cumulative}')
+            lines.append(f'{name}_bucket{_labels(labels + (("le", "+Inf"),))} {value[-1]}')
+            lines.append(f'{name}_sum{_labels(labels)} {value[-2]:.6g}')
+            lines.append(f'{name}_count{_labels(labels)} {value[-1]}')
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,54 @@
+from time import perf_counter
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from .collector import RequestStats, registry
+
+
+class MetricsMiddleware:
+    """
+    Record latency, query count/time, serializer time (viewsets with
+    ``SerializerTimingMixin``) and response size per resolved route
+    (``project-list``, ``ticket-detail``, ...). Place it first so the time of
+    the other middleware is included. Works under WSGI and ASGI without
+    forcing a sync/async switch.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        stats = RequestStats()
+        token = stats.activate()
+        start = perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            RequestStats.deactivate(token)
+        self.record(request, response, stats, start)
+        return response
+
+    async def __acall__(self, request):
+        stats = RequestStats()
+        token = stats.activate()
+        start = perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            RequestStats.deactivate(token)
+        self.record(request, response, stats, start)
+        return response
+
+    def record(self, request, response, stats, start):
+        match = request.resolver_match
+        # Streaming bodies are produced after we return: neither their size
+        # nor their full duration is known here
+        size = None if response.streaming else len(response.content)
+        registry.record(
+            match.view_name if match else 'unmatched', request.method, response.status_code,
+            perf_counter() - start, stats, size,
+        )
@@ -0,0 +1,8 @@
+from .collector import time_serializer
+
+
+class SerializerTimingMixin:
+    """Viewset mixin: report the serializer time of each response to ``/metrics``."""
+
+    def get_serializer(self, *args, **kwargs):
+        return time_serializer(super().get_serializer(*args, **kwargs))
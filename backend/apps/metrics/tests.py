@@ -0,0 +1,120 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APITestCase
+from apps.core.testing import make_user
+from .collector import ARCHIVE, RequestStats, Registry, registry, render
+
+REQUESTS = 'http_requests_total'
+LATENCY = 'http_request_duration_seconds'
+ROUTE = (('route', 'project-list'), ('method', 'GET'))
+
+
+def dead_pid():
+    process = subprocess.Popen([sys.executable, '-c', 'pass'])
+    process.wait()
+    return process.pid
+
+
+class MetricsDirTestCase(SimpleTestCase):
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        self.dir = Path(temp.name)
+        self.enterContext(override_settings(METRICS_DIR=temp.name, METRICS_FLUSH_SECONDS=0))
+        self.registry = Registry()
+
+    def write(self, name, rows):
+        (self.dir / name).write_text(json.dumps(rows))
+
+    def requests(self, samples, status='200'):
+        return samples[(REQUESTS, ROUTE + (('status', status),))]
+
+
+class CollectTests(MetricsDirTestCase):
+    def test_samples_are_summed_across_process_files(self):
+        self.registry.record('project-list', 'GET', 200, 0.02, RequestStats())
+        self.registry.record('project-list', 'GET', 200, 0.3, RequestStats())
+        # Another live worker (this pid, another start time)
+        self.write(f'{os.getpid()}-1.json', [
+            [REQUESTS, [list(pair) for pair in ROUTE + (('status', '200'),)], 5],
+            [LATENCY, [list(pair) for pair in ROUTE], [1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.004, 1]],
+        ])
+
+        samples = self.registry.collect()
+        self.assertEqual(self.requests(samples), 7)
+        latency = samples[(LATENCY, ROUTE)]
+        self.assertEqual(latency[-1], 3)
+        self.assertEqual(latency[0] + latency[2] + latency[6], 3)  # 0.004, 0.02 and 0.3
+
+    def test_dead_process_files_are_folded_once(self):
+        self.registry.record('project-list', 'GET', 200, 0.02, RequestStats())
+        dead = f'{dead_pid()}-1.json'
+        self.write(dead, [[REQUESTS, [list(pair) for pair in ROUTE + (('status', '200'),)], 4]])
+
+        self.assertEqual(self.requests(self.registry.collect()), 5)
+        self.assertFalse((self.dir / dead).exists())
+        self.assertTrue((self.dir / ARCHIVE).exists())
+        self.assertEqual(len(list(self.dir.glob('*.json'))), 2)  # this process and the archive
+
+        self.assertEqual(self.requests(self.registry.collect()), 5)
+
+    def test_files_left_by_an_interrupted_fold_are_not_counted_twice(self):
+        leftover = f'{dead_pid()}-1.json'
+        rows = [[REQUESTS, [list(pair) for pair in ROUTE + (('status', '200'),)], 4]]
+        self.write(leftover, rows)
+        (self.dir / ARCHIVE).write_text(json.dumps({'rows': rows, 'folded': [leftover]}))
+        self.write(f'{dead_pid()}-2.json', rows)
+
+        self.assertEqual(self.requests(self.registry.collect()), 8)
+        self.assertFalse((self.dir / leftover).exists())
+
+
+class RenderTests(SimpleTestCase):
+    def test_text_exposition(self):
+        buckets = [0] * 13
+        buckets[1], buckets[3] = 2, 1  # two at <= 0.01, one at <= 0.05
+        buckets[-2:] = [0.05, 3]
+        text = render({
+            (REQUESTS, ROUTE + (('status', '200'),)): 3,
+            (REQUESTS, (('route', 'say "hi"'), ('method', 'GET'), ('status', '500'))): 1,
+            (LATENCY, ROUTE): buckets,
+        })
+        lines = text.splitlines()
+        self.assertTrue(text.endswith('\n'))
+        self.assertIn('# TYPE http_requests_total counter', lines)
+        self.assertIn('http_requests_total{route="project-list",method="GET",status="200"} 3', lines)
+        self.assertIn('http_requests_total{route="say \\"hi\\"",method="GET",status="500"} 1', lines)
+        self.assertIn('# TYPE http_request_duration_seconds histogram', lines)
+        self.assertIn('http_request_duration_seconds_bucket{route="project-list",method="GET",le="0.005"} 0', lines)
+        self.assertIn('http_request_duration_seconds_bucket{route="project-list",method="GET",le="0.01"} 2', lines)
+        self.assertIn('http_request_duration_seconds_bucket{route="project-list",method="GET",le="0.05"} 3', lines)
+        self.assertIn('http_request_duration_seconds_bucket{route="project-list",method="GET",le="+Inf"} 3', lines)
+        self.assertIn('http_request_duration_seconds_sum{route="project-list",method="GET"} 0.05', lines)
+        self.assertIn('http_request_duration_seconds_count{route="project-list",method="GET"} 3', lines)
+        # Metrics without samples are left out
+        self.assertNotIn('http_response_size_bytes', text)
+
+
+class EndpointTests(APITestCase):
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        self.enterContext(override_settings(METRICS_DIR=temp.name, METRICS_TOKEN='segredo'))
+
+    def test_scrape_needs_the_token(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer segredo')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/plain; version=0.0.4; charset=utf-8')
+
+    def test_viewset_requests_record_serializer_time(self):
+        self.client.force_authenticate(make_user())
+        self.client.get('/api/core/users/')
+        labels = (('route', 'user-list'), ('method', 'GET'))
+        serializer = registry.collect()[('http_request_serializer_duration_seconds', labels)]
+        self.assertGreater(serializer[-2], 0)
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('onboarding', '0002_alter_onboardingnote_created_at'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='onboardingtask',
+            name='due_date',
+            field=models.DateField(blank=True, db_index=True, null=True),
+        ),
+    ]
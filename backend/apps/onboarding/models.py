@@ -31,7 +31,7 @@ class OnboardingTask(models.Model):
     onboarding = models.ForeignKey(OnboardingItem, on_delete=models.CASCADE, related_name='tasks')
     title = models.CharField(max_length=255)
     completed = models.BooleanField(default=False)
-    due_date = models.DateField(null=True, blank=True)
+    due_date = models.DateField(null=True, blank=True, db_index=True)
     assigned_to = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, related_name='onboarding_tasks')
 
     def __str__(self):
@@ -41,7 +41,7 @@ class OnboardingNote(models.Model):
     onboarding = models.ForeignKey(OnboardingItem, on_delete=models.CASCADE, related_name='notes')
     text = models.TextField()
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
     def __str__(self):
         return f"Note on {self.onboarding}"
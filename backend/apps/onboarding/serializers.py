@@ -1,6 +1,6 @@
 from rest_framework import serializers
 from .models import OnboardingItem, OnboardingTask, OnboardingNote
-from apps.core.serializers import UserSerializer
+from apps.core.serializers import UserSerializer, DynamicFieldsModelSerializer
 from apps.clients.serializers import ClientProfileSerializer
 
 class OnboardingTaskSerializer(serializers.ModelSerializer):
@@ -15,7 +15,7 @@ class OnboardingNoteSerializer(serializers.ModelSerializer):
         model = OnboardingNote
         fields = '__all__'
 
-class OnboardingItemSerializer(serializers.ModelSerializer):
+class OnboardingItemSerializer(DynamicFieldsModelSerializer):
     tasks = OnboardingTaskSerializer(many=True, read_only=True)
     notes = OnboardingNoteSerializer(many=True, read_only=True)
     client_details = ClientProfileSerializer(source='client', read_only=True)
@@ -24,3 +24,10 @@ class OnboardingItemSerializer(serializers.ModelSerializer):
     class Meta:
         model = OnboardingItem
         fields = '__all__'
+
+class OnboardingItemListSerializer(OnboardingItemSerializer):
+    client_name = serializers.ReadOnlyField(source='client.company_name')
+    consultant_name = serializers.ReadOnlyField(source='consultant.username')
+
+    class Meta(OnboardingItemSerializer.Meta):
+        expandable = ('tasks', 'notes', 'client_details', 'consultant_details')
@@ -0,0 +1,10 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from apps.products.workflow import instantiate_for_onboarding
+from .models import OnboardingItem
+
+
+@receiver(post_save, sender=OnboardingItem)
+def instantiate_workflow(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        instantiate_for_onboarding(instance)
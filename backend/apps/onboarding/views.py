@@ -1,21 +1,45 @@
+from django.db import transaction
+from django.db.models import Prefetch
 from rest_framework import viewsets, permissions
+from apps.core.pagination import CreatedAtCursorPagination
 from .models import OnboardingItem, OnboardingTask, OnboardingNote
-from .serializers import OnboardingItemSerializer, OnboardingTaskSerializer, OnboardingNoteSerializer
+from apps.core.mixins import SparseFieldsetMixin, BulkModelMixin
+from apps.metrics.mixins import SerializerTimingMixin
+from .serializers import (
+    OnboardingItemSerializer, OnboardingItemListSerializer, OnboardingTaskSerializer, OnboardingNoteSerializer,
+)
 
-class OnboardingItemViewSet(viewsets.ModelViewSet):
+class OnboardingItemViewSet(SerializerTimingMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     queryset = OnboardingItem.objects.all()
     serializer_class = OnboardingItemSerializer
+    list_serializer_class = OnboardingItemListSerializer
+    select_related_fields = {
+        'client_name': ['client'],
+        'client_details': ['client'],
+        'consultant_name': ['consultant'],
+        'consultant_details': ['consultant'],
+    }
+    prefetch_related_fields = {
+        'tasks': ['tasks'],
+        'notes': [Prefetch('notes', queryset=OnboardingNote.objects.select_related('user'))],
+    }
     permission_classes = [permissions.IsAuthenticated]
     filterset_fields = ['stage', 'consultant', 'client']
 
-class OnboardingTaskViewSet(viewsets.ModelViewSet):
+    def perform_create(self, serializer):
+        # The checklist is instantiated from the product by a post_save handler
+        with transaction.atomic():
+            serializer.save()
+
+class OnboardingTaskViewSet(SerializerTimingMixin, BulkModelMixin, viewsets.ModelViewSet):
     queryset = OnboardingTask.objects.all()
     serializer_class = OnboardingTaskSerializer
     permission_classes = [permissions.IsAuthenticated]
     filterset_fields = ['onboarding', 'completed']
 
-class OnboardingNoteViewSet(viewsets.ModelViewSet):
-    queryset = OnboardingNote.objects.all()
+class OnboardingNoteViewSet(SerializerTimingMixin, viewsets.ModelViewSet):
+    queryset = OnboardingNote.objects.select_related('user')
     serializer_class = OnboardingNoteSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
     filterset_fields = ['onboarding']
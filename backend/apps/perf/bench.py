@@ -0,0 +1,272 @@
+"""
+HTTP benchmark of the router endpoints (``manage.py run_benchmark``).
+
+Every DRF router route is turned into up to four scenarios: ``list``,
+``filtered`` (the first filterset field, with a value taken from the data),
+``detail`` and ``create`` (an existing row re-posted, unique fields made
+unique). Each scenario fires ``requests`` HTTP calls at ``base_url`` from
+``concurrency`` threads; the per-request query count is measured once
+in-process with the same settings, so it reflects the configured database.
+"""
+import json
+import math
+import platform
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from decimal import Decimal
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode
+from urllib.request import Request, urlopen
+import django
+from django.conf import settings
+from django.db import connection, models
+from django.test.utils import CaptureQueriesContext
+from django.urls import get_resolver, reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from apps.clients.models import ClientProfile
+from apps.core.authentication import stamp_claims
+from apps.financial.models import LedgerEntry
+from apps.projects.models import Project
+from apps.support.models import Ticket, TicketInteraction
+from apps.tasks.models import Task
+
+KINDS = ('list', 'filtered', 'detail', 'create')
+REQUEST_TIMEOUT = 60
+# Keeps values posted by create scenarios unique across runs on the same database
+RUN_ID = format(time.time_ns() // 10**6 % 36**5, 'x')
+
+
+class Scenario:
+    def __init__(self, name, kind, method, path, body=None, unique=()):
+        self.name = name
+        self.kind = kind
+        self.method = method
+        self.path = path
+        self.body = body
+        self.unique = unique  # [(field, max_length)] suffixed per request on create
+
+    @property
+    def key(self):
+        return f'{self.name}:{self.kind}'
+
+    def payload(self, sequence):
+        if self.body is None:
+            return None
+        body = dict(self.body)
+        for field, max_length in self.unique:
+            suffix = f'-{RUN_ID}{sequence}'
+            body[field] = (str(body.get(field, '')) + suffix)[-max_length:]
+        return body
+
+
+def router_routes(patterns=None):
+    """(name, viewset class, actions) of each DRF router route, without format suffixes."""
+    for pattern in get_resolver().url_patterns if patterns is None else patterns:
+        if hasattr(pattern, 'url_patterns'):
+            yield from router_routes(pattern.url_patterns)
+            continue
+        callback = pattern.callback
+        if getattr(callback, 'cls', None) and getattr(callback, 'actions', None) \
+                and 'format' not in pattern.pattern.regex.groupindex:
+            yield pattern.name, callback.cls, callback.actions
+
+
+def _query_value(value):
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def _filter_param(viewset, queryset):
+    if getattr(viewset, 'filterset_class', None):
+        names = [
+            name for name, declared in viewset.filterset_class.base_filters.items()
+            if declared.lookup_expr == 'exact'
+        ]
+    else:
+        names = list(getattr(viewset, 'filterset_fields', None) or ())
+    model_fields = {field.name for field in queryset.model._meta.concrete_fields}
+    for name in names:
+        if name not in model_fields:
+            continue
+        value = queryset.exclude(**{f'{name}__isnull': True}).values_list(name, flat=True).first()
+        if value is not None:
+            return name, _query_value(value)
+    return None
+
+
+def _jsonable(value):
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _create_body(viewset, instance):
+    serializer = viewset.serializer_class(instance, context={'request': None})
+    body = {}
+    for name, field in serializer.fields.items():
+        if field.read_only or name not in serializer.data or serializer.data[name] is None:
+            continue
+        body[name] = _jsonable(serializer.data[name])
+    unique = []
+    for field in instance._meta.concrete_fields:
+        if field.unique and not field.primary_key and isinstance(field, models.CharField) and field.name in body:
+            unique.append((field.name, field.max_length))
+    return body, unique
+
+
+def discover(kinds=KINDS, only=None):
+    scenarios = []
+    for name, viewset, actions in router_routes():
+        if only and not any(part in name for part in only):
+            continue
+        queryset = getattr(viewset, 'queryset', None)
+        if name.endswith('-list'):
+            path = reverse(name)
+            if actions.get('get') == 'list':
+                if 'list' in kinds:
+                    scenarios.append(Scenario(name, 'list', 'GET', path))
+                param = _filter_param(viewset, queryset) if 'filtered' in kinds and queryset is not None else None
+                if param:
+                    scenarios.append(Scenario(name, 'filtered', 'GET', f'{path}?{urlencode([param])}'))
+            if actions.get('post') == 'create' and 'create' in kinds and queryset is not None:
+                instance = queryset.order_by('pk').first()
+                if instance is not None:
+                    body, unique = _create_body(viewset, instance)
+                    scenarios.append(Scenario(name, 'create', 'POST', path, body, unique))
+        elif name.endswith('-detail') and actions.get('get') == 'retrieve' and 'detail' in kinds:
+            pk = queryset.order_by('pk').values_list('pk', flat=True).first() if queryset is not None else None
+            if pk is not None:
+                scenarios.append(Scenario(name, 'detail', 'GET', reverse(name, kwargs={'pk': pk})))
+    return scenarios
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a sorted list."""
+    if not values:
+        return None
+    return values[min(len(values) - 1, max(math.ceil(pct / 100 * len(values)) - 1, 0))]
+
+
+def count_queries(scenario, user):
+    client = APIClient()
+    client.force_authenticate(user)
+    with CaptureQueriesContext(connection) as ctx:
+        if scenario.method == 'POST':
+            client.post(scenario.path, scenario.payload('q'), format='json')
+        else:
+            client.get(scenario.path)
+    return len(ctx)
+
+
+class Runner:
+    def __init__(self, base_url, user, requests=200, concurrency=8, warmup=5, measure_queries=True):
+        self.base_url = base_url.rstrip('/')
+        self.user = user
+        self.token = str(stamp_claims(AccessToken.for_user(user), user))
+        self.requests = requests
+        self.concurrency = concurrency
+        self.warmup = warmup
+        self.measure_queries = measure_queries
+
+    def call(self, scenario, sequence):
+        body = scenario.payload(sequence)
+        headers = {'Authorization': f'Bearer {self.token}', 'Accept': 'application/json'}
+        data = None
+        if body is not None:
+            data = json.dumps(body).encode()
+            headers['Content-Type'] = 'application/json'
+        request = Request(self.base_url + scenario.path, data=data, headers=headers, method=scenario.method)
+        started = time.perf_counter()
+        try:
+            with urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+                size = len(response.read())
+                status = response.status
+        except HTTPError as error:
+            size, status = len(error.read()), error.code
+        except URLError:
+            size, status = 0, None
+        return time.perf_counter() - started, status, size
+
+    def run(self, scenario):
+        for sequence in range(self.warmup):
+            self.call(scenario, f'w{sequence}')
+        started = time.perf_counter()
+        with ThreadPoolExecutor(self.concurrency) as pool:
+            results = list(pool.map(lambda sequence: self.call(scenario, sequence), range(self.requests)))
+        wall = time.perf_counter() - started
+        latencies = sorted(elapsed * 1000 for elapsed, _, _ in results)
+        statuses = {}
+        for _, status, _ in results:
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+        return {
+            'name': scenario.name,
+            'kind': scenario.kind,
+            'method': scenario.method,
+            'path': scenario.path,
+            'requests': len(results),
+            'errors': sum(1 for _, status, _ in results if status is None or status >= 400),
+            'statuses': statuses,
+            'p50_ms': round(percentile(latencies, 50), 2),
+            'p95_ms': round(percentile(latencies, 95), 2),
+            'p99_ms': round(percentile(latencies, 99), 2),
+            'mean_ms': round(sum(latencies) / len(latencies), 2),
+            'max_ms': round(latencies[-1], 2),
+            'throughput_rps': round(len(results) / wall, 1),
+            'bytes_mean': round(sum(size for _, _, size in results) / len(results)),
+            'queries': count_queries(scenario, self.user) if self.measure_queries else None,
+        }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=settings.BASE_DIR, capture_output=True, text=True, timeout=5,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def row_counts():
+    return {
+        model._meta.label: model.objects.count()
+        for model in (ClientProfile, Project, Task, Ticket, TicketInteraction, LedgerEntry)
+    }
+
+
+def metadata(runner):
+    return {
+        'started_at': timezone.now().isoformat(),
+        'git_commit': git_commit(),
+        'base_url': runner.base_url,
+        'database': connection.vendor,
+        'requests': runner.requests,
+        'concurrency': runner.concurrency,
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'rows': row_counts(),
+    }
+
+
+def compare(report, baseline):
+    """Attach the baseline's p95/throughput to each matching scenario."""
+    previous = {(item['name'], item['kind']): item for item in baseline.get('scenarios', [])}
+    for item in report['scenarios']:
+        before = previous.get((item['name'], item['kind']))
+        if before is None:
+            continue
+        item['baseline'] = {
+            'p95_ms': before['p95_ms'],
+            'throughput_rps': before['throughput_rps'],
+            'queries': before.get('queries'),
+            'p95_change': round(item['p95_ms'] / before['p95_ms'] - 1, 3) if before['p95_ms'] else None,
+        }
+    return report
@@ -0,0 +1,133 @@
+"""
+WSGI vs ASGI concurrency on a network-bound endpoint (``manage.py bench_concurrency``).
+
+The fake Google API is started with an artificial latency and one bench user
+with a Google account is created per client. The app is then served twice
+with the same number of processes, gunicorn sync workers (WSGI) and uvicorn
+(ASGI), and ``POST /api/google/sync/?wait=true`` is fired from
+``concurrency`` clients at once. A sync worker holds the request for the
+whole Google round-trip; the async view releases the worker while it waits.
+"""
+import socket
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+from django.conf import settings
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import AccessToken
+from apps.core.authentication import stamp_claims
+from apps.core.models import User
+from apps.google_sync.fake_server import FakeGoogle
+from apps.google_sync.models import GoogleAccount
+from .bench import percentile
+
+SERVERS = {
+    'wsgi': ['-m', 'gunicorn', 'potencialize_core.wsgi:application', '--workers', '{workers}',
+             '--bind', '127.0.0.1:{port}', '--log-level', 'warning'],
+    'asgi': ['-m', 'uvicorn', 'potencialize_core.asgi:application', '--workers', '{workers}',
+             '--host', '127.0.0.1', '--port', '{port}', '--log-level', 'warning'],
+}
+USER_PREFIX = 'bench-concurrency-'
+ENDPOINT = '/api/google/sync/?wait=true'
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f'Servidor não respondeu na porta {port}.')
+
+
+def create_clients(count):
+    """Tokens of ``count`` bench users, each with a connected Google account."""
+    tokens = []
+    for index in range(count):
+        user, _ = User.objects.get_or_create(username=f'{USER_PREFIX}{index}')
+        GoogleAccount.objects.update_or_create(user=user, defaults={
+            'access_token': 'bench', 'refresh_token': '', 'calendar_sync_token': '',
+            'token_expiry': timezone.now() + timedelta(days=1), 'enabled': False,
+        })
+        tokens.append(str(stamp_claims(AccessToken.for_user(user), user)))
+    return tokens
+
+
+def remove_clients():
+    User.objects.filter(username__startswith=USER_PREFIX).delete()
+
+
+def call(base_url, token):
+    request = Request(base_url + ENDPOINT, data=b'', method='POST', headers={'Authorization': f'Bearer {token}'})
+    started = time.perf_counter()
+    try:
+        with urlopen(request, timeout=120) as response:
+            response.read()
+            status = response.status
+    except HTTPError as error:
+        status = error.code
+    except URLError:
+        status = None
+    return time.perf_counter() - started, status
+
+
+def run_mode(mode, tokens, requests, workers, env):
+    port = free_port()
+    args = [arg.format(workers=workers, port=port) for arg in SERVERS[mode]]
+    server = subprocess.Popen([sys.executable, *args], cwd=settings.BASE_DIR, env=env)
+    try:
+        wait_for_port(port)
+        base_url = f'http://127.0.0.1:{port}'
+        call(base_url, tokens[0])  # warm up imports and connections
+        started = time.perf_counter()
+        with ThreadPoolExecutor(len(tokens)) as pool:
+            results = list(pool.map(lambda index: call(base_url, tokens[index % len(tokens)]), range(requests)))
+        wall = time.perf_counter() - started
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+    latencies = sorted(elapsed * 1000 for elapsed, _ in results)
+    return {
+        'mode': mode,
+        'requests': len(results),
+        'errors': sum(1 for _, status in results if status != 200),
+        'wall_seconds': round(wall, 2),
+        'throughput_rps': round(len(results) / wall, 1),
+        'p50_ms': round(percentile(latencies, 50), 1),
+        'p95_ms': round(percentile(latencies, 95), 1),
+        'p99_ms': round(percentile(latencies, 99), 1),
+    }
+
+
+def run(concurrency=50, requests=200, workers=1, latency=0.3, env=None):
+    fake = FakeGoogle()
+    fake.delay = latency
+    fake.start()
+    env = {**(env or {}), 'GOOGLE_API_BASE_URL': fake.base_url, 'GOOGLE_OAUTH_TOKEN_URL': fake.token_url}
+    try:
+        tokens = create_clients(concurrency)
+        results = [run_mode(mode, tokens, requests, workers, env) for mode in SERVERS]
+    finally:
+        fake.stop()
+        remove_clients()
+    wsgi, asgi = results
+    return {
+        'endpoint': ENDPOINT,
+        'upstream_latency_seconds': latency,
+        'concurrency': concurrency,
+        'workers': workers,
+        'results': results,
+        'throughput_gain': round(asgi['throughput_rps'] / wsgi['throughput_rps'], 1) if wsgi['throughput_rps'] else None,
+    }
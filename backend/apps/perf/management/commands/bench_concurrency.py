@@ -0,0 +1,32 @@
+import json
+import os
+from django.core.management.base import BaseCommand
+from apps.perf.concurrency import run
+
+
+class Command(BaseCommand):
+    help = 'Compare WSGI (gunicorn sync) and ASGI (uvicorn) throughput on a network-bound endpoint.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=50, help='Simultaneous clients.')
+        parser.add_argument('--requests', type=int, default=200)
+        parser.add_argument('--workers', type=int, default=1, help='Server processes in both modes.')
+        parser.add_argument('--latency', type=float, default=0.3, help='Seconds the fake Google takes per call.')
+        parser.add_argument('--output', help='Write the JSON report here instead of stdout.')
+
+    def handle(self, *args, **options):
+        report = run(
+            concurrency=options['concurrency'], requests=options['requests'],
+            workers=options['workers'], latency=options['latency'], env=dict(os.environ),
+        )
+        for result in report['results']:
+            self.stderr.write(
+                f"{result['mode']}: {result['throughput_rps']} req/s, p50 {result['p50_ms']}ms, "
+                f"p95 {result['p95_ms']}ms, {result['errors']} errors"
+            )
+        output = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w') as handle:
+                handle.write(output + '\n')
+        else:
+            self.stdout.write(output)
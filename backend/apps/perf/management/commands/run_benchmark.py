@@ -0,0 +1,53 @@
+import json
+from django.core.management.base import BaseCommand, CommandError
+from apps.core.models import User
+from apps.perf.bench import KINDS, Runner, compare, discover, metadata
+
+
+class Command(BaseCommand):
+    help = 'Benchmark every router endpoint over HTTP and print a JSON report (p50/p95/p99, throughput, queries).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+        parser.add_argument('--user', help='Username to authenticate as (default: first superuser).')
+        parser.add_argument('--requests', type=int, default=200, help='Measured requests per scenario.')
+        parser.add_argument('--concurrency', type=int, default=8)
+        parser.add_argument('--warmup', type=int, default=5)
+        parser.add_argument('--kinds', default=','.join(KINDS), help=f"Comma-separated subset of {', '.join(KINDS)}.")
+        parser.add_argument('--only', action='append', help='Only routes whose name contains this (repeatable).')
+        parser.add_argument('--no-queries', action='store_true', help='Skip the in-process query count.')
+        parser.add_argument('--baseline', help='Earlier report to compare p95 and throughput against.')
+        parser.add_argument('--output', help='Write the report here instead of stdout.')
+
+    def handle(self, *args, **options):
+        users = User.objects.filter(is_active=True)
+        user = users.filter(username=options['user']).first() if options['user'] else \
+            users.order_by('-is_superuser', 'pk').first()
+        if user is None:
+            raise CommandError('No user to authenticate as.')
+        kinds = [kind for kind in options['kinds'].split(',') if kind]
+        if set(kinds) - set(KINDS):
+            raise CommandError(f"Unknown kinds: {', '.join(set(kinds) - set(KINDS))}")
+
+        runner = Runner(
+            options['base_url'], user, requests=options['requests'], concurrency=options['concurrency'],
+            warmup=options['warmup'], measure_queries=not options['no_queries'],
+        )
+        report = {'meta': metadata(runner), 'scenarios': []}
+        for scenario in discover(kinds, options['only']):
+            result = runner.run(scenario)
+            report['scenarios'].append(result)
+            self.stderr.write(
+                f"{scenario.key:45} p50 {result['p50_ms']:8.1f}ms  p95 {result['p95_ms']:8.1f}ms  "
+                f"{result['throughput_rps']:7.1f} req/s  {result['queries']} queries  {result['errors']} errors"
+            )
+        if options['baseline']:
+            with open(options['baseline']) as handle:
+                compare(report, json.load(handle))
+
+        output = json.dumps(report, indent=2, ensure_ascii=False)
+        if options['output']:
+            with open(options['output'], 'w') as handle:
+                handle.write(output + '\n')
+        else:
+            self.stdout.write(output)
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand, CommandError
+from apps.perf.seed import VOLUMES, Seeder, volumes
+
+
+class Command(BaseCommand):
+    help = 'Generate realistic-volume data for benchmarks (same --seed and --scale give the same data set).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--scale', type=float, default=1.0,
+                            help='Multiplier on the default volumes (1 = 500k tasks, 1M ledger entries...).')
+        parser.add_argument('--count', action='append', default=[], metavar='ENTITY=N',
+                            help=f"Override one entity's row count; entities: {', '.join(VOLUMES)}.")
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--batch-size', type=int, default=5000)
+        parser.add_argument('--no-index', action='store_true', help='Skip rebuilding the search index.')
+
+    def handle(self, *args, **options):
+        overrides = {}
+        for item in options['count']:
+            name, _, value = item.partition('=')
+            if name not in VOLUMES or not value.isdigit():
+                raise CommandError(f'Invalid --count {item!r}.')
+            overrides[name] = int(value)
+        counts = volumes(options['scale'], overrides)
+        Seeder(
+            counts, seed=options['seed'], batch_size=options['batch_size'],
+            stdout=self.stdout, index=not options['no_index'],
+        ).run()
+        self.stdout.write(self.style.SUCCESS(f'{sum(counts.values())} rows generated.'))
@@ -0,0 +1,304 @@
+"""
+Realistic-volume data for performance work (``manage.py seed_perf``).
+
+Rows are generated from a seeded ``random.Random`` so two runs with the same
+seed and scale produce the same data set, and are inserted with
+``bulk_create`` in chunks, so memory stays flat at any volume. ``bulk_create``
+skips the model signals; the derived data they maintain (project task
+counters, ledger rollups, search documents) is rebuilt once at the end.
+"""
+import random
+import time
+from datetime import datetime, time as dt_time, timedelta
+from decimal import Decimal
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from apps.clients.models import ClientProfile
+from apps.core.caching import bump_model_version
+from apps.core.models import Role, User
+from apps.crm.analytics import PIPELINE
+from apps.crm.models import Activity, Deal, DealStageTransition, Lead
+from apps.financial.models import LedgerEntry, LedgerMonthlyRollup
+from apps.onboarding.models import OnboardingItem, OnboardingTask
+from apps.products.models import Product, WorkflowStep
+from apps.projects.models import Project, ProjectDocument, ProjectMeeting, ProjectNote
+from apps.search.index import rebuild as rebuild_search_index
+from apps.support.models import Ticket, TicketInteraction
+from apps.tasks.models import SubTask, Task
+
+# Rows per entity at --scale 1
+VOLUMES = {
+    'users': 50,
+    'products': 12,
+    'clients': 10_000,
+    'projects': 50_000,
+    'meetings': 50_000,
+    'documents': 50_000,
+    'notes': 100_000,
+    'tasks': 500_000,
+    'subtasks': 250_000,
+    'tickets': 100_000,
+    'interactions': 1_000_000,
+    'ledger': 1_000_000,
+    'leads': 20_000,
+    'deals': 20_000,
+    'activities': 100_000,
+    'onboarding': 10_000,
+    'onboarding_tasks': 50_000,
+}
+# Never scaled below these, so small runs still have owners to spread rows over
+MINIMUM = {'users': 5, 'products': 3}
+
+FIRST_NAMES = ['Ana', 'Bruno', 'Carla', 'Diego', 'Eduarda', 'Felipe', 'Gabriela', 'Henrique', 'Isabela', 'João',
+               'Larissa', 'Marcos', 'Natália', 'Otávio', 'Paula', 'Rafael', 'Sabrina', 'Thiago', 'Vanessa', 'Wagner']
+LAST_NAMES = ['Silva', 'Santos', 'Oliveira', 'Souza', 'Lima', 'Pereira', 'Ferreira', 'Costa', 'Rodrigues', 'Almeida',
+              'Nascimento', 'Carvalho', 'Araújo', 'Ribeiro', 'Gomes', 'Martins', 'Rocha', 'Barbosa']
+COMPANY_WORDS = ['Contábil', 'Assessoria', 'Contabilidade', 'Gestão', 'Escritório', 'Consultoria', 'Fiscal',
+                 'Empresarial', 'Serviços', 'Auditoria']
+CITIES = [('São Paulo', 'SP'), ('Campinas', 'SP'), ('Rio de Janeiro', 'RJ'), ('Belo Horizonte', 'MG'),
+          ('Curitiba', 'PR'), ('Porto Alegre', 'RS'), ('Florianópolis', 'SC'), ('Salvador', 'BA'),
+          ('Recife', 'PE'), ('Fortaleza', 'CE'), ('Goiânia', 'GO'), ('Brasília', 'DF')]
+TASK_TITLES = ['Levantar processos do setor', 'Revisar plano de contas', 'Mapear rotina fiscal',
+               'Enviar relatório mensal', 'Reunião de alinhamento', 'Configurar integração',
+               'Validar folha de pagamento', 'Treinar equipe', 'Atualizar POP', 'Conferir obrigações acessórias']
+TICKET_TITLES = ['Erro na importação de notas', 'Dúvida sobre apuração', 'Acesso ao sistema',
+                 'Divergência no balancete', 'Ajuste na folha', 'Certificado digital vencido']
+
+
+def volumes(scale=1.0, overrides=None):
+    counts = {name: max(int(count * scale), MINIMUM.get(name, 0)) for name, count in VOLUMES.items()}
+    counts.update(overrides or {})
+    return counts
+
+
+class Seeder:
+    def __init__(self, counts, seed=42, batch_size=5000, stdout=None, index=True):
+        self.counts = counts
+        self.rng = random.Random(seed)
+        self.batch_size = batch_size
+        self.stdout = stdout
+        self.index = index
+        self.today = timezone.localdate()
+        self.now = timezone.now()
+
+    def log(self, message):
+        if self.stdout:
+            self.stdout.write(message)
+
+    # Helpers
+
+    def person(self):
+        return f'{self.rng.choice(FIRST_NAMES)} {self.rng.choice(LAST_NAMES)}'
+
+    def company(self):
+        return f'{self.rng.choice(LAST_NAMES)} {self.rng.choice(COMPANY_WORDS)}'
+
+    def phone(self):
+        return f'({self.rng.randint(11, 99)}) 9{self.rng.randint(1000, 9999)}-{self.rng.randint(1000, 9999)}'
+
+    def day(self, back=720, ahead=0):
+        return self.today + timedelta(days=self.rng.randint(-back, ahead))
+
+    def moment(self, back=720, ahead=0):
+        minutes = self.rng.randrange(8 * 60, 18 * 60, 30)
+        return timezone.make_aware(datetime.combine(self.day(back, ahead), dt_time(minutes // 60, minutes % 60)))
+
+    def insert(self, model, name, build):
+        """Bulk insert ``counts[name]`` rows from ``build(i)``; returns the new ids."""
+        total = self.counts.get(name, 0)
+        before = model.objects.aggregate(top=Max('pk'))['top'] or 0
+        started = time.monotonic()
+        for start in range(0, total, self.batch_size):
+            rows = [build(i) for i in range(start, min(start + self.batch_size, total))]
+            with transaction.atomic():
+                model.objects.bulk_create(rows, batch_size=self.batch_size)
+        ids = list(model.objects.filter(pk__gt=before).order_by('pk').values_list('pk', flat=True))
+        elapsed = time.monotonic() - started
+        self.log(f'{name}: {len(ids)} rows in {elapsed:.1f}s ({len(ids) / max(elapsed, 1e-6):,.0f}/s)')
+        return ids
+
+    def offset(self, model):
+        """Start of unique codes for this run, so reruns on the same database don't collide."""
+        return (model.objects.aggregate(top=Max('pk'))['top'] or 0) + 1
+
+    # Entities
+
+    def run(self):
+        rng = self.rng
+        role = Role.objects.filter(pk='consultant').first()
+        password = make_password('perf-password')
+        first_user = self.offset(User)
+
+        def user(i):
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            return User(
+                username=f'perf{first_user + i}', first_name=first, last_name=last, password=password,
+                email=f'perf{first_user + i}@example.com', role=role,
+            )
+        users = self.insert(User, 'users', user)
+
+        def product(i):
+            category = rng.choice(['Diagnóstico', 'Assessoria', 'Club', 'Horas', 'Curso'])
+            return Product(
+                title=f'{category} {i + 1}', price=Decimal(rng.randrange(500, 20000, 50)),
+                price_model=rng.choice(['fixed', 'monthly', 'yearly', 'hourly']),
+                description=f'{category} para escritórios contábeis.',
+                category=category, payment_methods='Pix, Boleto', onboarding_process='', automation_desc='',
+            )
+        products = self.insert(Product, 'products', product)
+        self.counts['workflow_steps'] = len(products) * 5
+        self.insert(WorkflowStep, 'workflow_steps', lambda i: WorkflowStep(
+            product_id=products[i // 5], title=rng.choice(TASK_TITLES), description='',
+            step_type=('meeting', 'task', 'task', 'milestone', 'task')[i % 5], relative_days=(i % 5) * 7,
+        ))
+
+        first_client = self.offset(ClientProfile)
+
+        def client(i):
+            city, state = rng.choice(CITIES)
+            return ClientProfile(
+                company_name=self.company(), cnpj=f'{first_client + i:014d}', responsible_name=self.person(),
+                responsible_phone=self.phone(), city=city, state=state,
+                employee_count=rng.randint(2, 80), client_count=rng.randint(10, 900),
+                has_mapped_processes=rng.random() < 0.3,
+                status=rng.choices(['Ativo', 'Inativo', 'Churn'], [85, 10, 5])[0], joined_at=self.day(1500),
+            )
+        clients = self.insert(ClientProfile, 'clients', client)
+
+        first_project = self.offset(Project)
+
+        def project(i):
+            start = self.day(720, 30)
+            return Project(
+                code=f'PRF-{first_project + i:07d}', title=f'Projeto {self.company()}', description='',
+                project_type=rng.choice(['Diagnóstico', 'Assessoria', 'Recorrência', 'Implementação', 'Club']),
+                product_id=rng.choice(products), client_id=rng.choice(clients),
+                manager_id=rng.choice(users), specialist_id=rng.choice(users),
+                interlocutor_name=self.person(), interlocutor_contact=self.phone(),
+                status=rng.choices(['Em Andamento', 'Concluído', 'Pausado', 'Coleta de Dados'], [60, 25, 5, 10])[0],
+                start_date=start, end_date=start + timedelta(days=rng.choice([90, 180, 365])),
+                financial_value=Decimal(rng.randrange(2000, 60000, 100)), hours_sold=rng.choice([20, 40, 80]),
+            )
+        projects = self.insert(Project, 'projects', project)
+
+        self.insert(ProjectMeeting, 'meetings', lambda i: ProjectMeeting(
+            project_id=rng.choice(projects), title='Reunião de acompanhamento', date=self.moment(360, 60),
+            duration_minutes=rng.choice([30, 60, 90]), attendees=self.person(),
+        ))
+        self.insert(ProjectDocument, 'documents', lambda i: ProjectDocument(
+            project_id=rng.choice(projects), title=f'Documento {i + 1}',
+            doc_type=rng.choice(['POP', 'Planilha', 'Contrato', 'Relatório', 'Diagnóstico']),
+            url=f'https://drive.example.com/{i + 1}', uploaded_by_id=rng.choice(users),
+        ))
+        self.insert(ProjectNote, 'notes', lambda i: ProjectNote(
+            project_id=rng.choice(projects), text='Acompanhamento registrado.',
+            note_type=rng.choice(['internal', 'external', 'risk', 'highlight']), author_id=rng.choice(users),
+        ))
+
+        def task(i):
+            due = self.day(365, 90)
+            if due < self.today:
+                status = rng.choices(['completed', 'overdue', 'in_progress'], [75, 20, 5])[0]
+            else:
+                status = rng.choices(['pending', 'in_progress', 'completed'], [60, 30, 10])[0]
+            return Task(
+                title=rng.choice(TASK_TITLES), description='', status=status, due_date=due,
+                assigned_to_id=rng.choice(users), project_id=rng.choice(projects),
+                assignee_type=rng.choices(['consultant', 'client'], [85, 15])[0],
+            )
+        tasks = self.insert(Task, 'tasks', task)
+        self.insert(SubTask, 'subtasks', lambda i: SubTask(
+            task_id=rng.choice(tasks), title='Checklist', completed=rng.random() < 0.5,
+        ))
+
+        def ticket(i):
+            instance = Ticket(
+                project_id=rng.choice(projects), title=rng.choice(TICKET_TITLES),
+                description='Cliente relatou o problema pelo portal.',
+                ticket_type='Dúvida', area=rng.choice(['Fiscal', 'Contábil', 'Pessoal', 'Financeiro', 'TI']),
+                priority=rng.choices(['Baixa', 'Média', 'Alta', 'Urgente'], [30, 40, 20, 10])[0],
+                status=rng.choices(['Aberto', 'Em Análise', 'Aguardando Cliente', 'Resolvido', 'Concluído'],
+                                   [15, 15, 10, 30, 30])[0],
+                opened_by_id=rng.choice(users), assigned_to_id=rng.choice(users),
+            )
+            instance.apply_sla(now=self.now)
+            return instance
+        tickets = self.insert(Ticket, 'tickets', ticket)
+        self.insert(TicketInteraction, 'interactions', lambda i: TicketInteraction(
+            ticket_id=rng.choice(tickets), text='Mensagem registrada no chamado.',
+            sender_id=rng.choice(users), role=rng.choice(['client', 'support']),
+        ))
+
+        self.insert(LedgerEntry, 'ledger', lambda i: LedgerEntry(
+            ledger_type=rng.choices(['credit', 'debit'], [60, 40])[0],
+            amount=Decimal(rng.randrange(50, 500000)) / 100, description='Lançamento',
+            date=self.day(1095), consultant_id=rng.choice(users),
+        ))
+
+        self.insert(Lead, 'leads', lambda i: Lead(
+            name=self.person(), company=self.company(), email=f'lead{i}@example.com', phone=self.phone(),
+            status=rng.choice(['Novo', 'Contatado', 'Qualificado']),
+        ))
+        deals = self.insert(Deal, 'deals', lambda i: Deal(
+            title=f'Proposta {self.company()}', value=Decimal(rng.randrange(1000, 80000, 100)),
+            stage=rng.choices(['Lead', 'Contato', 'Proposta', 'Negociação', 'Ganho', 'Perdido'],
+                              [25, 20, 20, 10, 15, 10])[0],
+            product_interest='Assessoria', company=self.company(), owner_id=rng.choice(users),
+        ))
+        self.stage_history(deals)
+        self.insert(Activity, 'activities', lambda i: Activity(
+            activity_type=rng.choice(['Follow Up', 'Ligação', 'Reunião externa', 'Visita']),
+            title='Contato com cliente', description='', date=self.moment(360, 30),
+            duration_minutes=rng.choice([15, 30, 60]), deal_id=rng.choice(deals) if deals else None,
+            user_id=rng.choice(users), status=rng.choice(['pending', 'done']),
+        ))
+
+        onboarding = self.insert(OnboardingItem, 'onboarding', lambda i: OnboardingItem(
+            client_id=rng.choice(clients), product_id=rng.choice(products), product_name='Assessoria',
+            stage=rng.choice(['Pendente de Kickoff', 'Em andamento', 'Concluído']),
+            start_date=self.day(360), consultant_id=rng.choice(users),
+        ))
+        self.insert(OnboardingTask, 'onboarding_tasks', lambda i: OnboardingTask(
+            onboarding_id=rng.choice(onboarding), title=rng.choice(TASK_TITLES),
+            completed=rng.random() < 0.5, due_date=self.day(180, 60), assigned_to_id=rng.choice(users),
+        ))
+
+        self.rebuild_derived()
+
+    def stage_history(self, deal_ids):
+        """Transitions walking each deal through the pipeline up to its stage, within the past year."""
+        rng = self.rng
+        started = time.monotonic()
+        total = 0
+        for start in range(0, len(deal_ids), self.batch_size):
+            rows = []
+            for pk, stage in Deal.objects.filter(pk__in=deal_ids[start:start + self.batch_size]).values_list('pk', 'stage'):
+                if stage == 'Perdido':
+                    path = list(PIPELINE[:rng.randint(1, len(PIPELINE) - 1)]) + ['Perdido']
+                else:
+                    path = PIPELINE[:PIPELINE.index(stage) + 1]
+                moment = self.now - timedelta(days=rng.randint(30, 365), minutes=rng.randint(0, 24 * 60))
+                previous = ''
+                for to_stage in path:
+                    rows.append(DealStageTransition(
+                        deal_id=pk, from_stage=previous, to_stage=to_stage, changed_at=min(moment, self.now),
+                    ))
+                    previous = to_stage
+                    moment += timedelta(days=rng.randint(1, 21), minutes=rng.randint(0, 24 * 60))
+            with transaction.atomic():
+                DealStageTransition.objects.bulk_create(rows, batch_size=self.batch_size)
+            total += len(rows)
+        self.log(f'stage_transitions: {total} rows in {time.monotonic() - started:.1f}s')
+
+    def rebuild_derived(self):
+        started = time.monotonic()
+        Project.rebuild_task_counters()
+        LedgerMonthlyRollup.rebuild()
+        if self.index:
+            rebuild_search_index()
+        for model in (ClientProfile, Product, WorkflowStep, Role, Project, ProjectMeeting, Task, Ticket, LedgerEntry,
+                      Deal, DealStageTransition, Activity, OnboardingItem):
+            bump_model_version(model)
+        self.log(f'derived data rebuilt in {time.monotonic() - started:.1f}s')
@@ -1,16 +1,23 @@
 from rest_framework import viewsets, permissions
+from apps.core.mixins import CachedResponseMixin
 from .models import Product, WorkflowStep
 from .serializers import ProductSerializer, WorkflowStepSerializer
+from apps.metrics.mixins import SerializerTimingMixin
 
-class ProductViewSet(viewsets.ModelViewSet):
-    queryset = Product.objects.all()
+class ProductViewSet(SerializerTimingMixin, CachedResponseMixin, viewsets.ModelViewSet):
+    queryset = Product.objects.prefetch_related('workflow_steps')
     serializer_class = ProductSerializer
     permission_classes = [permissions.IsAuthenticated]
+    # The catalogue is the same for everyone with a given role
+    cache_models = (Product, WorkflowStep)
+    cache_scope = 'role'
     filterset_fields = ['category', 'price_model']
     search_fields = ['title', 'description']
 
-class WorkflowStepViewSet(viewsets.ModelViewSet):
+class WorkflowStepViewSet(SerializerTimingMixin, CachedResponseMixin, viewsets.ModelViewSet):
     queryset = WorkflowStep.objects.all()
     serializer_class = WorkflowStepSerializer
     permission_classes = [permissions.IsAuthenticated]
+    cache_models = (WorkflowStep,)
+    cache_scope = 'role'
     filterset_fields = ['product', 'step_type']
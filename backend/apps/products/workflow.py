@@ -0,0 +1,78 @@
+"""Turn a product's workflow steps into real tasks, meetings and checklists.
+
+Each function reads the steps once and writes one ``bulk_create`` per target
+model, so the query count does not grow with the size of the template.
+"""
+from datetime import datetime, time, timedelta
+from django.db import transaction
+from django.utils import timezone
+from apps.core.bulk import bulk_create_with_signal
+
+# Meetings generated from a template are booked at the start of the workday
+MEETING_TIME = time(9, 0)
+
+
+def step_date(start, step):
+    return start + timedelta(days=step.relative_days)
+
+
+def step_datetime(start, step):
+    return timezone.make_aware(datetime.combine(step_date(start, step), MEETING_TIME))
+
+
+def steps_for(product):
+    return list(product.workflow_steps.order_by('relative_days', 'id'))
+
+
+def instantiate_for_project(project):
+    """Meetings become ProjectMeetings; tasks and milestones become Tasks."""
+    from apps.projects.models import ProjectMeeting
+    from apps.tasks.models import Task
+
+    if project.product_id is None:
+        return
+    start = project.start_date or timezone.localdate()
+    assignee_id = project.specialist_id or project.manager_id
+    meetings, tasks = [], []
+    for step in steps_for(project.product):
+        if step.step_type == 'meeting':
+            meetings.append(ProjectMeeting(
+                project=project,
+                title=step.title,
+                date=step_datetime(start, step),
+                duration_minutes=step.duration_hours * 60,
+                attendees='',
+            ))
+        else:
+            tasks.append(Task(
+                project=project,
+                title=step.title,
+                description=step.description,
+                due_date=step_date(start, step),
+                assigned_to_id=assignee_id,
+            ))
+    with transaction.atomic():
+        bulk_create_with_signal(ProjectMeeting, meetings)
+        bulk_create_with_signal(Task, tasks)
+    if tasks:
+        # The task counters were bumped in SQL; bring the instance up to date
+        project.refresh_from_db(fields=['tasks_total', 'tasks_done', 'tasks_overdue', 'progress', 'sla_status', 'last_update'])
+
+
+def instantiate_for_onboarding(item):
+    """Every step becomes an OnboardingTask in the onboarding checklist."""
+    from apps.onboarding.models import OnboardingTask
+
+    if item.product_id is None:
+        return
+    tasks = [
+        OnboardingTask(
+            onboarding=item,
+            title=step.title,
+            due_date=step_date(item.start_date, step),
+            assigned_to_id=item.consultant_id,
+        )
+        for step in steps_for(item.product)
+    ]
+    with transaction.atomic():
+        bulk_create_with_signal(OnboardingTask, tasks)
@@ -0,0 +1,8 @@
+from apps.jobs.registry import register
+from .models import Project
+
+
+@register('projects.rebuild_task_counters')
+def rebuild_task_counters(ids=None):
+    queryset = Project.objects.filter(pk__in=ids) if ids else None
+    return Project.rebuild_task_counters(queryset)
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from apps.projects.models import Project
+
+
+class Command(BaseCommand):
+    help = 'Recount task counters (and progress/sla_status) for every project.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('ids', nargs='*', type=int, help='Only these project ids.')
+
+    def handle(self, *args, **options):
+        queryset = Project.objects.all()
+        if options['ids']:
+            queryset = queryset.filter(pk__in=options['ids'])
+        count = Project.rebuild_task_counters(queryset)
+        self.stdout.write(self.style.SUCCESS(f'{count} projects recounted.'))
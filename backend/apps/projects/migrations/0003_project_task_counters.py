@@ -0,0 +1,61 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:55
+
+from django.db import migrations, models
+from django.db.models import Case, Count, F, Q, Value, When
+from django.db.models.lookups import GreaterThan
+from django.utils import timezone
+
+
+def backfill_counters(apps, schema_editor):
+    Project = apps.get_model('projects', 'Project')
+    projects = list(
+        Project.objects.annotate(
+            counted_total=Count('tasks'),
+            counted_done=Count('tasks', filter=Q(tasks__status='completed')),
+            counted_overdue=Count('tasks', filter=Q(tasks__status='overdue')),
+        ).filter(counted_total__gt=0).only('id')
+    )
+    for project in projects:
+        project.tasks_total = project.counted_total
+        project.tasks_done = project.counted_done
+        project.tasks_overdue = project.counted_overdue
+    Project.objects.bulk_update(projects, ['tasks_total', 'tasks_done', 'tasks_overdue'], batch_size=500)
+    # progress/sla_status follow the counters from now on. Same rules as
+    # Project.derived_from_counters at the time of writing, copied here so later
+    # model changes don't alter this migration; every row has tasks_total > 0
+    Project.objects.filter(pk__in=[project.pk for project in projects]).update(
+        progress=F('tasks_done') * 100 / F('tasks_total'),
+        sla_status=Case(
+            When(tasks_overdue=0, then=Value('ok')),
+            When(GreaterThan(F('tasks_overdue') * 5, F('tasks_total')), then=Value('delay')),
+            default=Value('warning'),
+        ),
+        last_update=timezone.now(),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_alter_projectmeeting_date_and_more'),
+        ('tasks', '0002_task_tasks_task_project_b78682_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='tasks_done',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='tasks_overdue',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='tasks_total',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
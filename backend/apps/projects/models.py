@@ -1,6 +1,10 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Case, Count, F, IntegerField, Q, Value, When
+from django.db.models.lookups import GreaterThan
 from django.conf import settings
+from django.utils import timezone
 from apps.clients.models import ClientProfile
+from apps.products.models import Product
 
 class Project(models.Model):
     PROJECT_TYPES = [
@@ -28,6 +32,8 @@ class Project(models.Model):
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True)
     project_type = models.CharField(max_length=50, choices=PROJECT_TYPES)
+    # Template whose workflow steps are instantiated when the project is created
+    product = models.ForeignKey(Product, on_delete=models.SET_NULL, null=True, blank=True, related_name='projects')
     
     client = models.ForeignKey(ClientProfile, on_delete=models.CASCADE, related_name='projects')
     manager = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, related_name='managed_projects')
@@ -43,6 +49,12 @@ class Project(models.Model):
     progress = models.IntegerField(default=0)
     last_update = models.DateTimeField(auto_now=True)
 
+    # Task counters kept in sync by apps.tasks.signals; progress and
+    # sla_status are derived from them
+    tasks_total = models.IntegerField(default=0)
+    tasks_done = models.IntegerField(default=0)
+    tasks_overdue = models.IntegerField(default=0)
+
     # Dates
     start_date = models.DateField(null=True, blank=True)
     end_date = models.DateField(null=True, blank=True)
@@ -60,10 +72,68 @@ class Project(models.Model):
     def __str__(self):
         return f"{self.code} - {self.title}"
 
+    @staticmethod
+    def derived_from_counters():
+        """Update expressions for progress/sla_status from the task counters.
+
+        Projects without tasks keep their current values. sla_status is
+        'delay' once more than a fifth of the tasks are overdue.
+        """
+        return {
+            'progress': Case(
+                When(tasks_total=0, then=F('progress')),
+                default=F('tasks_done') * 100 / F('tasks_total'),
+                output_field=IntegerField(),
+            ),
+            'sla_status': Case(
+                When(tasks_total=0, then=F('sla_status')),
+                When(tasks_overdue=0, then=Value('ok')),
+                When(GreaterThan(F('tasks_overdue') * 5, F('tasks_total')), then=Value('delay')),
+                default=Value('warning'),
+            ),
+            'last_update': timezone.now(),
+        }
+
+    @classmethod
+    def apply_task_delta(cls, project_id, total=0, done=0, overdue=0):
+        """Add to a project's task counters (negative to subtract) and re-derive."""
+        if not (total or done or overdue):
+            return
+        projects = cls.objects.filter(pk=project_id)
+        with transaction.atomic():
+            projects.update(
+                tasks_total=F('tasks_total') + total,
+                tasks_done=F('tasks_done') + done,
+                tasks_overdue=F('tasks_overdue') + overdue,
+            )
+            projects.update(**cls.derived_from_counters())
+
+    @classmethod
+    def rebuild_task_counters(cls, queryset=None, batch_size=500):
+        """Recount every project's tasks in one aggregate query and re-derive."""
+        queryset = cls.objects.all() if queryset is None else queryset
+        projects = list(
+            queryset.order_by().annotate(
+                counted_total=Count('tasks'),
+                counted_done=Count('tasks', filter=Q(tasks__status='completed')),
+                counted_overdue=Count('tasks', filter=Q(tasks__status='overdue')),
+            ).only('id')
+        )
+        for project in projects:
+            project.tasks_total = project.counted_total
+            project.tasks_done = project.counted_done
+            project.tasks_overdue = project.counted_overdue
+        with transaction.atomic():
+            cls.objects.bulk_update(
+                projects, ['tasks_total', 'tasks_done', 'tasks_overdue'], batch_size=batch_size
+            )
+            cls.objects.filter(pk__in=[p.pk for p in projects]).update(**cls.derived_from_counters())
+        return len(projects)
+
 class ProjectMeeting(models.Model):
     project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='meetings')
     title = models.CharField(max_length=255)
-    date = models.DateTimeField()
+    date = models.DateTimeField(db_index=True)
     duration_minutes = models.IntegerField()
     link = models.URLField(blank=True)
     recording_link = models.URLField(blank=True)
@@ -102,7 +172,7 @@ class ProjectNote(models.Model):
     text = models.TextField()
     note_type = models.CharField(max_length=50, choices=NOTE_TYPES)
     author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
 
     def __str__(self):
         return f"{self.note_type} - {self.project.title}"
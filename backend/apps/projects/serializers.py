@@ -1,7 +1,7 @@
 from rest_framework import serializers
 from .models import Project, ProjectMeeting, ProjectDocument, ProjectNote
 from apps.clients.serializers import ClientProfileSerializer
-from apps.core.serializers import UserSerializer
+from apps.core.serializers import UserSerializer, DynamicFieldsModelSerializer
 
 class ProjectMeetingSerializer(serializers.ModelSerializer):
     class Meta:
@@ -22,7 +22,7 @@ class ProjectNoteSerializer(serializers.ModelSerializer):
         model = ProjectNote
         fields = '__all__'
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(DynamicFieldsModelSerializer):
     client_details = ClientProfileSerializer(source='client', read_only=True)
     manager_details = UserSerializer(source='manager', read_only=True)
     specialist_details = UserSerializer(source='specialist', read_only=True)
@@ -34,3 +34,12 @@ class ProjectSerializer(serializers.ModelSerializer):
     class Meta:
         model = Project
         fields = '__all__'
+        read_only_fields = ('tasks_total', 'tasks_done', 'tasks_overdue')
+
+class ProjectListSerializer(ProjectSerializer):
+    client_name = serializers.ReadOnlyField(source='client.company_name')
+    manager_name = serializers.ReadOnlyField(source='manager.username')
+    specialist_name = serializers.ReadOnlyField(source='specialist.username')
+
+    class Meta(ProjectSerializer.Meta):
+        expandable = ('client_details', 'manager_details', 'specialist_details', 'meetings', 'documents', 'notes')
@@ -0,0 +1,24 @@
+from django.db.models.signals import post_save, post_delete
+from django.utils import timezone
+from apps.products.workflow import instantiate_for_project
+from .models import Project, ProjectMeeting, ProjectDocument, ProjectNote
+
+
+def touch_project(sender, instance, raw=False, **kwargs):
+    # Meetings, documents and notes are embedded in the project payload, so
+    # they must move last_update (and with it the project's ETag)
+    if not raw:
+        Project.objects.filter(pk=instance.project_id).update(last_update=timezone.now())
+
+
+for model in (ProjectMeeting, ProjectDocument, ProjectNote):
+    post_save.connect(touch_project, sender=model, dispatch_uid=f'touch-project-save-{model._meta.label}')
+    post_delete.connect(touch_project, sender=model, dispatch_uid=f'touch-project-delete-{model._meta.label}')
+
+
+def instantiate_workflow(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        instantiate_for_project(instance)
+
+
+post_save.connect(instantiate_workflow, sender=Project, dispatch_uid='instantiate-project-workflow')
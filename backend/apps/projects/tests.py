@@ -0,0 +1,38 @@
+from django.core.cache import cache
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from apps.core.testing import TEST_CACHES, make_project, make_user
+from .models import ProjectMeeting
+
+
+@override_settings(CACHES=TEST_CACHES)
+class ProjectETagTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(make_user())
+        self.project = make_project()
+        self.url = f'/api/projects/projects/{self.project.pk}/'
+
+    def assertChangesETag(self, change):
+        etag = self.client.get(self.url)['ETag']
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        change()
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_embedded_client_change(self):
+        def rename():
+            self.project.client.company_name = 'Novo nome'
+            self.project.client.save()
+        self.assertChangesETag(rename)
+
+    def test_embedded_user_change(self):
+        def rename():
+            self.project.manager.first_name = 'Ana'
+            self.project.manager.save()
+        self.assertChangesETag(rename)
+
+    def test_new_meeting(self):
+        self.assertChangesETag(lambda: ProjectMeeting.objects.create(
+            project=self.project, title='Revisão', date=timezone.now(), duration_minutes=30, attendees='Ana',
+        ))
@@ -1,28 +1,61 @@
+from django.db import transaction
+from django.db.models import Prefetch
 from rest_framework import viewsets, permissions
+from apps.core.pagination import CreatedAtCursorPagination, DateCursorPagination
 from .models import Project, ProjectMeeting, ProjectDocument, ProjectNote
-from .serializers import ProjectSerializer, ProjectMeetingSerializer, ProjectDocumentSerializer, ProjectNoteSerializer
+from apps.clients.models import ClientProfile
+from apps.core.models import User
+from apps.core.mixins import SparseFieldsetMixin, ConditionalGetMixin
+from apps.metrics.mixins import SerializerTimingMixin
+from .serializers import (
+    ProjectSerializer, ProjectListSerializer, ProjectMeetingSerializer, ProjectDocumentSerializer, ProjectNoteSerializer,
+)
 
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(SerializerTimingMixin, ConditionalGetMixin, SparseFieldsetMixin, viewsets.ModelViewSet):
     queryset = Project.objects.all()
+    last_modified_field = 'last_update'
+    etag_models = (ClientProfile, User)
     serializer_class = ProjectSerializer
+    list_serializer_class = ProjectListSerializer
+    select_related_fields = {
+        'client_name': ['client'],
+        'client_details': ['client'],
+        'manager_name': ['manager'],
+        'manager_details': ['manager'],
+        'specialist_name': ['specialist'],
+        'specialist_details': ['specialist'],
+    }
+    prefetch_related_fields = {
+        'meetings': ['meetings'],
+        'documents': [Prefetch('documents', queryset=ProjectDocument.objects.select_related('uploaded_by'))],
+        'notes': [Prefetch('notes', queryset=ProjectNote.objects.select_related('author'))],
+    }
     permission_classes = [permissions.IsAuthenticated]
     filterset_fields = ['status', 'project_type', 'client', 'manager']
     search_fields = ['title', 'code', 'client__company_name']
 
-class ProjectMeetingViewSet(viewsets.ModelViewSet):
+    def perform_create(self, serializer):
+        # The product's workflow steps are instantiated by a post_save handler;
+        # keep them in the same transaction as the project
+        with transaction.atomic():
+            serializer.save()
+
+class ProjectMeetingViewSet(SerializerTimingMixin, viewsets.ModelViewSet):
     queryset = ProjectMeeting.objects.all()
     serializer_class = ProjectMeetingSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = DateCursorPagination
     filterset_fields = ['project']
 
-class ProjectDocumentViewSet(viewsets.ModelViewSet):
-    queryset = ProjectDocument.objects.all()
+class ProjectDocumentViewSet(SerializerTimingMixin, viewsets.ModelViewSet):
+    queryset = ProjectDocument.objects.select_related('uploaded_by')
     serializer_class = ProjectDocumentSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filterset_fields = ['project', 'type']
+    filterset_fields = ['project', 'doc_type']
 
-class ProjectNoteViewSet(viewsets.ModelViewSet):
-    queryset = ProjectNote.objects.all()
+class ProjectNoteViewSet(SerializerTimingMixin, viewsets.ModelViewSet):
+    queryset = ProjectNote.objects.select_related('author')
     serializer_class = ProjectNoteSerializer
     permission_classes = [permissions.IsAuthenticated]
-    filterset_fields = ['project', 'type']
+    pagination_class = CreatedAtCursorPagination
+    filterset_fields = ['project', 'note_type']
@@ -0,0 +1,117 @@
+from django.db import connection
+from django.db.models import FloatField
+from django.db.models.expressions import RawSQL
+from .models import SearchDocument
+from .text import normalize, tokens
+
+DOCUMENT_TABLE = SearchDocument._meta.db_table
+FTS_TABLE = 'search_fts'
+
+
+def _outer_pk(model):
+    qn = connection.ops.quote_name
+    return f'{qn(model._meta.db_table)}.{qn(model._meta.pk.column)}'
+
+
+class PostgresBackend:
+    """tsvector column + GIN index, Portuguese snowball stemming and unaccent."""
+
+    vector_sql = (
+        "setweight(to_tsvector('portuguese', unaccent(coalesce(title, ''))), 'A') || "
+        "setweight(to_tsvector('portuguese', unaccent(coalesce(body, ''))), 'B')"
+    )
+    query_sql = "websearch_to_tsquery('portuguese', unaccent(%s))"
+
+    def index(self, documents):
+        ids = [doc.pk for doc in documents]
+        if ids:
+            with connection.cursor() as cursor:
+                cursor.execute(f'UPDATE {DOCUMENT_TABLE} SET vector = {self.vector_sql} WHERE id = ANY(%s)', [ids])
+
+    def remove(self, document_ids):
+        pass  # The vector lives on the document row itself
+
+    def clear(self, content_type_id):
+        pass
+
+    def search(self, queryset, content_type_id, terms):
+        matches = RawSQL(
+            f'SELECT object_id FROM {DOCUMENT_TABLE} '
+            f'WHERE content_type_id = %s AND vector @@ {self.query_sql}',
+            (content_type_id, terms),
+        )
+        rank = RawSQL(
+            f'SELECT ts_rank(vector, {self.query_sql}) FROM {DOCUMENT_TABLE} '
+            f'WHERE content_type_id = %s AND object_id = {_outer_pk(queryset.model)}',
+            (terms, content_type_id),
+            output_field=FloatField(),
+        )
+        return queryset.filter(pk__in=matches).annotate(search_rank=rank)
+
+
+class SQLiteBackend:
+    """
+    FTS5 virtual table holding text already accent-folded and stemmed by
+    ``apps.search.text``, ranked with bm25 (title weighted 10x).
+    """
+
+    def index(self, documents):
+        rows = [(doc.pk, normalize(doc.title), normalize(doc.body)) for doc in documents]
+        if rows:
+            with connection.cursor() as cursor:
+                self._delete(cursor, [row[0] for row in rows])
+                cursor.executemany(f'INSERT INTO {FTS_TABLE} (rowid, title, body) VALUES (%s, %s, %s)', rows)
+
+    def remove(self, document_ids):
+        if document_ids:
+            with connection.cursor() as cursor:
+                self._delete(cursor, document_ids)
+
+    def clear(self, content_type_id):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {FTS_TABLE} WHERE rowid IN (SELECT id FROM {DOCUMENT_TABLE} WHERE content_type_id = %s)',
+                [content_type_id],
+            )
+
+    def _delete(self, cursor, document_ids):
+        placeholders = ', '.join(['%s'] * len(document_ids))
+        cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid IN ({placeholders})', list(document_ids))
+
+    def search(self, queryset, content_type_id, terms):
+        words = tokens(terms)
+        if not words:
+            return queryset.none()
+        # Every word must match; the prefix star keeps search-as-you-type working
+        match = ' '.join(f'"{word}"*' for word in words)
+        matches = RawSQL(
+            f'SELECT d.object_id FROM {FTS_TABLE} JOIN {DOCUMENT_TABLE} d ON d.id = {FTS_TABLE}.rowid '
+            f'WHERE {FTS_TABLE} MATCH %s AND d.content_type_id = %s',
+            (match, content_type_id),
+        )
+        rank = RawSQL(
+            f'SELECT -bm25({FTS_TABLE}, 10.0, 1.0) FROM {FTS_TABLE} '
+            f'WHERE {FTS_TABLE} MATCH %s AND {FTS_TABLE}.rowid = ('
+            f'SELECT id FROM {DOCUMENT_TABLE} WHERE content_type_id = %s AND object_id = {_outer_pk(queryset.model)})',
+            (match, content_type_id),
+            output_field=FloatField(),
+        )
+        return queryset.filter(pk__in=matches).annotate(search_rank=rank)
+
+
+_backend = None
+
+
+def get_backend():
+    """
+    The full-text engine for the default database, or None when it has none
+    (e.g. MySQL), in which case callers fall back to icontains lookups.
+    """
+    global _backend
+    if _backend is None:
+        if connection.vendor == 'postgresql':
+            _backend = PostgresBackend()
+        # Not cached while missing: the FTS table may appear once migrations run
+        elif connection.vendor == 'sqlite' and FTS_TABLE in connection.introspection.table_names():
+            _backend = SQLiteBackend()
+    return _backend
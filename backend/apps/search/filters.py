@@ -0,0 +1,22 @@
+from django.contrib.contenttypes.models import ContentType
+from rest_framework.filters import SearchFilter
+from .backends import get_backend
+from .registry import is_indexed
+
+
+class FullTextSearchFilter(SearchFilter):
+    """
+    Ranked full-text ``?search=`` for models registered in ``SEARCH_INDEX``.
+
+    Results carry a ``search_rank`` annotation that the cursor paginator
+    orders by. Unregistered models, and databases without a full-text engine,
+    keep SearchFilter's ``icontains`` behaviour over ``search_fields``.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = request.query_params.get(self.search_param, '').strip()
+        backend = get_backend()
+        if not terms or backend is None or not is_indexed(queryset.model):
+            return super().filter_queryset(request, queryset, view)
+        content_type = ContentType.objects.get_for_model(queryset.model)
+        return backend.search(queryset, content_type.pk, terms)
@@ -0,0 +1,124 @@
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from apps.jobs.queue import enqueue
+from .backends import get_backend
+from .models import SearchDocument
+from .registry import SEARCH_INDEX, DEPENDENTS
+
+
+def resolve(instance, lookup):
+    value = instance
+    for attr in lookup.split('__'):
+        value = getattr(value, attr, None)
+        if value is None:
+            return ''
+    return str(value)
+
+
+def document_text(instance):
+    title_fields, body_fields = SEARCH_INDEX[instance._meta.label]
+    title = ' '.join(filter(None, (resolve(instance, f) for f in title_fields)))
+    body = ' '.join(filter(None, (resolve(instance, f) for f in body_fields)))
+    return title, body
+
+
+def indexed_roots(label):
+    """Model fields whose change alters the document of ``label``."""
+    return {lookup.split('__')[0] for fields in SEARCH_INDEX[label] for lookup in fields}
+
+
+def related_paths(label):
+    """select_related paths needed to build documents without extra queries."""
+    lookups = [f for fields in SEARCH_INDEX[label] for f in fields if '__' in f]
+    return {lookup.rsplit('__', 1)[0] for lookup in lookups}
+
+
+def update_documents(model, instances):
+    """Create or refresh the documents of ``instances`` with a fixed number of queries."""
+    backend = get_backend()
+    if backend is None or not instances:
+        return
+    content_type = ContentType.objects.get_for_model(model)
+    existing = {
+        document.object_id: document
+        for document in SearchDocument.objects.filter(
+            content_type=content_type, object_id__in=[instance.pk for instance in instances]
+        )
+    }
+    changed, new = [], []
+    for instance in instances:
+        title, body = document_text(instance)
+        document = existing.get(instance.pk)
+        if document is None:
+            new.append(SearchDocument(content_type=content_type, object_id=instance.pk, title=title, body=body))
+        else:
+            document.title, document.body = title, body
+            changed.append(document)
+    with transaction.atomic():
+        SearchDocument.objects.bulk_update(changed, ['title', 'body'])
+        backend.index(changed + SearchDocument.objects.bulk_create(new))
+
+
+def update_document(instance, dependents=True):
+    """
+    Refresh the document of ``instance``. Rows that embed its text (see
+    ``DEPENDENTS``) can be any number, so they are re-indexed by the
+    ``search.reindex_dependents`` job once the transaction commits.
+    """
+    if get_backend() is None:
+        return
+    update_documents(type(instance), [instance])
+    label = instance._meta.label
+    if dependents and label in DEPENDENTS:
+        payload = {'label': label, 'pk': instance.pk}
+        transaction.on_commit(lambda: enqueue('search.reindex_dependents', payload))
+
+
+def update_dependents(label, pk):
+    """Re-index the rows whose documents embed text from the ``label`` row ``pk``."""
+    total = 0
+    for dependent_label, fk in DEPENDENTS.get(label, ()):
+        model = apps.get_model(dependent_label)
+        dependents = list(model.objects.filter(**{fk: pk}).select_related(*related_paths(dependent_label)))
+        update_documents(model, dependents)
+        total += len(dependents)
+    return total
+
+
+def remove_document(instance):
+    backend = get_backend()
+    if backend is None:
+        return
+    documents = SearchDocument.objects.filter(
+        content_type=ContentType.objects.get_for_model(instance), object_id=instance.pk
+    )
+    backend.remove(list(documents.values_list('id', flat=True)))
+    documents.delete()
+
+
+def rebuild(labels=None, chunk_size=1000):
+    """Re-create every document of the given (default: all) indexed models in bulk."""
+    backend = get_backend()
+    if backend is None:
+        return 0
+    total = 0
+    for label in labels or SEARCH_INDEX:
+        model = apps.get_model(label)
+        content_type = ContentType.objects.get_for_model(model)
+        with transaction.atomic():
+            backend.clear(content_type.pk)
+            SearchDocument.objects.filter(content_type=content_type).delete()
+            queryset = model.objects.select_related(*related_paths(label)).order_by('pk')
+            batch = []
+            for instance in queryset.iterator(chunk_size=chunk_size):
+                title, body = document_text(instance)
+                batch.append(SearchDocument(content_type=content_type, object_id=instance.pk, title=title, body=body))
+                if len(batch) >= chunk_size:
+                    backend.index(SearchDocument.objects.bulk_create(batch))
+                    total += len(batch)
+                    batch = []
+            if batch:
+                backend.index(SearchDocument.objects.bulk_create(batch))
+                total += len(batch)
+    return total
@@ -0,0 +1,12 @@
+from apps.jobs.registry import register
+from .index import rebuild, update_dependents
+
+
+@register('search.rebuild_index')
+def rebuild_index(labels=None, chunk_size=1000):
+    return rebuild(labels, chunk_size=chunk_size)
+
+
+@register('search.reindex_dependents')
+def reindex_dependents(label, pk):
+    return update_dependents(label, pk)
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+from apps.search.index import rebuild
+from apps.search.registry import SEARCH_INDEX
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search documents for every indexed model.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('labels', nargs='*', help=f"Models to rebuild (default: {', '.join(SEARCH_INDEX)})")
+        parser.add_argument('--chunk-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        labels = options['labels'] or None
+        unknown = set(labels or ()) - set(SEARCH_INDEX)
+        if unknown:
+            self.stderr.write(self.style.ERROR(f"Not indexed: {', '.join(sorted(unknown))}"))
+            return
+        total = rebuild(labels, chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f'{total} documents indexed.'))
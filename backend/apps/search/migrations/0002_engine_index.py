@@ -0,0 +1,35 @@
+from django.db import migrations
+
+
+def create_engine_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute('CREATE EXTENSION IF NOT EXISTS unaccent')
+        schema_editor.execute('ALTER TABLE search_searchdocument ADD COLUMN vector tsvector')
+        schema_editor.execute(
+            'CREATE INDEX search_searchdocument_vector_gin ON search_searchdocument USING GIN (vector)'
+        )
+    elif vendor == 'sqlite':
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE search_fts USING fts5(title, body, tokenize = 'unicode61 remove_diacritics 2')"
+        )
+
+
+def drop_engine_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        schema_editor.execute('DROP INDEX IF EXISTS search_searchdocument_vector_gin')
+        schema_editor.execute('ALTER TABLE search_searchdocument DROP COLUMN IF EXISTS vector')
+    elif vendor == 'sqlite':
+        schema_editor.execute('DROP TABLE IF EXISTS search_fts')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_engine_index, drop_engine_index),
+    ]
@@ -0,0 +1,26 @@
+from django.db import models
+from django.contrib.contenttypes.models import ContentType
+
+
+class SearchDocument(models.Model):
+    """
+    Flattened, searchable text of one indexed row.
+
+    The engine-specific index lives next to this table and is created by the
+    migrations: a weighted ``vector`` tsvector column with a GIN index on
+    PostgreSQL, or the ``search_fts`` FTS5 virtual table (keyed by this id) on
+    SQLite.
+    """
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveBigIntegerField()
+    title = models.TextField(blank=True)
+    body = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['content_type', 'object_id'], name='unique_search_document'),
+        ]
+
+    def __str__(self):
+        return f"{self.content_type.model} #{self.object_id}"
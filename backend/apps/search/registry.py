@@ -0,0 +1,19 @@
+# Indexed models: label -> (title lookups, body lookups). Title text is weighted
+# above body text when ranking; lookups may follow foreign keys.
+SEARCH_INDEX = {
+    'clients.ClientProfile': (('company_name',), ('cnpj', 'responsible_name')),
+    'projects.Project': (('title', 'code'), ('client__company_name', 'description')),
+    'support.Ticket': (('title',), ('description',)),
+    'crm.Lead': (('name', 'company'), ('email',)),
+    'tasks.Task': (('title',), ('description',)),
+}
+
+# Rows whose document embeds text from another model: changing the key model
+# re-indexes the (label, foreign key) rows listed.
+DEPENDENTS = {
+    'clients.ClientProfile': (('projects.Project', 'client'),),
+}
+
+
+def is_indexed(model):
+    return model._meta.label in SEARCH_INDEX
@@ -0,0 +1,27 @@
+from django.apps import apps
+from django.db.models.signals import post_save, post_delete
+from apps.core.bulk import post_bulk_save
+from .index import update_document, update_documents, remove_document, indexed_roots
+from .registry import SEARCH_INDEX
+
+
+def index_on_save(sender, instance, created=False, raw=False, **kwargs):
+    if not raw:
+        # A row just created has nothing pointing at it yet
+        update_document(instance, dependents=not created)
+
+
+def index_in_bulk(sender, instances, update_fields=None, **kwargs):
+    if update_fields is None or indexed_roots(sender._meta.label) & set(update_fields):
+        update_documents(sender, instances)
+
+
+def unindex_on_delete(sender, instance, **kwargs):
+    remove_document(instance)
+
+
+for label in SEARCH_INDEX:
+    model = apps.get_model(label)
+    post_save.connect(index_on_save, sender=model, dispatch_uid=f'search-save-{label}')
+    post_delete.connect(unindex_on_delete, sender=model, dispatch_uid=f'search-delete-{label}')
+    post_bulk_save.connect(index_in_bulk, sender=model, dispatch_uid=f'search-bulk-{label}')
@@ -0,0 +1,21 @@
+from django.test import TestCase
+from apps.jobs.models import Job
+from apps.jobs.queue import run_next
+from apps.core.testing import make_project
+from .models import SearchDocument
+
+
+class DependentReindexTests(TestCase):
+    def test_client_rename_reindexes_projects_in_a_job(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            project = make_project()
+        client = project.client
+        client.company_name = 'Padaria Estrela'
+        with self.captureOnCommitCallbacks(execute=True):
+            client.save()
+
+        job = Job.objects.get(name='search.reindex_dependents')
+        self.assertEqual(job.payload, {'label': 'clients.ClientProfile', 'pk': client.pk})
+        self.assertEqual(run_next('test').result, 1)
+        document = SearchDocument.objects.get(content_type__model='project', object_id=project.pk)
+        self.assertIn('Padaria Estrela', document.body)
@@ -0,0 +1,51 @@
+import re
+import unicodedata
+
+WORD_RE = re.compile(r'\w+')
+
+# Light Portuguese stemmer (plural, then derivational suffix, then final
+# vowel). Linguistic precision matters less than applying the exact same
+# reduction to indexed text and to queries.
+PLURALS = (
+    ('oes', 'ao'), ('aes', 'ao'), ('ais', 'al'), ('eis', 'el'), ('ois', 'ol'),
+    ('ns', 'm'), ('res', 'r'), ('les', 'l'), ('zes', 'z'), ('s', ''),
+)
+SUFFIXES = sorted((
+    'amentos', 'imentos', 'amento', 'imento', 'acoes', 'icoes', 'acao', 'icao',
+    'adoras', 'adores', 'adora', 'ador', 'idades', 'idade', 'mente', 'ismos',
+    'ismo', 'istas', 'ista', 'aveis', 'iveis', 'avel', 'ivel', 'ancia', 'encia',
+    'agem', 'icas', 'icos', 'ica', 'ico', 'osas', 'osos', 'osa', 'oso',
+), key=len, reverse=True)
+MIN_STEM = 3
+
+
+def fold(text):
+    """Lowercase and strip accents: 'Diagnóstico' -> 'diagnostico'."""
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).lower()
+
+
+def stem(word):
+    if len(word) <= MIN_STEM or word.isdigit():
+        return word
+    for suffix, replacement in PLURALS:
+        if word.endswith(suffix) and not word.endswith(('ss', 'us', 'is')):
+            candidate = word[:-len(suffix)] + replacement
+            if len(candidate) >= MIN_STEM:
+                word = candidate
+            break
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM:
+            word = word[:-len(suffix)]
+            break
+    if len(word) > MIN_STEM and word[-1] in 'aeo':
+        word = word[:-1]
+    return word
+
+
+def tokens(text):
+    return [stem(word) for word in WORD_RE.findall(fold(text))]
+
+
+def normalize(text):
+    return ' '.join(tokens(text))
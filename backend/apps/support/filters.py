@@ -0,0 +1,23 @@
+import django_filters
+from django.utils import timezone
+from . import sla
+from .models import Ticket
+
+
+class TicketFilter(django_filters.FilterSet):
+    """Ticket filters, plus ?sla=breached|at_risk over the (sla_active, sla_deadline) index."""
+    sla = django_filters.ChoiceFilter(
+        choices=[('breached', 'Estourado'), ('at_risk', 'Em risco')],
+        method='filter_sla',
+    )
+
+    class Meta:
+        model = Ticket
+        fields = ['status', 'priority', 'area', 'project', 'assigned_to']
+
+    def filter_sla(self, queryset, name, value):
+        now = timezone.now()
+        queryset = queryset.filter(sla_active=True)
+        if value == 'breached':
+            return queryset.filter(sla_deadline__lt=now)
+        return queryset.filter(sla_deadline__gte=now, sla_deadline__lt=now + sla.AT_RISK_WINDOW)
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:54
+
+from django.conf import settings
+from django.db import migrations, models
+
+from apps.support import sla
+
+
+def backfill_sla(apps, schema_editor):
+    Ticket = apps.get_model('support', 'Ticket')
+    running = Ticket.objects.exclude(status__in=sla.PAUSED_STATUSES | sla.CLOSED_STATUSES)
+    tickets = list(running.only('id', 'priority', 'area', 'created_at'))
+    for ticket in tickets:
+        ticket.sla_active = True
+        ticket.sla_started_at = ticket.created_at
+        ticket.sla_deadline = ticket.created_at + sla.resolution_time(ticket.priority, ticket.area)
+    Ticket.objects.bulk_update(tickets, ['sla_active', 'sla_started_at', 'sla_deadline'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_alter_projectmeeting_date_and_more'),
+        ('support', '0003_ticket_support_tic_project_8de81f_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='sla_active',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='sla_breached',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='ticket',
+            name='sla_started_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['sla_active', 'sla_deadline'], name='support_tic_sla_act_05f6f6_idx'),
+        ),
+        migrations.RunPython(backfill_sla, migrations.RunPython.noop),
+    ]
@@ -1,6 +1,8 @@
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 from apps.projects.models import Project
+from . import sla
 
 class TicketCategory(models.Model):
     name = models.CharField(max_length=100)
@@ -46,13 +48,62 @@ class Ticket(models.Model):
     opened_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='opened_tickets')
     assigned_to = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name='assigned_tickets')
     
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True)
     sla_deadline = models.DateTimeField(null=True, blank=True)
+    # SLA clock: deadline = sla_started_at + resolution time; only running
+    # clocks (sla_active) can breach, so breach queries scan (sla_active, sla_deadline)
+    sla_started_at = models.DateTimeField(null=True, blank=True)
+    sla_active = models.BooleanField(default=False)
+    sla_breached = models.BooleanField(default=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['project', 'status']),
+            models.Index(fields=['assigned_to', 'status']),
+            models.Index(fields=['sla_active', 'sla_deadline']),
+        ]
 
     def __str__(self):
         return f"#{self.id} - {self.title}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._sla_loaded = {
+            name: value for name, value in zip(field_names, values) if name in ('status', 'priority', 'area')
+        }
+        return instance
+
+    def apply_sla(self, now=None):
+        """Start, pause, stop or re-time the SLA clock for the current state."""
+        now = now or timezone.now()
+        loaded = getattr(self, '_sla_loaded', None)
+        if self.pk is None or loaded is None:
+            changed = {'status', 'priority', 'area'}
+        else:
+            changed = {name for name, value in loaded.items() if getattr(self, name) != value}
+        if not changed:
+            return
+
+        running = sla.is_running(self.status)
+        if running:
+            if not self.sla_active or self.sla_started_at is None:
+                # New ticket, or back from waiting/closed: the clock restarts now
+                self.sla_started_at = now
+            self.sla_deadline = self.sla_started_at + sla.resolution_time(self.priority, self.area)
+        else:
+            if self.sla_active and self.sla_deadline is not None and now > self.sla_deadline:
+                self.sla_breached = True
+            if self.status in sla.PAUSED_STATUSES:
+                self.sla_deadline = None
+        self.sla_active = running
+
+    def save(self, *args, **kwargs):
+        self.apply_sla()
+        super().save(*args, **kwargs)
+        self._sla_loaded = {'status': self.status, 'priority': self.priority, 'area': self.area}
+
 class TicketInteraction(models.Model):
     ROLE_CHOICES = [
         ('client', 'Cliente'),
@@ -63,7 +114,7 @@ class TicketInteraction(models.Model):
     text = models.TextField()
     sender = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True)
     role = models.CharField(max_length=20, choices=ROLE_CHOICES)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     
     def __str__(self):
         return f"Interaction on {self.ticket.id}"
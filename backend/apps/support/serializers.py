@@ -1,6 +1,6 @@
 from rest_framework import serializers
 from .models import Ticket, TicketInteraction, TicketCategory
-from apps.core.serializers import UserSerializer
+from apps.core.serializers import UserSerializer, DynamicFieldsModelSerializer
 
 class TicketCategorySerializer(serializers.ModelSerializer):
     class Meta:
@@ -14,7 +14,7 @@ class TicketInteractionSerializer(serializers.ModelSerializer):
         model = TicketInteraction
         fields = '__all__'
 
-class TicketSerializer(serializers.ModelSerializer):
+class TicketSerializer(DynamicFieldsModelSerializer):
     interactions = TicketInteractionSerializer(many=True, read_only=True)
     opened_by_details = UserSerializer(source='opened_by', read_only=True)
     assigned_to_details = UserSerializer(source='assigned_to', read_only=True)
@@ -22,3 +22,11 @@ class TicketSerializer(serializers.ModelSerializer):
     class Meta:
         model = Ticket
         fields = '__all__'
+        read_only_fields = ('sla_deadline', 'sla_started_at', 'sla_active', 'sla_breached')
+
+class TicketListSerializer(TicketSerializer):
+    opened_by_name = serializers.ReadOnlyField(source='opened_by.username')
+    assigned_to_name = serializers.ReadOnlyField(source='assigned_to.username')
+
+    class Meta(TicketSerializer.Meta):
+        expandable = ('interactions', 'opened_by_details', 'assigned_to_details')
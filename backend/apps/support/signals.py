@@ -0,0 +1,14 @@
+from django.db.models.signals import post_save, post_delete
+from django.utils import timezone
+from .models import Ticket, TicketInteraction
+
+
+def touch_ticket(sender, instance, raw=False, **kwargs):
+    # Interactions are embedded in the ticket payload, so a new message must
+    # move updated_at (and with it the ticket's ETag)
+    if not raw:
+        Ticket.objects.filter(pk=instance.ticket_id).update(updated_at=timezone.now())
+
+
+post_save.connect(touch_ticket, sender=TicketInteraction, dispatch_uid='touch-ticket-save')
+post_delete.connect(touch_ticket, sender=TicketInteraction, dispatch_uid='touch-ticket-delete')
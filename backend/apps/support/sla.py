@@ -0,0 +1,32 @@
+from datetime import timedelta
+from django.conf import settings
+
+# Hours to resolve, by priority
+PRIORITY_HOURS = {
+    'Urgente': 4,
+    'Alta': 8,
+    'Média': 24,
+    'Baixa': 72,
+}
+# Areas bound to legal deadlines (tax filings, payroll) run on a shorter clock
+AREA_FACTOR = {
+    'Fiscal': 0.5,
+    'Pessoal': 0.5,
+}
+DEFAULT_HOURS = 24
+
+# The clock stops while the ticket waits on the client and once it is closed
+PAUSED_STATUSES = {'Aguardando Cliente'}
+CLOSED_STATUSES = {'Resolvido', 'Concluído'}
+
+# Open tickets due within this window are reported as at risk
+AT_RISK_WINDOW = timedelta(hours=getattr(settings, 'SUPPORT_SLA_AT_RISK_HOURS', 4))
+
+
+def resolution_time(priority, area):
+    hours = getattr(settings, 'SUPPORT_SLA_PRIORITY_HOURS', PRIORITY_HOURS).get(priority, DEFAULT_HOURS)
+    return timedelta(hours=hours * AREA_FACTOR.get(area, 1))
+
+
+def is_running(status):
+    return status not in PAUSED_STATUSES and status not in CLOSED_STATUSES
@@ -0,0 +1,17 @@
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.test import APITestCase
+from apps.core.testing import TEST_CACHES, make_ticket, make_user
+
+
+@override_settings(CACHES=TEST_CACHES)
+class TicketETagTests(APITestCase):
+    def test_embedded_user_change(self):
+        self.client.force_authenticate(make_user())
+        ticket = make_ticket()
+        url = '/api/support/tickets/?expand=assigned_to_details'
+        etag = self.client.get(url)['ETag']
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        ticket.assigned_to.username = 'renomeado'
+        ticket.assigned_to.save()
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
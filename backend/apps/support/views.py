@@ -1,21 +1,55 @@
+from django.db.models import Prefetch
 from rest_framework import viewsets, permissions
+from apps.core.pagination import CreatedAtCursorPagination
 from .models import Ticket, TicketInteraction, TicketCategory
-from .serializers import TicketSerializer, TicketInteractionSerializer, TicketCategorySerializer
+from .filters import TicketFilter
+from apps.core.models import User
+from apps.core.mixins import SparseFieldsetMixin, ConditionalGetMixin, ExportMixin
+from .serializers import TicketSerializer, TicketListSerializer, TicketInteractionSerializer, TicketCategorySerializer
+from apps.metrics.mixins import SerializerTimingMixin
 
-class TicketViewSet(viewsets.ModelViewSet):
+class TicketViewSet(SerializerTimingMixin, ConditionalGetMixin, SparseFieldsetMixin, ExportMixin, viewsets.ModelViewSet):
     queryset = Ticket.objects.all()
+    last_modified_field = 'updated_at'
+    etag_models = (User,)
     serializer_class = TicketSerializer
+    list_serializer_class = TicketListSerializer
+    select_related_fields = {
+        'opened_by_name': ['opened_by'],
+        'opened_by_details': ['opened_by'],
+        'assigned_to_name': ['assigned_to'],
+        'assigned_to_details': ['assigned_to'],
+    }
+    prefetch_related_fields = {
+        'interactions': [Prefetch('interactions', queryset=TicketInteraction.objects.select_related('sender'))],
+    }
     permission_classes = [permissions.IsAuthenticated]
-    filterset_fields = ['status', 'priority', 'area', 'project']
+    pagination_class = CreatedAtCursorPagination
+    filterset_class = TicketFilter
     search_fields = ['title', 'description']
+    export_filename = 'chamados'
+    export_fields = (
+        ('Chamado', 'id'),
+        ('Título', 'title'),
+        ('Área', 'area'),
+        ('Prioridade', 'priority'),
+        ('Status', 'status'),
+        ('Projeto', 'project__code'),
+        ('Aberto por', 'opened_by__username'),
+        ('Responsável', 'assigned_to__username'),
+        ('Aberto em', 'created_at'),
+        ('Prazo SLA', 'sla_deadline'),
+        ('SLA estourado', 'sla_breached'),
+    )
 
-class TicketInteractionViewSet(viewsets.ModelViewSet):
-    queryset = TicketInteraction.objects.all()
+class TicketInteractionViewSet(SerializerTimingMixin, viewsets.ModelViewSet):
+    queryset = TicketInteraction.objects.select_related('sender')
     serializer_class = TicketInteractionSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
     filterset_fields = ['ticket']
 
-class TicketCategoryViewSet(viewsets.ModelViewSet):
+class TicketCategoryViewSet(SerializerTimingMixin, viewsets.ModelViewSet):
     queryset = TicketCategory.objects.all()
     serializer_class = TicketCategorySerializer
     permission_classes = [permissions.IsAuthenticated]
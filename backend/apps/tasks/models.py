@@ -17,7 +17,7 @@ class Task(models.Model):
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
-    due_date = models.DateField(null=True, blank=True)
+    due_date = models.DateField(null=True, blank=True, db_index=True)
     
     assigned_to = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, related_name='tasks')
     assignee_type = models.CharField(max_length=20, choices=ASSIGNEE_TYPE_CHOICES, default='consultant')
@@ -27,6 +27,12 @@ class Task(models.Model):
     google_synced = models.BooleanField(default=False)
     google_task_id = models.CharField(max_length=255, blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['project', 'status']),
+            models.Index(fields=['assigned_to', 'status']),
+        ]
+
     def __str__(self):
         return self.title
 
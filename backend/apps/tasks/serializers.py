@@ -1,16 +1,22 @@
 from rest_framework import serializers
 from .models import Task, SubTask
-from apps.core.serializers import UserSerializer
+from apps.core.serializers import UserSerializer, DynamicFieldsModelSerializer
 
 class SubTaskSerializer(serializers.ModelSerializer):
     class Meta:
         model = SubTask
         fields = '__all__'
 
-class TaskSerializer(serializers.ModelSerializer):
+class TaskSerializer(DynamicFieldsModelSerializer):
     subtasks = SubTaskSerializer(many=True, read_only=True)
     assigned_to_details = UserSerializer(source='assigned_to', read_only=True)
     
     class Meta:
         model = Task
         fields = '__all__'
+
+class TaskListSerializer(TaskSerializer):
+    assigned_to_name = serializers.ReadOnlyField(source='assigned_to.username')
+
+    class Meta(TaskSerializer.Meta):
+        expandable = ('subtasks', 'assigned_to_details')
@@ -0,0 +1,72 @@
+from collections import defaultdict
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from apps.core.bulk import post_bulk_save
+from apps.projects.models import Project
+from .models import Task
+
+COUNTER_FIELDS = ('project_id', 'status')
+
+
+def counts(status):
+    """(total, done, overdue) contribution of a single task."""
+    return 1, int(status == 'completed'), int(status == 'overdue')
+
+
+def add(deltas, project_id, status, sign):
+    if project_id is None:
+        return
+    bucket = deltas[project_id]
+    for i, value in enumerate(counts(status)):
+        bucket[i] += sign * value
+
+
+def flush(deltas):
+    for project_id, (total, done, overdue) in deltas.items():
+        Project.apply_task_delta(project_id, total, done, overdue)
+
+
+@receiver(pre_save, sender=Task)
+def remember_previous_counts(sender, instance, **kwargs):
+    instance._counters_previous = None
+    if instance.pk:
+        instance._counters_previous = (
+            Task.objects.filter(pk=instance.pk).values(*COUNTER_FIELDS).first()
+        )
+
+
+@receiver(post_save, sender=Task)
+def update_counters_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, '_counters_previous', None)
+    current = {field: getattr(instance, field) for field in COUNTER_FIELDS}
+    if previous == current:
+        return
+    deltas = defaultdict(lambda: [0, 0, 0])
+    if previous:
+        add(deltas, previous['project_id'], previous['status'], -1)
+    add(deltas, instance.project_id, instance.status, 1)
+    flush(deltas)
+
+
+@receiver(post_delete, sender=Task)
+def update_counters_on_delete(sender, instance, **kwargs):
+    deltas = defaultdict(lambda: [0, 0, 0])
+    add(deltas, instance.project_id, instance.status, -1)
+    flush(deltas)
+
+
+@receiver(post_bulk_save, sender=Task)
+def update_counters_in_bulk(sender, instances, previous, **kwargs):
+    # Net the batch per project: one counter write per touched project
+    deltas = defaultdict(lambda: [0, 0, 0])
+    for task in instances:
+        current = {field: getattr(task, field) for field in COUNTER_FIELDS}
+        if task.pk in previous:
+            before = {field: previous[task.pk].get(field, current[field]) for field in COUNTER_FIELDS}
+            if before == current:
+                continue
+            add(deltas, before['project_id'], before['status'], -1)
+        add(deltas, task.project_id, task.status, 1)
+    flush(deltas)
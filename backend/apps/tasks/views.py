@@ -1,15 +1,34 @@
 from rest_framework import viewsets, permissions
 from .models import Task, SubTask
-from .serializers import TaskSerializer, SubTaskSerializer
+from apps.core.mixins import SparseFieldsetMixin, BulkModelMixin, ExportMixin
+from .serializers import TaskSerializer, TaskListSerializer, SubTaskSerializer
+from apps.metrics.mixins import SerializerTimingMixin
 
-class TaskViewSet(viewsets.ModelViewSet):
+class TaskViewSet(SerializerTimingMixin, BulkModelMixin, SparseFieldsetMixin, ExportMixin, viewsets.ModelViewSet):
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
+    list_serializer_class = TaskListSerializer
+    select_related_fields = {
+        'assigned_to_name': ['assigned_to'],
+        'assigned_to_details': ['assigned_to'],
+    }
+    prefetch_related_fields = {
+        'subtasks': ['subtasks'],
+    }
     permission_classes = [permissions.IsAuthenticated]
     filterset_fields = ['status', 'assigned_to', 'project', 'assignee_type']
     search_fields = ['title', 'description']
+    export_filename = 'tarefas'
+    export_fields = (
+        ('Tarefa', 'title'),
+        ('Status', 'status'),
+        ('Prazo', 'due_date'),
+        ('Responsável', 'assigned_to__username'),
+        ('Tipo de responsável', 'assignee_type'),
+        ('Projeto', 'project__code'),
+    )
 
-class SubTaskViewSet(viewsets.ModelViewSet):
+class SubTaskViewSet(SerializerTimingMixin, BulkModelMixin, viewsets.ModelViewSet):
     queryset = SubTask.objects.all()
     serializer_class = SubTaskSerializer
     permission_classes = [permissions.IsAuthenticated]
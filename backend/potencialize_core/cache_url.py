@@ -0,0 +1,31 @@
+"""Build a ``CACHES['default']`` entry from a ``CACHE_URL`` string.
+
+    redis://host:6379/0     Redis (or any Redis-compatible server)
+    file:///var/tmp/cache   file-based, shared by the workers of one machine
+    db://django_cache       database table (run ``manage.py createcachetable``)
+    locmem://               per-process memory, for tests and local runs
+    dummy://                no caching
+"""
+
+BACKENDS = {
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+    'rediss': 'django.core.cache.backends.redis.RedisCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'db': 'django.core.cache.backends.db.DatabaseCache',
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'dummy': 'django.core.cache.backends.dummy.DummyCache',
+}
+
+
+def parse(url, timeout=300):
+    scheme, _, rest = url.partition('://')
+    if scheme not in BACKENDS:
+        raise ValueError(f'Unsupported CACHE_URL scheme: {scheme!r}')
+    config = {'BACKEND': BACKENDS[scheme], 'TIMEOUT': timeout}
+    if scheme in ('redis', 'rediss'):
+        config['LOCATION'] = url
+    elif scheme == 'db':
+        config['LOCATION'] = rest or 'django_cache'
+    elif scheme in ('file', 'locmem'):
+        config['LOCATION'] = rest
+    return config
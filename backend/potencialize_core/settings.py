@@ -1,7 +1,9 @@
 import os
+import tempfile
 from pathlib import Path
 from datetime import timedelta
 import dj_database_url
+from . import cache_url
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -34,6 +36,7 @@ INSTALLED_APPS = [
     # Third party
     'rest_framework',
     'rest_framework_simplejwt',
+    'django_filters',
     'corsheaders',
 
     # Local Apps
@@ -46,9 +49,17 @@ INSTALLED_APPS = [
     'apps.financial',
     'apps.products',
     'apps.onboarding',
+    'apps.search',
+    'apps.agenda',
+    'apps.google_sync',
+    'apps.jobs',
+    'apps.metrics',
+    'apps.perf',
+    'apps.ai',
 ]
 
 MIDDLEWARE = [
+    'apps.metrics.middleware.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -135,6 +146,16 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Cache shared by every gunicorn worker (see potencialize_core/cache_url.py).
+# Defaults to a file cache in the temp dir; set CACHE_URL=redis://... or db://...
+# when the web and worker services run on different machines.
+CACHES = {
+    'default': cache_url.parse(
+        os.environ.get('CACHE_URL', f"file://{Path(tempfile.gettempdir()) / 'potencialize-cache'}")
+    ),
+}
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/5.0/topics/i18n/
 
@@ -165,19 +186,59 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 AUTH_USER_MODEL = 'core.User'
 
 # REST Framework
+# Stateless JWT: authenticate from the token claims (user, role, permissions
+# version) without loading the user; see apps/core/authentication.py
+STATELESS_JWT = os.environ.get('STATELESS_JWT', 'False') == 'True'
+# How long each worker trusts its copy of the permissions version
+STATELESS_JWT_VERSION_TTL = float(os.environ.get('STATELESS_JWT_VERSION_TTL', 2))
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.core.authentication.StatelessJWTAuthentication' if STATELESS_JWT
+        else 'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    'DEFAULT_FILTER_BACKENDS': (
+        'django_filters.rest_framework.DjangoFilterBackend',
+        'apps.search.filters.FullTextSearchFilter',
+    ),
+    # Keyset pagination; viewsets override pagination_class to order on their own indexed column
+    'DEFAULT_PAGINATION_CLASS': 'apps.core.pagination.IdCursorPagination',
+    'PAGE_SIZE': 50,
 }
 
+# Google Tasks / Calendar sync worker (manage.py run_google_sync). The URLs can
+# point at the fake server from manage.py run_fake_google for local testing.
+GOOGLE_CLIENT_ID = os.environ.get('GOOGLE_CLIENT_ID', '')
+GOOGLE_CLIENT_SECRET = os.environ.get('GOOGLE_CLIENT_SECRET', '')
+GOOGLE_API_BASE_URL = os.environ.get('GOOGLE_API_BASE_URL', 'https://www.googleapis.com')
+GOOGLE_OAUTH_TOKEN_URL = os.environ.get('GOOGLE_OAUTH_TOKEN_URL', 'https://oauth2.googleapis.com/token')
+GOOGLE_SYNC_INTERVAL_SECONDS = int(os.environ.get('GOOGLE_SYNC_INTERVAL_SECONDS', 120))
+# Concurrent POST /api/google/sync/?wait=true calls one ASGI worker can wait on
+GOOGLE_SYNC_REQUEST_THREADS = int(os.environ.get('GOOGLE_SYNC_REQUEST_THREADS', 64))
+
+# AI gateway (apps.ai): the Gemini key stays on the server. The base URL can
+# point at the fake server from manage.py run_fake_ai for local testing.
+GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY', '')
+GEMINI_API_BASE_URL = os.environ.get('GEMINI_API_BASE_URL', 'https://generativelanguage.googleapis.com')
+AI_REQUEST_TIMEOUT = int(os.environ.get('AI_REQUEST_TIMEOUT', 120))
+AI_RESEARCH_CACHE_TTL_HOURS = int(os.environ.get('AI_RESEARCH_CACHE_TTL_HOURS', 24 * 7))
+AI_RESEARCH_CACHE_MAX_ENTRIES = int(os.environ.get('AI_RESEARCH_CACHE_MAX_ENTRIES', 5000))
+
+# Request metrics scraped at /metrics (apps.metrics). Each worker flushes its
+# counters to METRICS_DIR; the endpoint requires "Bearer <METRICS_TOKEN>" when set.
+METRICS_DIR = os.environ.get('METRICS_DIR', str(Path(tempfile.gettempdir()) / 'potencialize-metrics'))
+METRICS_FLUSH_SECONDS = int(os.environ.get('METRICS_FLUSH_SECONDS', 5))
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
 # JWT Settings
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=1),
     'ROTATE_REFRESH_TOKENS': False,
     'BLACKLIST_AFTER_ROTATION': False,
+    'TOKEN_OBTAIN_SERIALIZER': 'apps.core.authentication.TokenObtainPairSerializer',
+    'TOKEN_REFRESH_SERIALIZER': 'apps.core.authentication.TokenRefreshSerializer',
 }
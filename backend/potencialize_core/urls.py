@@ -4,9 +4,11 @@ from rest_framework_simplejwt.views import (
     TokenObtainPairView,
     TokenRefreshView,
 )
+from apps.metrics.views import metrics
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('metrics', metrics, name='metrics'),
     
     # Auth (JWT)
     path('api/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
@@ -22,4 +24,7 @@ urlpatterns = [
     path('api/financial/', include('apps.financial.urls')),
     path('api/products/', include('apps.products.urls')),
     path('api/onboarding/', include('apps.onboarding.urls')),
+    path('api/agenda/', include('apps.agenda.urls')),
+    path('api/google/', include('apps.google_sync.urls')),
+    path('api/ai/', include('apps.ai.urls')),
 ]
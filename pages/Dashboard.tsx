@@ -1,5 +1,5 @@
 
-import React from 'react';
+import React, { useState, useEffect } from 'react';
 import { useOutletContext } from 'react-router-dom';
 import { 
   BarChart, 
@@ -31,15 +31,11 @@ import {
 import { 
   MOCK_LEDGER, 
   MOCK_PROJECTS, 
-  MOCK_DEALS, 
-  MOCK_ACTIVITIES, 
-  MOCK_ONBOARDING, 
-  MOCK_CLIENT_PROFILES, 
   MOCK_TICKETS, 
-  MOCK_TASKS, 
-  MOCK_PROJECT_MEETINGS 
+  MOCK_TASKS 
 } from '../constants';
-import { User, UserRole } from '../types';
+import { User, UserRole, DashboardKpis } from '../types';
+import { DashboardService } from '../services/dashboardService';
 
 const Dashboard: React.FC = () => {
   const { user } = useOutletContext<{ user: User }>();
@@ -48,16 +44,24 @@ const Dashboard: React.FC = () => {
 
   // --- DATA CALCULATIONS ---
 
+  // Company KPIs are aggregated (and cached) server-side
+  const [kpis, setKpis] = useState<DashboardKpis | null>(null);
+
+  useEffect(() => {
+    DashboardService.getKpis()
+      .then(setKpis)
+      .catch(error => console.error("Failed to load dashboard KPIs", error));
+  }, []);
+
   // 1. Comercial Logic
-  const salesDeals = MOCK_DEALS.filter(d => d.stage === 'Ganho');
-  const totalSalesValue = salesDeals.reduce((acc, curr) => acc + curr.value, 0);
-  const meetingsCount = MOCK_ACTIVITIES.filter(a => a.type === 'Reunião externa' || a.type === 'Visita').length;
-  const activitiesCount = MOCK_ACTIVITIES.length;
+  const totalSalesValue = Number(kpis?.sales.won_value ?? 0);
+  const meetingsCount = kpis?.activities.meetings ?? 0;
+  const activitiesCount = kpis?.activities.total ?? 0;
 
   // 2. Onboarding Logic
-  const onboardingsCompleted = MOCK_ONBOARDING.filter(o => o.stage === 'Concluído').length;
-  const onboardingsPending = MOCK_ONBOARDING.filter(o => o.stage !== 'Concluído').length;
-  const activeClients = MOCK_CLIENT_PROFILES.filter(c => c.status === 'Ativo').length;
+  const onboardingsCompleted = kpis?.onboarding.completed ?? 0;
+  const onboardingsPending = kpis?.onboarding.pending ?? 0;
+  const activeClients = kpis?.clients.active ?? 0;
   
   // SLA & Interaction Logic
   // Calculate average days since last update across all projects (Proxy for interaction)
@@ -76,20 +80,14 @@ const Dashboard: React.FC = () => {
   const avgResponseTimeHours = 4.5; // Mocked calculated value based on MOCK_TICKETS data analysis
 
   // 3. Projects Logic
-  const totalProjects = MOCK_PROJECTS.length;
-  const totalProjectMeetings = MOCK_PROJECT_MEETINGS.length;
-  const totalProjectActivities = MOCK_TASKS.filter(t => t.status === 'completed').length;
+  const totalProjects = kpis?.projects.total ?? 0;
+  const totalProjectMeetings = kpis?.projects.meetings ?? 0;
+  const totalProjectActivities = kpis?.projects.tasks_completed ?? 0;
 
   // Projects per Consultant (For Chart)
-  const projectsPerConsultantMap = MOCK_PROJECTS.reduce((acc, curr) => {
-     const specialist = curr.specialist || 'Não atribuído';
-     acc[specialist] = (acc[specialist] || 0) + 1;
-     return acc;
-  }, {} as Record<string, number>);
-
-  const projectsPerConsultantData = Object.keys(projectsPerConsultantMap).map(name => ({
-     name: name.split(' ')[0], // First name only for chart
-     value: projectsPerConsultantMap[name]
+  const projectsPerConsultantData = (kpis?.projects.per_consultant ?? []).map(row => ({
+     name: row.name.split(' ')[0], // First name only for chart
+     value: row.value
   }));
 
   // --- CONSULTANT SPECIFIC METRICS ---
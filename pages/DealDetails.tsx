@@ -171,7 +171,11 @@ const DealDetails: React.FC = () => {
      setActiveModal('research');
      if (!researchData) {
         setIsResearching(true);
-        const data = await researchCompany(deal.company);
+        // Shows the text as it streams in; repeated lookups come from the backend cache
+        const data = await researchCompany(deal.company, (text) => {
+           setIsResearching(false);
+           setResearchData({ text, sources: [] });
+        });
         if (data) {
            setResearchData(data);
         }
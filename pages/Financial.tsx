@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { useOutletContext } from 'react-router-dom';
-import { User, UserRole, LedgerEntry, ClientProfile } from '../types';
+import { User, UserRole, LedgerEntry, LedgerSummary, ClientProfile } from '../types';
 import { FinancialService } from '../services/financialService';
 import { ClientService } from '../services/clientService';
 import { DollarSign, Plus, Trash2, ArrowUpCircle, ArrowDownCircle, TrendingUp, Calendar, Search } from 'lucide-react';
@@ -10,6 +10,7 @@ const Financial: React.FC = () => {
     const isManager = user.role === UserRole.MANAGER_CS_OPS || user.role === UserRole.SUPER_ADMIN;
 
     const [ledger, setLedger] = useState<LedgerEntry[]>([]);
+    const [summary, setSummary] = useState<LedgerSummary | null>(null);
     const [clients, setClients] = useState<ClientProfile[]>([]);
     const [loading, setLoading] = useState(true);
     const [isAddModalOpen, setIsAddModalOpen] = useState(false);
@@ -30,11 +31,13 @@ const Financial: React.FC = () => {
 
     const loadData = async () => {
         try {
-            const [ledgerData, clientsData] = await Promise.all([
+            const [ledgerData, summaryData, clientsData] = await Promise.all([
                 FinancialService.getLedger(),
+                FinancialService.getSummary(),
                 ClientService.getAll()
             ]);
             setLedger(ledgerData);
+            setSummary(summaryData);
             setClients(clientsData);
         } catch (error) {
             console.error("Failed to load financial data", error);
@@ -53,6 +56,7 @@ const Financial: React.FC = () => {
             };
             const created = await FinancialService.addEntry(entryData);
             setLedger([created, ...ledger]);
+            FinancialService.getSummary().then(setSummary);
             setIsAddModalOpen(false);
             setNewEntry({
                 type: 'credit',
@@ -74,15 +78,17 @@ const Financial: React.FC = () => {
         try {
             await FinancialService.deleteEntry(id);
             setLedger(ledger.filter(l => l.id !== id));
+            FinancialService.getSummary().then(setSummary);
         } catch (error) {
             console.error("Failed to delete entry", error);
             alert("Erro ao excluir lançamento.");
         }
     };
 
-    // Calculations
-    const totalCredit = ledger.filter(l => l.type === 'credit').reduce((acc, curr) => acc + curr.amount, 0);
-    const totalDebit = ledger.filter(l => l.type === 'debit').reduce((acc, curr) => acc + curr.amount, 0);
+    // Totals come pre-aggregated from the server-side monthly rollups
+    const totalFor = (type: 'credit' | 'debit') => Number(summary?.by_type.find(t => t.ledger_type === type)?.total ?? 0);
+    const totalCredit = totalFor('credit');
+    const totalDebit = totalFor('debit');
     const balance = totalCredit - totalDebit;
 
     if (!isManager) {
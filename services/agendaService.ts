@@ -0,0 +1,15 @@
+import api from './api';
+import { AgendaEvent } from '../types';
+
+export const AgendaService = {
+    // start/end as YYYY-MM-DD, both inclusive
+    getEvents: async (start: string, end: string, user?: number): Promise<AgendaEvent[]> => {
+        const response = await api.get('/agenda/', { params: { start, end, user } });
+        return response.data;
+    },
+
+    getFeedUrl: async (): Promise<string> => {
+        const response = await api.get('/agenda/feed-url/');
+        return response.data.url;
+    }
+};
@@ -1,25 +1,88 @@
+import api from './api';
 
-import { GoogleGenAI } from "@google/genai";
+// As chamadas de IA passam pelo backend (/api/ai/), que guarda a chave do Gemini,
+// reaproveita pesquisas de empresa já feitas e devolve o texto em streaming (SSE).
 
-// Tenta obter a chave da variável de ambiente, se disponível
-const apiKey = (typeof process !== 'undefined' && process.env && process.env.API_KEY) ? process.env.API_KEY : '';
+export interface AIStreamResult {
+  text: string;
+  sources: any[];
+  cached: boolean;
+}
+
+type OnChunk = (textSoFar: string) => void;
+
+const postStream = (path: string, body: unknown) => fetch(`${api.defaults.baseURL}${path}`, {
+  method: 'POST',
+  headers: {
+    'Content-Type': 'application/json',
+    Authorization: `Bearer ${localStorage.getItem('access_token') || ''}`,
+  },
+  body: JSON.stringify(body),
+});
 
-// Inicializa a IA apenas se houver chave (ou deixa falhar graciosamente nos métodos)
-const ai = apiKey ? new GoogleGenAI({ apiKey }) : null;
+// Renova o token de acesso uma vez, como o interceptor do axios faz nas demais chamadas
+const refreshAccessToken = async (): Promise<boolean> => {
+  const refresh = localStorage.getItem('refresh_token');
+  if (!refresh) return false;
+  try {
+    const response = await api.post('/token/refresh/', { refresh });
+    localStorage.setItem('access_token', response.data.access);
+    return true;
+  } catch {
+    return false;
+  }
+};
+
+/**
+ * Envia o pedido para o gateway e lê os eventos `chunk`, `done` e `error`.
+ * `onChunk` recebe o texto acumulado a cada trecho, para exibir a resposta enquanto é escrita.
+ */
+export const streamAI = async (path: string, body: unknown, onChunk?: OnChunk): Promise<AIStreamResult> => {
+  let response = await postStream(path, body);
+  if (response.status === 401 && await refreshAccessToken()) {
+    response = await postStream(path, body);
+  }
+  if (!response.ok || !response.body) {
+    const data = await response.json().catch(() => ({}));
+    throw new Error(data.detail || `HTTP ${response.status}`);
+  }
+
+  const result: AIStreamResult = { text: '', sources: [], cached: false };
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    let boundary;
+    while ((boundary = buffer.indexOf('\n\n')) >= 0) {
+      const block = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+      const event = /^event: (.*)$/m.exec(block)?.[1];
+      const data = JSON.parse(/^data: (.*)$/m.exec(block)?.[1] || '{}');
+      if (event === 'chunk') {
+        result.text += data.text;
+        onChunk?.(result.text);
+      } else if (event === 'done') {
+        result.sources = data.sources || [];
+        result.cached = data.cached;
+      } else if (event === 'error') {
+        throw new Error(data.detail);
+      }
+    }
+  }
+  return result;
+};
 
 /**
  * Chat rápido usando Gemini Flash Lite
  * Usado no Assistente Virtual Flutuante
  */
-export const askAssistantFast = async (message: string) => {
-  if (!ai) return "Simulação: O sistema de IA não está configurado com uma API Key real. Por favor, verifique suas configurações.";
-  
+export const askAssistantFast = async (message: string, onChunk?: OnChunk) => {
   try {
-    const response = await ai.models.generateContent({
-      model: 'gemini-2.5-flash-lite',
-      contents: message,
-    });
-    return response.text;
+    const { text } = await streamAI('/ai/assistant/', { message }, onChunk);
+    return text;
   } catch (error) {
     console.error("Erro AI:", error);
     return "Desculpe, tive um problema ao processar sua solicitação rápida.";
@@ -28,33 +91,12 @@ export const askAssistantFast = async (message: string) => {
 
 /**
  * Pesquisa de informações da empresa usando Google Search Grounding
- * Usado na tela de Detalhes do Negócio
+ * Usado na tela de Detalhes do Negócio. O backend guarda a pesquisa por empresa;
+ * `refresh` ignora o resultado guardado e pesquisa de novo.
  */
-export const researchCompany = async (companyName: string) => {
-  if (!ai) {
-    return {
-      text: `(Simulação) A **${companyName}** é uma empresa líder no setor, com crescimento recente de 15% ao ano. Notícias recentes indicam expansão para novos mercados no Nordeste. Riscos: Alta competitividade local.`,
-      sources: []
-    };
-  }
-
+export const researchCompany = async (companyName: string, onChunk?: OnChunk, refresh = false) => {
   try {
-    const response = await ai.models.generateContent({
-      model: 'gemini-2.5-flash',
-      contents: `Pesquise notícias recentes e informações de negócios sobre a empresa "${companyName}". 
-      Resuma: 
-      1. Atuação principal
-      2. Notícias recentes (últimos 6 meses)
-      3. Possíveis dores ou oportunidades de negócio para uma consultoria de processos e software.`,
-      config: {
-        tools: [{googleSearch: {}}],
-      },
-    });
-
-    return {
-      text: response.text,
-      sources: response.candidates?.[0]?.groundingMetadata?.groundingChunks || []
-    };
+    return await streamAI('/ai/research/', { company: companyName, refresh }, onChunk);
   } catch (error) {
     console.error("Erro Search:", error);
     return null;
@@ -65,46 +107,15 @@ export const researchCompany = async (companyName: string) => {
  * Geração de Proposta Comercial Complexa
  * Usado na tela de Detalhes do Negócio para criar rascunho
  */
-export const generateProposalContent = async (dealContext: { 
-    client: string, 
-    products: string[], 
-    value: number, 
-    scope: string 
-}) => {
-  if (!ai) {
-    return `PROPOSTA COMERCIAL (Simulada - Sem API Key)
-
-Para: ${dealContext.client}
-Soluções: ${dealContext.products.join(', ')}
-
-Prezados,
-Com base em nossa conversa, apresentamos a solução ideal para...`;
-  }
-
+export const generateProposalContent = async (dealContext: {
+    client: string,
+    products: string[],
+    value: number,
+    scope: string
+}, onChunk?: OnChunk) => {
   try {
-    const prompt = `Você é um consultor comercial sênior da Potencialize Resultados. 
-    Escreva uma proposta comercial persuasiva e profissional para o cliente "${dealContext.client}".
-    
-    Produtos Ofertados: ${dealContext.products.join(', ')}
-    Valor Total: R$ ${dealContext.value}
-    
-    Detalhes do Escopo Principal:
-    "${dealContext.scope}"
-    
-    Estrutura da proposta:
-    1. Introdução (focada em dor e solução)
-    2. O que será entregue (detalhes técnicos mas acessíveis)
-    3. Metodologia de Trabalho (Onboarding e Acompanhamento)
-    4. Investimento
-    5. Fechamento (Chamada para ação)
-    
-    Tom de voz: Profissional, parceiro, focado em resultados e eficiência.`;
-
-    const response = await ai.models.generateContent({
-      model: 'gemini-3-pro-preview', // Modelo mais capaz para raciocínio e escrita longa
-      contents: prompt,
-    });
-    return response.text;
+    const { text } = await streamAI('/ai/proposal/', dealContext, onChunk);
+    return text;
   } catch (error) {
     console.error("Erro Proposta:", error);
     return "Erro ao gerar proposta com IA. Tente novamente.";
@@ -115,16 +126,10 @@ Com base em nossa conversa, apresentamos a solução ideal para...`;
  * Geração de Plano de Ação (OPR)
  * Usado no módulo de Projetos
  */
-export const generateActionPlan = async (projectContext: string) => {
-   if (!ai) return "Simulação: Plano de ação gerado automaticamente com base no escopo e diagnóstico do cliente.";
-
+export const generateActionPlan = async (projectContext: string, onChunk?: OnChunk) => {
    try {
-     const response = await ai.models.generateContent({
-        model: 'gemini-3-pro-preview',
-        contents: `Crie um Plano de Ação Executivo (To-Do List estratégica) para um projeto de consultoria com o seguinte contexto: "${projectContext}".
-        Formato: Lista de 5 a 7 itens principais, com "Ação", "Por que fazer" e "Resultado Esperado".`
-     });
-     return response.text;
+     const { text } = await streamAI('/ai/action-plan/', { context: projectContext }, onChunk);
+     return text;
    } catch(e) {
       return "Erro ao gerar plano de ação.";
    }
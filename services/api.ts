@@ -62,4 +62,42 @@ api.interceptors.response.use(
   }
 );
 
+// Cursor pagination envelope returned by every list endpoint
+export interface CursorPage<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+}
+
+// Walk a list endpoint following the `next` cursor, yielding each page as it arrives
+export async function* streamPages<T>(url: string, params?: Record<string, unknown>): AsyncGenerator<T[]> {
+  let response = await api.get<CursorPage<T>>(url, { params });
+  yield response.data.results;
+  while (response.data.next) {
+    response = await api.get<CursorPage<T>>(response.data.next);
+    yield response.data.results;
+  }
+}
+
+// Convenience for screens that still need the whole collection in memory
+export const fetchAll = async <T>(url: string, params?: Record<string, unknown>): Promise<T[]> => {
+  const items: T[] = [];
+  for await (const page of streamPages<T>(url, params)) {
+    items.push(...page);
+  }
+  return items;
+};
+
+// Download a list export (`<list url>export/csv|xlsx/`) with the current filters
+export const downloadExport = async (url: string, fileFormat: 'csv' | 'xlsx', params?: Record<string, unknown>): Promise<void> => {
+  const response = await api.get(`${url}export/${fileFormat}/`, { params, responseType: 'blob' });
+  const disposition: string = response.headers['content-disposition'] || '';
+  const filename = /filename="([^"]+)"/.exec(disposition)?.[1] || `export.${fileFormat}`;
+  const link = document.createElement('a');
+  link.href = URL.createObjectURL(response.data);
+  link.download = filename;
+  link.click();
+  URL.revokeObjectURL(link.href);
+};
+
 export default api;
@@ -1,10 +1,9 @@
-import api from './api';
+import api, { fetchAll } from './api';
 import { ClientProfile } from '../types';
 
 export const ClientService = {
     getAll: async (): Promise<ClientProfile[]> => {
-        const response = await api.get('/clients/profiles/');
-        return response.data;
+        return fetchAll<ClientProfile>('/clients/profiles/');
     },
 
     getById: async (id: number): Promise<ClientProfile> => {
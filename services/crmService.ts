@@ -1,11 +1,10 @@
-import api from './api';
-import { Lead, Deal, Activity } from '../types';
+import api, { CursorPage, fetchAll } from './api';
+import { Lead, Deal, Activity, PipelineAnalytics } from '../types';
 
 export const CRMService = {
     // Leads
     getLeads: async (): Promise<Lead[]> => {
-        const response = await api.get('/crm/leads/');
-        return response.data;
+        return fetchAll<Lead>('/crm/leads/');
     },
     createLead: async (data: Partial<Lead>): Promise<Lead> => {
         const response = await api.post('/crm/leads/', data);
@@ -14,8 +13,7 @@ export const CRMService = {
 
     // Deals
     getDeals: async (): Promise<Deal[]> => {
-        const response = await api.get('/crm/deals/');
-        return response.data;
+        return fetchAll<Deal>('/crm/deals/');
     },
     createDeal: async (data: Partial<Deal>): Promise<Deal> => {
         const response = await api.post('/crm/deals/', data);
@@ -25,11 +23,20 @@ export const CRMService = {
         const response = await api.patch(`/crm/deals/${id}/`, data);
         return response.data;
     },
+    // Newest activities first; pass the previous page's `next` to load older ones
+    getDealTimeline: async (id: number, next?: string | null): Promise<CursorPage<Activity>> => {
+        const response = await api.get<CursorPage<Activity>>(next || `/crm/deals/${id}/timeline/`);
+        return response.data;
+    },
+    // Funnel, time in stage and weighted pipeline; period defaults to the current quarter
+    getPipelineAnalytics: async (period?: string): Promise<PipelineAnalytics> => {
+        const response = await api.get('/crm/pipeline/analytics/', { params: period ? { period } : undefined });
+        return response.data;
+    },
 
     // Activities
     getActivities: async (): Promise<Activity[]> => {
-        const response = await api.get('/crm/activities/');
-        return response.data;
+        return fetchAll<Activity>('/crm/activities/');
     },
     createActivity: async (data: Partial<Activity>): Promise<Activity> => {
         const response = await api.post('/crm/activities/', data);
@@ -0,0 +1,9 @@
+import api from './api';
+import { DashboardKpis } from '../types';
+
+export const DashboardService = {
+    getKpis: async (): Promise<DashboardKpis> => {
+        const response = await api.get('/core/dashboard/');
+        return response.data;
+    }
+};
@@ -1,12 +1,20 @@
-import api from './api';
-import { LedgerEntry } from '../types';
+import api, { fetchAll, downloadExport } from './api';
+import { LedgerEntry, LedgerSummary } from '../types';
 
 export const FinancialService = {
     getLedger: async (): Promise<LedgerEntry[]> => {
-        const response = await api.get('/financial/ledger/');
+        return fetchAll<LedgerEntry>('/financial/ledger/');
+    },
+
+    getSummary: async (params?: { start?: string; end?: string; consultant?: number }): Promise<LedgerSummary> => {
+        const response = await api.get('/financial/ledger/summary/', { params });
         return response.data;
     },
 
+    exportLedger: async (fileFormat: 'csv' | 'xlsx', params?: Record<string, unknown>): Promise<void> => {
+        await downloadExport('/financial/ledger/', fileFormat, params);
+    },
+
     addEntry: async (data: Partial<LedgerEntry>): Promise<LedgerEntry> => {
         const response = await api.post('/financial/ledger/', data);
         return response.data;
@@ -14,5 +22,14 @@ export const FinancialService = {
 
     deleteEntry: async (id: number): Promise<void> => {
         await api.delete(`/financial/ledger/${id}/`);
+    },
+
+    bulkAddEntries: async (items: Partial<LedgerEntry>[]): Promise<LedgerEntry[]> => {
+        const response = await api.post('/financial/ledger/bulk/', items);
+        return response.data;
+    },
+
+    bulkDeleteEntries: async (ids: number[]): Promise<void> => {
+        await api.delete('/financial/ledger/bulk/', { data: { ids } });
     }
 };
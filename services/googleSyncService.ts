@@ -0,0 +1,27 @@
+import api from './api';
+
+export interface GoogleSyncStatus {
+    connected: boolean;
+    enabled?: boolean;
+    next_sync_at?: string;
+    last_synced_at?: string | null;
+    failure_count?: number;
+    last_error?: string;
+}
+
+export const GoogleSyncService = {
+    getStatus: async (): Promise<GoogleSyncStatus> => {
+        const response = await api.get('/google/sync/');
+        return response.data;
+    },
+
+    // Schedules a sync; the backend worker does the actual Google calls.
+    // With wait, the sync runs in the request and the result comes back with it.
+    requestSync: async (wait = false): Promise<GoogleSyncStatus> => {
+        const response = await api.post('/google/sync/', null, {
+            params: wait ? { wait: true } : undefined,
+            timeout: wait ? 60000 : undefined,
+        });
+        return response.data;
+    }
+};
@@ -1,10 +1,9 @@
-import api from './api';
+import api, { fetchAll } from './api';
 import { OnboardingItem, OnboardingTask, OnboardingNote } from '../types';
 
 export const OnboardingService = {
     getItems: async (): Promise<OnboardingItem[]> => {
-        const response = await api.get('/onboarding/items/');
-        return response.data;
+        return fetchAll<OnboardingItem>('/onboarding/items/');
     },
 
     createItem: async (data: Partial<OnboardingItem>): Promise<OnboardingItem> => {
@@ -19,13 +18,16 @@ export const OnboardingService = {
 
     // Tasks
     getTasks: async (onboardingId: number): Promise<OnboardingTask[]> => {
-        const response = await api.get(`/onboarding/tasks/?onboarding=${onboardingId}`);
+        return fetchAll<OnboardingTask>('/onboarding/tasks/', { onboarding: onboardingId });
+    },
+
+    bulkUpdateTasks: async (items: (Partial<OnboardingTask> & { id: number })[]): Promise<OnboardingTask[]> => {
+        const response = await api.patch('/onboarding/tasks/bulk/', items);
         return response.data;
     },
 
     // Notes
     getNotes: async (onboardingId: number): Promise<OnboardingNote[]> => {
-        const response = await api.get(`/onboarding/notes/?onboarding=${onboardingId}`);
-        return response.data;
+        return fetchAll<OnboardingNote>('/onboarding/notes/', { onboarding: onboardingId });
     }
 };
@@ -1,10 +1,9 @@
-import api from './api';
+import api, { fetchAll } from './api';
 import { Product } from '../types';
 
 export const ProductService = {
     getAll: async (): Promise<Product[]> => {
-        const response = await api.get('/products/products/');
-        return response.data;
+        return fetchAll<Product>('/products/products/');
     },
 
     getById: async (id: number): Promise<Product> => {
@@ -1,10 +1,9 @@
-import api from './api';
+import api, { fetchAll } from './api';
 import { Project, ProjectMeeting, ProjectDocument, ProjectNote } from '../types';
 
 export const ProjectService = {
     getAll: async (): Promise<Project[]> => {
-        const response = await api.get('/projects/projects/');
-        return response.data;
+        return fetchAll<Project>('/projects/projects/');
     },
 
     getById: async (id: number): Promise<Project> => {
@@ -28,17 +27,14 @@ export const ProjectService = {
 
     // Sub-resources
     getMeetings: async (projectId: number): Promise<ProjectMeeting[]> => {
-        const response = await api.get(`/projects/meetings/?project=${projectId}`);
-        return response.data;
+        return fetchAll<ProjectMeeting>('/projects/meetings/', { project: projectId });
     },
 
     getDocuments: async (projectId: number): Promise<ProjectDocument[]> => {
-        const response = await api.get(`/projects/documents/?project=${projectId}`);
-        return response.data;
+        return fetchAll<ProjectDocument>('/projects/documents/', { project: projectId });
     },
 
     getNotes: async (projectId: number): Promise<ProjectNote[]> => {
-        const response = await api.get(`/projects/notes/?project=${projectId}`);
-        return response.data;
+        return fetchAll<ProjectNote>('/projects/notes/', { project: projectId });
     }
 };
@@ -0,0 +1,27 @@
+import api from './api';
+
+export interface RoleSnapshot {
+    id: string;
+    name: string;
+    description: string;
+    permissions: number[];
+    permissions_details: { id: number; key: string; label: string; module: string }[];
+    is_system: boolean;
+}
+
+// Nested users only carry a role id; the role table is fetched once per session
+let snapshot: Promise<RoleSnapshot[]> | null = null;
+
+export const RoleService = {
+    getSnapshot: (): Promise<RoleSnapshot[]> => {
+        if (!snapshot) {
+            snapshot = api.get('/core/roles/').then(response => response.data);
+            snapshot.catch(() => { snapshot = null; });
+        }
+        return snapshot;
+    },
+
+    invalidate: () => {
+        snapshot = null;
+    }
+};
@@ -1,10 +1,15 @@
-import api from './api';
+import api, { fetchAll } from './api';
 import { Ticket, TicketInteraction } from '../types';
 
 export const SupportService = {
     getAll: async (): Promise<Ticket[]> => {
-        const response = await api.get('/support/tickets/');
-        return response.data;
+        // The ticket list and detail modal read the conversation (SLA check, chat history)
+        return fetchAll<Ticket>('/support/tickets/', { expand: 'interactions' });
+    },
+
+    // Open tickets past (breached) or close to (at_risk) their SLA deadline
+    getBySla: async (sla: 'breached' | 'at_risk', params: Record<string, unknown> = {}): Promise<Ticket[]> => {
+        return fetchAll<Ticket>('/support/tickets/', { ...params, sla });
     },
 
     getById: async (id: number): Promise<Ticket> => {
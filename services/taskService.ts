@@ -1,10 +1,9 @@
-import api from './api';
+import api, { fetchAll } from './api';
 import { Task, SubTask } from '../types';
 
 export const TaskService = {
     getAll: async (): Promise<Task[]> => {
-        const response = await api.get('/tasks/all/');
-        return response.data;
+        return fetchAll<Task>('/tasks/all/', { expand: 'subtasks' });
     },
 
     getById: async (id: number): Promise<Task> => {
@@ -39,5 +38,25 @@ export const TaskService = {
 
     deleteSubTask: async (id: number): Promise<void> => {
         await api.delete(`/tasks/subtasks/${id}/`);
+    },
+
+    // Bulk (one request, one transaction)
+    bulkCreate: async (items: Partial<Task>[]): Promise<Task[]> => {
+        const response = await api.post('/tasks/all/bulk/', items);
+        return response.data;
+    },
+
+    bulkUpdate: async (items: (Partial<Task> & { id: number })[]): Promise<Task[]> => {
+        const response = await api.patch('/tasks/all/bulk/', items);
+        return response.data;
+    },
+
+    bulkUpdateSubTasks: async (items: (Partial<SubTask> & { id: number })[]): Promise<SubTask[]> => {
+        const response = await api.patch('/tasks/subtasks/bulk/', items);
+        return response.data;
+    },
+
+    bulkDeleteSubTasks: async (ids: number[]): Promise<void> => {
+        await api.delete('/tasks/subtasks/bulk/', { data: { ids } });
     }
 };
@@ -1,10 +1,9 @@
-import api from './api';
+import api, { fetchAll } from './api';
 import { User } from '../types';
 
 export const UserService = {
     getAll: async (): Promise<User[]> => {
-        const response = await api.get('/core/users/');
-        return response.data;
+        return fetchAll<User>('/core/users/');
     },
     getById: async (id: number): Promise<User> => {
         const response = await api.get(`/core/users/${id}/`);
@@ -171,6 +171,7 @@ export interface Project {
   title: string;
   description?: string;
   type: 'Diagnóstico' | 'Assessoria' | 'Recorrência' | 'Implementação' | 'Club';
+  product?: number; // Produto cujo fluxo gera tarefas e reuniões na criação
   clientName: string;
 
   // Equipe
@@ -187,6 +188,9 @@ export interface Project {
   slaStatus: 'ok' | 'warning' | 'delay'; // New: Dashboard SLA
   progress: number;
   lastUpdate: string;
+  tasksTotal?: number; // Contadores mantidos pelo backend
+  tasksDone?: number;
+  tasksOverdue?: number;
 
   // Datas
   startDate?: string;
@@ -252,6 +256,9 @@ export interface Deal {
   owner: string;
   active?: boolean;
   priority?: 'Low' | 'Medium' | 'High';
+  // The activities themselves come page by page from CRMService.getDealTimeline
+  activity_count?: number;
+  next_activity?: { id: number; title: string; activity_type: ActivityType; date: string } | null;
 }
 
 export interface LedgerEntry {
@@ -264,6 +271,60 @@ export interface LedgerEntry {
   clientName?: string; // New: For Client Filtering
 }
 
+export interface LedgerSummaryRow {
+  credit: number;
+  debit: number;
+  balance: number;
+}
+
+export interface LedgerSummary {
+  by_month: (LedgerSummaryRow & { month: string })[];
+  by_consultant: (LedgerSummaryRow & { consultant: number | null; consultant_name: string | null })[];
+  by_type: { ledger_type: 'credit' | 'debit'; total: number; count: number }[];
+}
+
+export interface DashboardKpis {
+  sales: { won_value: number; won_count: number };
+  activities: { total: number; meetings: number };
+  onboarding: { completed: number; pending: number };
+  clients: { active: number };
+  projects: {
+    total: number;
+    meetings: number;
+    tasks_completed: number;
+    per_consultant: { consultant: number | null; name: string; value: number }[];
+  };
+}
+
+// GET /crm/pipeline/analytics/?period=YYYY | YYYY-Qn | YYYY-MM
+export interface PipelineAnalytics {
+  period: { key: string; start: string; end: string };
+  funnel: {
+    entered: number;
+    lost: number;
+    stages: { stage: Deal['stage']; reached: number; conversion: number | null }[];
+  };
+  stages: { stage: Deal['stage']; exits: number; median_days: number | null; avg_days: number | null }[];
+  velocity: {
+    won: number;
+    lost: number;
+    win_rate: number | null;
+    won_value: number;
+    avg_won_value: number | null;
+    cycle_days: number | null;
+    value_per_day: number | null;
+  };
+  owners: {
+    owner: number | null;
+    name: string;
+    open_deals: number;
+    open_value: number;
+    weighted_value: number;
+    share: number | null;
+    rank: number;
+  }[];
+}
+
 export interface WorkflowStep {
   id: number;
   title: string;
@@ -301,3 +362,17 @@ export interface Activity {
   status: 'pending' | 'done';
   isGoogleEvent?: boolean;
 }
+
+// Item da agenda unificada (/agenda/): atividades, reuniões e prazos
+export interface AgendaEvent {
+  id: string; // `${source}-${object_id}`
+  source: 'activity' | 'meeting' | 'task' | 'onboarding_task';
+  object_id: number;
+  title: string;
+  start: string;
+  end: string | null;
+  all_day: boolean;
+  status: string;
+  user: number | null;
+  project: number | null;
+}